@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Bounded RAM Cache — shared LRU cache with memory accounting
+===========================================================
+
+Process-level caches (neutron_wkb_sensitivity._RAM_CACHE / _PROFILE_CACHE,
+full5d_reduction._FULL5D_RAM_CACHE) used to be unbounded dicts, so long
+parameter sweeps grew memory without limit. BoundedCache keeps the dict
+interface they rely on, evicts least-recently-used entries when a byte
+budget is exceeded, and keeps per-kind statistics.
+
+Configuration:
+    Each cache reads its budget in MB from an environment variable
+    (e.g. NEUTRON_RAM_CACHE_MB=64). A value <= 0 disables the bound.
+
+Epistemic Tags:
+    [Def]  Infrastructure only; cached values are unchanged.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    Approximate memory footprint of a cached value in bytes.
+
+    numpy arrays count their buffer; dicts, tuples and lists are summed
+    recursively; anything else falls back to sys.getsizeof.
+    """
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items())
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class BoundedCache:
+    """
+    [Def] Dict-like LRU cache with a byte budget and per-kind statistics.
+
+    - `cache[key] = value` / `put(key, value, kind=...)` insert and evict
+      least-recently-used entries until the budget holds. An entry larger
+      than the whole budget is not stored (counted as an eviction).
+    - `get(key)` counts a hit or miss and refreshes recency; `key in cache`
+      is a plain presence test (no statistics).
+    - `refresh_size(key)` re-measures an entry that was mutated in place.
+    - `stats()` returns entries, bytes, hits, misses and evictions per kind.
+
+    Thread-safe (one re-entrant lock per cache).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        env_var: str = None,
+        default_mb: float = 256.0,
+        max_bytes: Optional[int] = None,
+        kind_of: Callable[[Hashable], str] = None
+    ):
+        self.name = name
+        if max_bytes is None:
+            mb = float(os.environ.get(env_var, default_mb)) if env_var else float(default_mb)
+            max_bytes = int(mb * 1024 * 1024) if mb > 0 else None
+        self.max_bytes = max_bytes
+        self._kind_of = kind_of
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, nbytes, kind)
+        self._bytes = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.RLock()
+
+    # -- internal --------------------------------------------------------------
+
+    def _kind(self, key: Hashable, kind: str = None) -> str:
+        if kind is not None:
+            return kind
+        if self._kind_of is not None:
+            return self._kind_of(key)
+        return 'default'
+
+    def _kind_stats(self, kind: str) -> Dict[str, int]:
+        if kind not in self._stats:
+            self._stats[kind] = {'entries': 0, 'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+        return self._stats[kind]
+
+    def _remove(self, key: Hashable) -> tuple:
+        value, nbytes, kind = self._data.pop(key)
+        self._bytes -= nbytes
+        st = self._kind_stats(kind)
+        st['entries'] -= 1
+        st['bytes'] -= nbytes
+        return value, nbytes, kind
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        while self._bytes > self.max_bytes and self._data:
+            oldest = next(iter(self._data))
+            _, _, kind = self._remove(oldest)
+            self._kind_stats(kind)['evictions'] += 1
+
+    # -- mapping interface -----------------------------------------------------
+
+    def put(self, key: Hashable, value: Any, kind: str = None):
+        """Insert/replace an entry, then evict LRU entries over budget."""
+        with self._lock:
+            kind = self._kind(key, kind)
+            if key in self._data:
+                self._remove(key)
+            nbytes = estimate_nbytes(value)
+            st = self._kind_stats(kind)
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                st['evictions'] += 1
+                return
+            self._data[key] = (value, nbytes, kind)
+            self._bytes += nbytes
+            st['entries'] += 1
+            st['bytes'] += nbytes
+            self._evict()
+
+    def get(self, key: Hashable, default: Any = None, kind: str = None) -> Any:
+        """Look up an entry, counting a hit/miss and refreshing recency."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                value, _, entry_kind = self._data[key]
+                self._kind_stats(entry_kind)['hits'] += 1
+                return value
+            self._kind_stats(self._kind(key, kind))['misses'] += 1
+            return default
+
+    def refresh_size(self, key: Hashable):
+        """Re-measure an entry mutated in place (and evict if now over budget)."""
+        with self._lock:
+            if key in self._data:
+                value, _, kind = self._data[key]
+                self.put(key, value, kind=kind)
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.put(key, value)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            if key not in self._data:
+                self._kind_stats(self._kind(key))['misses'] += 1
+                raise KeyError(key)
+            return self.get(key)
+
+    def __delitem__(self, key: Hashable):
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        """Drop all entries (statistics are kept; see reset_stats)."""
+        with self._lock:
+            for key in list(self._data):
+                self._remove(key)
+
+    # -- accounting ------------------------------------------------------------
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def reset_stats(self):
+        """Reset hit/miss/eviction counters (entry/byte counts are kept)."""
+        with self._lock:
+            for st in self._stats.values():
+                st['hits'] = st['misses'] = st['evictions'] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-kind and total statistics."""
+        with self._lock:
+            kinds = {k: dict(v) for k, v in sorted(self._stats.items())}
+            total = {f: sum(v[f] for v in kinds.values())
+                     for f in ('entries', 'bytes', 'hits', 'misses', 'evictions')}
+            return {
+                'name': self.name,
+                'max_bytes': self.max_bytes,
+                'total': total,
+                'kinds': kinds,
+            }
+
+    def report(self) -> str:
+        """One line per kind: entries, MB, hits, misses, evictions."""
+        st = self.stats()
+        budget = 'unbounded' if st['max_bytes'] is None else f"{st['max_bytes'] / 2**20:.0f} MB"
+        lines = [f"{self.name}: {st['total']['entries']} entries, "
+                 f"{st['total']['bytes'] / 2**20:.2f} MB (budget {budget})"]
+        for kind, v in st['kinds'].items():
+            lines.append(f"  {kind:<16} entries={v['entries']:<6} MB={v['bytes'] / 2**20:<8.2f} "
+                         f"hits={v['hits']:<7} misses={v['misses']:<7} evictions={v['evictions']}")
+        return "\n".join(lines)
@@ -27,6 +27,8 @@ import os
 import json
 import time
 
+from bounded_cache import BoundedCache
+
 
 # =============================================================================
 # TRI-STATE GATE RESULTS
@@ -199,8 +201,9 @@ class BraneEmbeddingParams:
 # captures the energetic cost of brane deformation.
 # =============================================================================
 
-# RAM cache for Full-5D computations
-_FULL5D_RAM_CACHE: Dict[str, Any] = {}
+# RAM cache for Full-5D computations (LRU-bounded; budget via FULL5D_RAM_CACHE_MB).
+# Entries are stored with kind 'V', 'M' or 'Israel' for per-kind statistics.
+_FULL5D_RAM_CACHE = BoundedCache('full5d_ram', env_var='FULL5D_RAM_CACHE_MB', default_mb=128)
 
 
 def _cache_key_full5d(kind: str, q: float, params_hash: str) -> str:
@@ -444,8 +447,9 @@ def compute_V_from_full5d(
     if use_cache:
         p_hash = _params_hash(bulk_params, embed_params)
         cache_key = _cache_key_full5d('V', q, p_hash + f'_toy{use_toy_bulk}')
-        if cache_key in _FULL5D_RAM_CACHE:
-            return _FULL5D_RAM_CACHE[cache_key]
+        cached = _FULL5D_RAM_CACHE.get(cache_key, kind='V')
+        if cached is not None:
+            return cached
 
     r_max_physical = embed_params.r_max * embed_params.ell0
 
@@ -512,7 +516,7 @@ def compute_V_from_full5d(
 
     # Cache result
     if use_cache:
-        _FULL5D_RAM_CACHE[cache_key] = (V, info)
+        _FULL5D_RAM_CACHE.put(cache_key, (V, info), kind='V')
 
     return V, info
 
@@ -562,8 +566,9 @@ def compute_M_from_full5d(
     if use_cache:
         p_hash = _params_hash(bulk_params, embed_params)
         cache_key = _cache_key_full5d('M', q, p_hash + f'_warp{warp_power}')
-        if cache_key in _FULL5D_RAM_CACHE:
-            return _FULL5D_RAM_CACHE[cache_key]
+        cached = _FULL5D_RAM_CACHE.get(cache_key, kind='M')
+        if cached is not None:
+            return cached
 
     L = bulk_params.ell
     r_max_physical = embed_params.r_max * embed_params.ell0
@@ -612,7 +617,7 @@ def compute_M_from_full5d(
 
     # Cache result
     if use_cache:
-        _FULL5D_RAM_CACHE[cache_key] = (M, info)
+        _FULL5D_RAM_CACHE.put(cache_key, (M, info), kind='M')
 
     return M, info
 
@@ -704,8 +709,9 @@ def compute_israel_residual_toy(
     if use_cache:
         p_hash = _params_hash(bulk_params, embed_params)
         cache_key = _cache_key_full5d('Israel', q, p_hash + f'_sig{sigma}')
-        if cache_key in _FULL5D_RAM_CACHE:
-            return _FULL5D_RAM_CACHE[cache_key]
+        cached = _FULL5D_RAM_CACHE.get(cache_key, kind='Israel')
+        if cached is not None:
+            return cached
 
     L = bulk_params.ell
     r_max_physical = embed_params.r_max * embed_params.ell0
@@ -777,7 +783,7 @@ def compute_israel_residual_toy(
 
     # Cache result
     if use_cache:
-        _FULL5D_RAM_CACHE[cache_key] = (residual_normalized, info)
+        _FULL5D_RAM_CACHE.put(cache_key, (residual_normalized, info), kind='Israel')
 
     return residual_normalized, info
 
@@ -1286,6 +1292,16 @@ def run_full5d_gates(verbose: bool = True) -> Dict[str, Tuple[GateResult, str]]:
 # CACHE UTILITIES
 # =============================================================================
 
+def get_full5d_cache_stats() -> Dict[str, Any]:
+    """Per-kind RAM cache statistics (entries, bytes, hits, misses, evictions)."""
+    return _FULL5D_RAM_CACHE.stats()
+
+
+def clear_full5d_cache():
+    """Clear the Full-5D RAM cache."""
+    _FULL5D_RAM_CACHE.clear()
+
+
 def cache_key_full5d(kind: str, params: dict, **kwargs) -> str:
     """Generate deterministic cache key for Full-5D computations."""
     data = {'kind': kind, 'params': params, **kwargs}
@@ -172,22 +172,32 @@ def V_integrand(r: float, q: float, params: Dict) -> float:
     return sigma * 4 * np.pi * r**2 * stretch * warp_correction
 
 
-def compute_M_exact(q: float, params: Dict) -> Tuple[float, float]:
+def compute_M_exact(q: float, params: Dict, method: str = None) -> Tuple[float, float]:
     """
     [Dc] Compute M(q) by numerical integration of Eq. (M_final_integral).
 
+    method: 'quad' (adaptive reference) or 'gauss_laguerre' (fixed nodes).
+            None selects the module default RADIAL_QUADRATURE.
+
     Returns: (M_value, integration_error)
     """
+    if (method or RADIAL_QUADRATURE) != 'quad':
+        M, _, M_err, _ = compute_MV_batch(np.array([q]), params, method=method)
+        return float(M[0]), float(M_err[0])
+
     # Integration limits: 0 to ∞, but Gaussian decays, so r_max ~ 20*w is safe
     r_max = 20 * params['w']
     result, error = quad(M_integrand, 0, r_max, args=(q, params), limit=200)
     return result, error
 
 
-def compute_V_exact(q: float, params: Dict) -> Tuple[float, float]:
+def compute_V_exact(q: float, params: Dict, method: str = None) -> Tuple[float, float]:
     """
     [Dc] Compute V(q) by numerical integration of Eq. (V_final_integral).
 
+    method: 'quad' (adaptive reference) or 'gauss_laguerre' (fixed nodes).
+            None selects the module default RADIAL_QUADRATURE.
+
     Returns: (V_value, integration_error)
     """
     profile_type = params.get('profile_type', 'parabolic')
@@ -196,28 +206,511 @@ def compute_V_exact(q: float, params: Dict) -> Tuple[float, float]:
     if abs(Aq) < 1e-15:  # V = 0 when profile amplitude is zero
         return 0.0, 0.0
 
+    if (method or RADIAL_QUADRATURE) != 'quad':
+        _, V, _, V_err = compute_MV_batch(np.array([q]), params, method=method)
+        return float(V[0]), float(V_err[0])
+
     r_max = 20 * params['w']
     result, error = quad(V_integrand, 0, r_max, args=(q, params), limit=200)
     return result, error
 
 
+# =============================================================================
+# BATCHED FIXED-NODE RADIAL QUADRATURE [Dc]
+# =============================================================================
+# Both radial integrals carry the weight r² exp(-r²/w²). With u = r²/w²:
+#
+#   ∫₀^∞ r² e^{-r²/w²} g(r) dr = (w³/2) ∫₀^∞ u^{1/2} e^{-u} g(w√u) du
+#
+# which is exactly the generalized Gauss–Laguerre weight (α = 1/2).
+#
+#   M: g(u) = σ (A₀A′)² 4π [1 - (2A₀A/ℓ) e^{-u/2}]
+#   V: g(u) = σ 4π [√(1+s) - 1] e^{u} [1 - (4A₀A/ℓ) e^{-u/2}]
+#           = σ 4π c²w²u / (√(1+s) + 1) · [1 - (4A₀A/ℓ) e^{-u/2}]
+#      with c = A₀A/w², s = c²w²u e^{-u}  (rationalized; no cancellation)
+#
+# Both g are smooth and slowly varying, so a fixed rule integrates them to
+# machine precision. The truncation at r_max = 20w used by quad costs
+# e^{-400} and is invisible. The whole (q, u) tensor is evaluated in one
+# NumPy pass; the error estimate is |I_n - I_{n/2}|.
+#
+# 'quad' stays the REFERENCE mode and the default, so all frozen hashes
+# (Step 24/28/29) are unaffected unless a fast mode is selected explicitly.
+
+RADIAL_QUADRATURE = 'quad'            # 'quad' (reference) | 'gauss_laguerre'
+RADIAL_QUADRATURE_METHODS = ('quad', 'gauss_laguerre')
+RADIAL_NODES = 32                     # Gauss–Laguerre nodes (error rule uses n/2)
+
+_RADIAL_NODE_CACHE = {}
+_RADIAL_CROSSCHECK_LOG = {}
+
+
+def _laguerre_nodes(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """[Def] Generalized Gauss–Laguerre nodes/weights for u^{1/2} e^{-u} (cached)."""
+    if n not in _RADIAL_NODE_CACHE:
+        from scipy.special import roots_genlaguerre
+        _RADIAL_NODE_CACHE[n] = roots_genlaguerre(n, 0.5)
+    return _RADIAL_NODE_CACHE[n]
+
+
+def _MV_fixed_node(q_values: np.ndarray, params: Dict,
+                   n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """[Dc] M(q), V(q) on a q array with an n-node Gauss–Laguerre rule."""
+    profile_type = params.get('profile_type', 'parabolic')
+    Aq = np.broadcast_to(amplitude_factor(q_values, profile_type), q_values.shape)
+    dAdq = np.broadcast_to(d_amplitude_dq(q_values, profile_type), q_values.shape)
+    return _MV_from_amplitudes(Aq, dAdq, params, n)
+
+
+def _as_param_array(x) -> np.ndarray:
+    """[Def] Parameter as a float array; complex values are kept (complex-step)."""
+    return np.asarray(x, dtype=complex if np.iscomplexobj(x) else float)
+
+
+def _MV_from_amplitudes(Aq: np.ndarray, dAdq: np.ndarray, params: Dict,
+                        n: int, w=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [Dc] M, V for arbitrary amplitude arrays A(q), A′(q) (any shape).
+
+    Only A and A′ enter the radial integrals, so a stack of profile
+    families (P, Nq) is one tensor evaluation of shape (P, Nq, n).
+    w (optional) is an array broadcastable against Aq, for (q, w) lattices;
+    None uses params['w']. params values may themselves be arrays
+    broadcastable against Aq (one parameter set per sample row).
+    """
+    A0 = _as_param_array(params['A0'])
+    ell = _as_param_array(params['ell'])[..., None]
+    sigma = _as_param_array(params['sigma'])[..., None]
+    w = _as_param_array(params['w'] if w is None else w)[..., None]
+
+    u, weights = _laguerre_nodes(n)
+    half_decay = np.exp(-0.5 * u)
+    f0 = (A0 * np.asarray(Aq, dtype=float))[..., None]
+    jac = 0.5 * w**3 * 4 * np.pi * sigma
+
+    g_M = (A0 * np.asarray(dAdq, dtype=float))[..., None]**2 * (1.0 - 2.0 * f0 * half_decay / ell)
+    M = (jac * g_M) @ weights
+
+    c2w2 = (f0 / w**2)**2 * w**2
+    s = c2w2 * u * np.exp(-u)
+    g_V = c2w2 * u / (np.sqrt(1.0 + s) + 1.0) * (1.0 - 4.0 * f0 * half_decay / ell)
+    V = (jac * g_V) @ weights
+
+    return M, V
+
+
+def compute_MV_batch(q_values: np.ndarray, params: Dict, method: str = None,
+                     n_nodes: int = None) -> Tuple[np.ndarray, np.ndarray,
+                                                   np.ndarray, np.ndarray]:
+    """
+    [Dc] Evaluate M(q) and V(q) on a whole q array.
+
+    method: 'quad' loops the adaptive reference integrals (bit-identical to
+            compute_M_exact / compute_V_exact); 'gauss_laguerre' evaluates the
+            (q, u) tensor in one pass. None selects RADIAL_QUADRATURE.
+
+    The first fixed-node call for a given (params, n_nodes) triggers an
+    automatic cross-check against quad (see radial_quadrature_crosscheck).
+
+    Returns: (M, V, M_err, V_err) arrays
+    """
+    method = method or RADIAL_QUADRATURE
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+
+    if method == 'quad':
+        res = pool_map(_quad_MV_point, [(q, params) for q in q_values])
+        M, M_err = (np.array(x) for x in zip(*[r[0] for r in res]))
+        V, V_err = (np.array(x) for x in zip(*[r[1] for r in res]))
+        return M, V, M_err, V_err
+
+    if method != 'gauss_laguerre':
+        raise ValueError(f"Unknown radial quadrature method: {method}")
+
+    n = n_nodes or RADIAL_NODES
+    M, V = _MV_fixed_node(q_values, params, n)
+    M_half, V_half = _MV_fixed_node(q_values, params, n // 2)
+    M_err = np.abs(M - M_half)
+
+    # Closed-form M whenever the profile is in the Gaussian family
+    M_analytic = compute_M_analytic(q_values, params)
+    if M_analytic is not None:
+        M, M_err = M_analytic, np.zeros_like(M_analytic)
+
+    key = (_radial_params_key(params), n)
+    if key not in _RADIAL_CROSSCHECK_LOG:
+        radial_quadrature_crosscheck(params, n_nodes=n, verbose=False)
+
+    return M, V, M_err, np.abs(V - V_half)
+
+
+# =============================================================================
+# PROCESS-POOL EXECUTION [Def]
+# =============================================================================
+# Per-q reference quads are independent, so they can be farmed out to a
+# process pool. Reproducibility rules:
+#   - every item is computed by the same function on the same inputs, so
+#     each value is bit-identical to the serial result;
+#   - results come back in input order (Executor.map), and all reductions
+#     (trapezoid, fits, hashes) run in the parent on the ordered arrays;
+#   - chunking is fixed (POOL_CHUNK_SIZE), independent of the worker count;
+#   - workers receive the module configuration (POOL_CONFIG_NAMES) through
+#     the pool initializer, so they compute under the parent's settings
+#     whatever the start method (fork, spawn, forkserver).
+# Hence data_sha256 does not depend on WORKERS.
+
+WORKERS = 1                           # 1 = serial (default); set via --workers
+POOL_CHUNK_SIZE = 16
+POOL_CONFIG_NAMES = ('PARAMS', 'RADIAL_QUADRATURE', 'RADIAL_NODES', 'NORMALIZATION_DISK_CACHE')
+
+_POOL = None
+_POOL_WORKERS = None
+_POOL_CONFIG = None
+_POOL_ATEXIT_REGISTERED = False
+
+
+def _pool_config_snapshot() -> Dict:
+    """[Def] Current values of the module settings forwarded to pool workers."""
+    import copy
+    g = globals()
+    return {name: copy.deepcopy(g[name]) for name in POOL_CONFIG_NAMES}
+
+
+def _pool_worker_init(config: Dict) -> None:
+    """[Def] Pool initializer: adopt the parent's configuration, never nest pools."""
+    global WORKERS
+    globals().update(config)
+    WORKERS = 1
+
+
+def _shutdown_pool() -> None:
+    """[Def] Shut down the persistent pool (registered with atexit once)."""
+    global _POOL, _POOL_WORKERS, _POOL_CONFIG
+    if _POOL is not None:
+        _POOL.shutdown()
+    _POOL, _POOL_WORKERS, _POOL_CONFIG = None, None, None
+
+
+def _get_pool(workers: int):
+    """[Def] Lazily created persistent process pool (recreated if size or config changes)."""
+    global _POOL, _POOL_WORKERS, _POOL_CONFIG, _POOL_ATEXIT_REGISTERED
+    from concurrent.futures import ProcessPoolExecutor
+    config = _pool_config_snapshot()
+    if _POOL is None or _POOL_WORKERS != workers or _POOL_CONFIG != config:
+        _shutdown_pool()
+        _POOL = ProcessPoolExecutor(max_workers=workers, initializer=_pool_worker_init,
+                                    initargs=(config,))
+        _POOL_WORKERS, _POOL_CONFIG = workers, config
+        if not _POOL_ATEXIT_REGISTERED:
+            import atexit
+            atexit.register(_shutdown_pool)
+            _POOL_ATEXIT_REGISTERED = True
+    return _POOL
+
+
+def pool_map(func, items: list, workers: int = None) -> list:
+    """
+    [Def] Ordered map over items, in a process pool when WORKERS > 1.
+
+    func must be a module-level (picklable) function. Short lists run
+    serially; the pool start-up would cost more than it saves.
+    """
+    workers = WORKERS if workers is None else workers
+    if workers <= 1 or len(items) < 2 * POOL_CHUNK_SIZE:
+        return [func(x) for x in items]
+    return list(_get_pool(workers).map(func, items, chunksize=POOL_CHUNK_SIZE))
+
+
+def _quad_MV_point(args: tuple) -> tuple:
+    """[Dc] Reference (M, M_err), (V, V_err) at one q (pool work item)."""
+    q, params = args
+    return compute_M_exact(q, params, method='quad'), compute_V_exact(q, params, method='quad')
+
+
+# =============================================================================
+# SEMI-ANALYTIC KINETIC INTEGRAL M(q) [Dc]
+# =============================================================================
+# M(q) is a pure Gaussian moment plus the linear warp correction:
+#
+#   M(q) = σ A₀² A′² 4π [ G(1/w²) - (2A₀A/ℓ) G(3/(2w²)) ]
+#
+#   G(a) = ∫₀^R r² e^{-a r²} dr
+#        = √π erf(√a R) / (4 a^{3/2}) - R e^{-a R²} / (2a),   R = 20w
+#
+# The finite R matches the quad reference exactly (no tail approximation).
+# Only A(q), A′(q) depend on the profile, so the closed form holds for any
+# profile_type in ANALYTIC_M_PROFILES; anything else falls back to numerics.
+
+ANALYTIC_M_PROFILES = ('linear', 'parabolic')
+
+
+def _gaussian_moment_r2(a: np.ndarray, R: np.ndarray) -> np.ndarray:
+    """[Dc] G(a) = ∫₀^R r² e^{-a r²} dr (vectorized)."""
+    from scipy.special import erf
+    sqrt_a = np.sqrt(a)
+    return (np.sqrt(np.pi) * erf(sqrt_a * R) / (4.0 * a * sqrt_a)
+            - R * np.exp(-a * R**2) / (2.0 * a))
+
+
+def compute_M_analytic(q, params: Dict, w=None):
+    """
+    [Dc] Closed-form M(q) for the Gaussian profile family.
+
+    Vectorized: q and w broadcast against each other, so a (q, w) lattice
+    is a single call with q[:, None], w[None, :]. w=None uses params['w'].
+
+    Returns: M array (shape of broadcast(q, w)), or None if the profile_type
+             has no closed form (caller falls back to numerics).
+    """
+    profile_type = params.get('profile_type', 'parabolic')
+    if profile_type not in ANALYTIC_M_PROFILES:
+        return None
+
+    A0, ell, sigma = params['A0'], params['ell'], params['sigma']
+    q = np.asarray(q, dtype=float)
+    w = np.asarray(params['w'] if w is None else w, dtype=float)
+
+    Aq = amplitude_factor(q, profile_type)
+    dAdq = d_amplitude_dq(q, profile_type) * np.ones_like(q)
+    R = 20.0 * w
+
+    G1 = _gaussian_moment_r2(1.0 / w**2, R)
+    G3 = _gaussian_moment_r2(1.5 / w**2, R)
+
+    return sigma * (A0 * dAdq)**2 * 4 * np.pi * (G1 - (2.0 * A0 * Aq / ell) * G3)
+
+
+def compute_M_fast(q, params: Dict, w=None):
+    """
+    [Dc] M(q) via the closed form when available, else the fixed-node engine.
+
+    Vectorized over q (and over w on the analytic path).
+    """
+    M = compute_M_analytic(q, params, w=w)
+    if M is not None:
+        return M
+
+    qq, ww = np.broadcast_arrays(np.asarray(q, dtype=float),
+                                 np.asarray(params['w'] if w is None else w, dtype=float))
+    M = np.empty(qq.shape)
+    for w_val in np.unique(ww):
+        mask = (ww == w_val)
+        params_w = {**params, 'w': float(w_val)}
+        M[mask] = compute_MV_batch(qq[mask], params_w, method='gauss_laguerre')[0]
+    return M
+
+
+def _radial_params_key(params: Dict) -> tuple:
+    """[Def] Hashable key for the parameters that enter the radial integrals."""
+    return tuple((k, params.get(k)) for k in ('A0', 'w', 'ell', 'sigma', 'profile_type'))
+
+
+def radial_quadrature_crosscheck(params: Dict, n_nodes: int = None, n_probe: int = 11,
+                                 tol: float = 1e-9, verbose: bool = True) -> Dict:
+    """
+    [DIAG] Cross-check the fixed-node engine against adaptive quad.
+
+    Probes n_probe interior q points, reports max relative error in M and V
+    (normalized to max|M|, max|V| so the zeros of A′ and A do not blow up the
+    ratio) and logs the result for radial_quadrature_report().
+
+    Returns dict with 'max_rel_err_M', 'max_rel_err_V', 'passed', ...
+    """
+    n = n_nodes or RADIAL_NODES
+    q_probe = np.linspace(0.02, 0.98, n_probe)
+
+    M_ref, V_ref, _, _ = compute_MV_batch(q_probe, params, method='quad')
+    M_fast, V_fast = _MV_fixed_node(q_probe, params, n)
+
+    M_scale = max(np.max(np.abs(M_ref)), 1e-300)
+    err_M = float(np.max(np.abs(M_fast - M_ref)) / M_scale)
+    err_V = float(np.max(np.abs(V_fast - V_ref)) / max(np.max(np.abs(V_ref)), 1e-300))
+
+    # Closed-form M (when the profile supports it) is checked against the same reference
+    M_analytic = compute_M_analytic(q_probe, params)
+    err_M_analytic = (None if M_analytic is None
+                      else float(np.max(np.abs(M_analytic - M_ref)) / M_scale))
+
+    result = {
+        'method': 'gauss_laguerre',
+        'n_nodes': n,
+        'n_probe': n_probe,
+        'params': dict(_radial_params_key(params)),
+        'max_rel_err_M': err_M,
+        'max_rel_err_V': err_V,
+        'max_rel_err_M_analytic': err_M_analytic,
+        'tol': tol,
+        'passed': bool(err_M < tol and err_V < tol
+                       and (err_M_analytic is None or err_M_analytic < tol)),
+    }
+    _RADIAL_CROSSCHECK_LOG[(_radial_params_key(params), n)] = result
+
+    if verbose:
+        print(f"  Radial cross-check (n={n}, w={params['w']}): "
+              f"max|δM|/M = {err_M:.2e}, max|δV|/V = {err_V:.2e}, "
+              f"analytic M: {'N/A' if err_M_analytic is None else f'{err_M_analytic:.2e}'} "
+              f"[{'PASS' if result['passed'] else 'FAIL'}]")
+
+    return result
+
+
+def radial_quadrature_report(verbose: bool = True) -> Dict:
+    """
+    [DIAG] Summarize every fixed-node vs quad cross-check run in this process.
+
+    Returns dict with 'n_checks', 'all_pass', 'worst_rel_err', 'checks'.
+    """
+    checks = list(_RADIAL_CROSSCHECK_LOG.values())
+    worst = max([max(c['max_rel_err_M'], c['max_rel_err_V']) for c in checks], default=0.0)
+    report = {
+        'method': RADIAL_QUADRATURE,
+        'n_checks': len(checks),
+        'all_pass': all(c['passed'] for c in checks),
+        'worst_rel_err': worst,
+        'checks': checks,
+    }
+
+    if verbose:
+        print("\n" + "-" * 70)
+        print("RADIAL QUADRATURE CROSS-CHECK REPORT [DIAG]:")
+        print("-" * 70)
+        print(f"  Mode: {RADIAL_QUADRATURE}")
+        if not checks:
+            print("  No fixed-node evaluations in this run (quad reference only).")
+        for c in checks:
+            p = c['params']
+            dM_an = c['max_rel_err_M_analytic']
+            print(f"  {p['profile_type']:<10} n={c['n_nodes']:>3}  w={p['w']:<10.6g} A0={p['A0']:<8.4g} "
+                  f"δM={c['max_rel_err_M']:.2e}  δV={c['max_rel_err_V']:.2e}  "
+                  f"δM_analytic={'N/A' if dM_an is None else f'{dM_an:.2e}'}  "
+                  f"{'PASS' if c['passed'] else 'FAIL'}")
+        if checks:
+            print(f"  Worst relative error: {worst:.2e} "
+                  f"({'ALL PASS' if report['all_pass'] else 'FAILURES PRESENT'})")
+        print("-" * 70)
+
+    return report
+
+
 # =============================================================================
 # NORMALIZATION [Dc]
 # =============================================================================
 
+#
+# compute_normalization is called by nearly every step with identical params.
+# Results are memoized by a content key:
+#   sha256(canonical params JSON + profile_type + radial quadrature settings)
+# Tier 1 is an in-process dict (always on). Tier 2 is an optional on-disk
+# JSON store (NORMALIZATION_DISK_CACHE = directory, or None to disable).
+# Floats round-trip exactly through JSON, so cached values are bit-identical.
+# Entries are written to a temp file and renamed into place, since parallel
+# graph workers may compute the same key; an unreadable entry is a miss.
+
+NORMALIZATION_DISK_CACHE = None       # e.g. Path(__file__).parent / 'generated' / 'norm_cache'
+
+_NORMALIZATION_CACHE = {}
+_NORMALIZATION_CACHE_STATS = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+
+
+def normalization_cache_key(params: Dict) -> str:
+    """
+    [Def] Content key for compute_normalization.
+
+    Covers every params entry (canonical JSON, sorted keys, repr floats), the
+    profile type and the radial quadrature tolerance settings in effect.
+    """
+    import json
+    import hashlib
+    payload = {
+        'params': {k: params[k] for k in sorted(params)},
+        'profile_type': params.get('profile_type', 'parabolic'),
+        'radial_quadrature': RADIAL_QUADRATURE,
+        'tolerance': ({'quad_limit': 200, 'epsabs': 1.49e-8, 'epsrel': 1.49e-8}
+                      if RADIAL_QUADRATURE == 'quad' else {'n_nodes': RADIAL_NODES}),
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=repr)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def normalization_cache_stats() -> Dict:
+    """[DIAG] Hit/miss counters of the normalization cache (copy)."""
+    stats = dict(_NORMALIZATION_CACHE_STATS)
+    stats['entries'] = len(_NORMALIZATION_CACHE)
+    return stats
+
+
+def _seed_normalization_cache(params: Dict, norm: Dict) -> None:
+    """[Def] Store a normalization computed elsewhere (step graph node) under its key."""
+    key = normalization_cache_key(params)
+    if key not in _NORMALIZATION_CACHE:
+        _NORMALIZATION_CACHE[key] = {k: norm[k] for k in ('M0', 'VB', 'qmax_M', 'qmax_V')}
+
+
+def clear_normalization_cache(reset_stats: bool = True) -> None:
+    """[Def] Drop the in-process tier (the disk tier is left untouched)."""
+    _NORMALIZATION_CACHE.clear()
+    if reset_stats:
+        for k in _NORMALIZATION_CACHE_STATS:
+            _NORMALIZATION_CACHE_STATS[k] = 0
+
+
 def compute_normalization(params: Dict) -> Dict:
     """
-    [Dc] Compute normalization constants M₀ and V_B.
+    [Dc] Compute normalization constants M₀ and V_B (memoized).
 
     M₀ = max_q M(q) — maximum kinetic mass (for parabolic, at q=0.5)
     V_B = max_q V(q) — barrier height (expected near q=0.5)
 
     Returns dict with 'M0', 'VB', 'qmax_M', 'qmax_V'
     """
+    import os
+    import json
+    import tempfile
+    from pathlib import Path
+
+    key = normalization_cache_key(params)
+    if key in _NORMALIZATION_CACHE:
+        _NORMALIZATION_CACHE_STATS['hits'] += 1
+        return dict(_NORMALIZATION_CACHE[key])
+
+    disk_path = None
+    if NORMALIZATION_DISK_CACHE is not None:
+        disk_path = Path(NORMALIZATION_DISK_CACHE) / f'norm_{key}.json'
+        try:
+            with open(disk_path, 'r') as f:
+                stored = json.load(f)
+            norm = {k: np.float64(stored[k]) for k in ('M0', 'VB', 'qmax_M', 'qmax_V')}
+        except (OSError, ValueError, KeyError, TypeError):
+            norm = None  # Missing or unreadable entry: recompute
+        if norm is not None:
+            _NORMALIZATION_CACHE[key] = norm
+            _NORMALIZATION_CACHE_STATS['disk_hits'] += 1
+            return dict(norm)
+
+    _NORMALIZATION_CACHE_STATS['misses'] += 1
+    norm = _compute_normalization_uncached(params)
+    _NORMALIZATION_CACHE[key] = norm
+
+    if disk_path is not None:
+        disk_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(disk_path.parent),
+                                        prefix=f".{disk_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({k: float(v) for k, v in norm.items()}, f, indent=2)
+            os.replace(tmp_path, disk_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    return dict(norm)
+
+
+def _compute_normalization_uncached(params: Dict) -> Dict:
+    """[Dc] Scan q for max M(q), max V(q) (no caching)."""
     # Scan q to find maxima
     q_scan = np.linspace(0.01, 0.99, 99)
-    M_values = [compute_M_exact(q, params)[0] for q in q_scan]
-    V_values = [compute_V_exact(q, params)[0] for q in q_scan]
+    M_values, V_values, _, _ = compute_MV_batch(q_scan, params)
 
     idx_M_max = np.argmax(M_values)
     idx_V_max = np.argmax(V_values)
@@ -246,6 +739,55 @@ def compute_Vtilde_exact(q: float, params: Dict, VB: float) -> float:
     return V_val / VB if VB > 0 else 0.0
 
 
+def compute_hat_grid(q_values: np.ndarray, params: Dict, M0: float,
+                     VB: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [Dc] M̃(q), Ṽ(q) on a whole grid (batched; pooled when WORKERS > 1).
+
+    Element-wise identical to compute_Mtilde_exact / compute_Vtilde_exact.
+    """
+    M, V, _, _ = compute_MV_batch(q_values, params)
+    Mhat = M / M0 if M0 > 0 else np.zeros_like(M)
+    Vhat = V / VB if VB > 0 else np.zeros_like(V)
+    return Mhat, Vhat
+
+
+def compute_interior_hat_grid(q_values: np.ndarray, params: Dict, M0: float,
+                              VB: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [Dc] As compute_hat_grid, but with M̃ = Ṽ = 0 at the endpoints
+    q < 1e-10 and q > 1 - 1e-10 (Step 24/26 closure convention).
+    """
+    q_values = np.asarray(q_values, dtype=float)
+    interior = ~((q_values < 1e-10) | (q_values > 1 - 1e-10))
+    Mhat = np.zeros(len(q_values))
+    Vhat = np.zeros(len(q_values))
+    Mhat[interior], Vhat[interior] = compute_hat_grid(q_values[interior], params, M0, VB)
+    return Mhat, Vhat
+
+
+def interior_integrand_grid(params: Dict = None, Nq: int = 801, norm: Dict = None) -> Dict:
+    """
+    [Dc] Exact bounce integrand I(q) = √(2 M̂ V̂) on the Step 24/26 grid.
+
+    norm: precomputed compute_normalization(params) (step graph).
+
+    Returns dict with q_grid, I_exact, Mhat, Vhat, M0, VB and Nq.
+    """
+    if params is None:
+        params = PARAMS
+    q_grid = np.linspace(0, 1, Nq)
+    if norm is None:
+        norm = compute_normalization(params)
+    M0, VB = norm['M0'], norm['VB']
+    Mhat, Vhat = compute_interior_hat_grid(q_grid, params, M0, VB)
+    I_exact = np.zeros(Nq)
+    for i in range(Nq):
+        I_exact[i] = np.sqrt(2 * max(0, Mhat[i]) * max(0, Vhat[i]))
+    return {'q_grid': q_grid, 'I_exact': I_exact, 'Mhat': Mhat, 'Vhat': Vhat,
+            'M0': M0, 'VB': VB, 'Nq': Nq}
+
+
 # =============================================================================
 # INTERPOLATING FORMS FROM STEP 7/8 [P]
 # =============================================================================
@@ -613,10 +1155,51 @@ def compute_file_sha256(filepath: str) -> str:
         return hashlib.sha256(f.read()).hexdigest()
 
 
+def _json_top_level_fragments(obj: dict, deterministic: bool) -> dict:
+    """
+    [Def] Serialize each top-level entry of obj as it appears in the document.
+
+    A nested value serialized with indent=2 and re-indented by one level is
+    byte-identical to the same value inside json.dumps(obj, indent=2), since
+    JSON strings never contain raw newlines. Keys are returned in insertion
+    order.
+    """
+    import json
+
+    if deterministic:
+        dump = lambda v: json.dumps(v, sort_keys=True, indent=2, ensure_ascii=True)
+    else:
+        dump = lambda v: json.dumps(v, indent=2)
+
+    fragments = {}
+    for key, value in obj.items():
+        if not isinstance(key, str):
+            raise TypeError(f"Artifact top-level keys must be str, got {type(key).__name__}")
+        body = dump(value).replace('\n', '\n  ')
+        fragments[key] = f'\n  {json.dumps(key)}: {body}'
+    return fragments
+
+
+def _json_document_chunks(fragments: dict, keys: list):
+    """[Def] Yield the UTF-8 bytes of the top-level JSON object built from fragments."""
+    if not keys:
+        yield b'{}'
+        return
+    yield b'{'
+    for i, key in enumerate(keys):
+        yield ((',' if i else '') + fragments[key]).encode('utf-8')
+    yield b'\n}'
+
+
 def write_json_artifact(data: dict, filepath: str, deterministic: bool = False) -> tuple:
     """
     [Def] Write JSON artifact with two-hash convention.
 
+    Single pass: entries are serialized once in memory, file_sha256 is
+    computed from the fragments, and the final document is streamed
+    (and hashed) to a temp file that atomically replaces filepath, so a
+    crash never leaves a half-written artifact.
+
     Args:
         data: Full data dict (will be modified to add hashes)
         filepath: Output file path
@@ -625,7 +1208,9 @@ def write_json_artifact(data: dict, filepath: str, deterministic: bool = False)
     Returns:
         Tuple of (file_sha256, data_sha256)
     """
-    import json
+    import hashlib
+    import os
+    import tempfile
     from pathlib import Path
 
     # Ensure output directory exists
@@ -657,37 +1242,269 @@ def write_json_artifact(data: dict, filepath: str, deterministic: bool = False)
     if 'sha256' in final_data:
         del final_data['sha256']
 
-    # Write without file_sha256 first (to compute it)
-    temp_data = {k: v for k, v in final_data.items() if k != 'file_sha256'}
+    # Serialize each top-level entry once; both documents (without and with
+    # file_sha256) are concatenations of the same fragments
+    fragments = _json_top_level_fragments(final_data, deterministic)
+    keys = sorted(fragments) if deterministic else list(fragments)
+
+    # file_sha256 is the hash of the document without the file_sha256 entry
+    hasher = hashlib.sha256()
+    for chunk in _json_document_chunks(fragments, [k for k in keys if k != 'file_sha256']):
+        hasher.update(chunk)
+    file_sha256_temp = hasher.hexdigest()
+    fragments['file_sha256'] = _json_top_level_fragments(
+        {'file_sha256': file_sha256_temp}, deterministic)['file_sha256']
+
+    # Stream the final document to a temp file in the target directory,
+    # hashing as we go, then atomically replace the destination
+    target = Path(filepath)
+    hasher = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=str(target.parent), prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in _json_document_chunks(fragments, keys):
+                hasher.update(chunk)
+                f.write(chunk)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    # Final file_sha256 (after embedding the hash)
+    file_sha256_final = hasher.hexdigest()
 
-    if deterministic:
-        # Deterministic mode: sorted keys, no extra whitespace
-        json_str = json.dumps(temp_data, sort_keys=True, indent=2, ensure_ascii=True)
-    else:
-        # Default mode: readable format
-        json_str = json.dumps(temp_data, indent=2)
+    return file_sha256_final, data_sha256
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(json_str)
 
-    # Compute file_sha256 of the file we just wrote
-    file_sha256_temp = compute_file_sha256(filepath)
+# =============================================================================
+# NESTED-GRID INCREMENTAL REFINEMENT [Dc]
+# =============================================================================
+# Grids with (N-1) doubling at each level are nested: level k+1 keeps every
+# point of level k (even indices) and inserts one midpoint per interval (odd
+# indices). np.linspace reproduces the shared points bit-for-bit (the step
+# halves exactly), so reused values are identical to a fresh evaluation.
+#
+# Cost: N_finest evaluations instead of Σ N_k.
+#
+# Trapezoid error is O(h²), so successive levels give Richardson estimates
+#   B̂_R = B̂_h + (B̂_h - B̂_2h) / 3
+# and the observed order p = log₂[(B̂_4h - B̂_2h)/(B̂_2h - B̂_h)].
 
-    # Re-write with file_sha256 embedded
-    final_data['file_sha256'] = file_sha256_temp
+def nested_grid_levels(k_min: int = 7, k_max: int = 10) -> List[int]:
+    """[Def] Nested 2^k+1 grid sizes for k = k_min..k_max."""
+    return [2**k + 1 for k in range(k_min, k_max + 1)]
 
-    if deterministic:
-        json_str = json.dumps(final_data, sort_keys=True, indent=2, ensure_ascii=True)
-    else:
-        json_str = json.dumps(final_data, indent=2)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(json_str)
+def nested_grid_refinement(params: Dict, Nq_levels: List[int] = None,
+                           evaluator=None, verbose: bool = True) -> Dict:
+    """
+    [Dc] Incremental Nq refinement on nested grids with Richardson extrapolation.
 
-    # Compute final file_sha256 (after embedding the hash)
-    file_sha256_final = compute_file_sha256(filepath)
+    Args:
+        params: parameter dict
+        Nq_levels: ascending grid sizes with (N_{k+1}-1) = 2(N_k-1)
+                   (default 2^k+1, k = 7..10)
+        evaluator: callable q_array -> (Mhat, Vhat); default is the exact
+                   M̃/Ṽ with the cached normalization
+        verbose: print the refinement table
+
+    Returns dict with per-level 'levels', 'Bhat_richardson', 'richardson_error',
+    'observed_order', 'n_evaluations', 'n_evaluations_independent'.
+    """
+    if Nq_levels is None:
+        Nq_levels = nested_grid_levels()
+    for N_c, N_f in zip(Nq_levels[:-1], Nq_levels[1:]):
+        if N_f - 1 != 2 * (N_c - 1):
+            raise ValueError(f"Grids not nested: Nq={N_c} -> Nq={N_f} "
+                             f"(need Nq_fine - 1 = 2*(Nq_coarse - 1))")
+
+    if evaluator is None:
+        norm = compute_normalization(params)
+        M0, VB = norm['M0'], norm['VB']
 
-    return file_sha256_final, data_sha256
+        def evaluator(q_values):
+            Mhat, Vhat = compute_hat_grid(q_values, params, M0, VB)
+            return Mhat, Vhat
+
+    levels = []
+    Mhat = Vhat = None
+    n_evals = 0
+
+    for N in Nq_levels:
+        q_grid = np.linspace(0, 1, N)
+        if Mhat is None:
+            Mhat, Vhat = evaluator(q_grid)
+            n_new = N
+        else:
+            M_fine, V_fine = np.empty(N), np.empty(N)
+            M_fine[0::2], V_fine[0::2] = Mhat, Vhat
+            M_fine[1::2], V_fine[1::2] = evaluator(q_grid[1::2])
+            Mhat, Vhat = M_fine, V_fine
+            n_new = N // 2
+        n_evals += n_new
+
+        Bhat = compute_Btilde(q_grid, Mhat, Vhat, 0.0)
+        level = {'Nq': N, 'Bhat': Bhat, 'Qhat1': compute_Qtilde(q_grid, Mhat)[-1],
+                 'n_new': n_new, 'Bhat_richardson': None}
+        if levels:
+            level['Bhat_richardson'] = Bhat + (Bhat - levels[-1]['Bhat']) / 3.0
+        levels.append(level)
+
+    Bhat_R = levels[-1]['Bhat_richardson']
+    R_error = abs(Bhat_R - levels[-1]['Bhat']) if Bhat_R is not None else None
+    if len(levels) >= 3 and Bhat_R is not None:
+        # Spread between the two finest Richardson values bounds the extrapolation
+        R_error = max(R_error, abs(Bhat_R - levels[-2]['Bhat_richardson']))
+
+    observed_order = None
+    if len(levels) >= 3:
+        d_coarse = levels[-2]['Bhat'] - levels[-3]['Bhat']
+        d_fine = levels[-1]['Bhat'] - levels[-2]['Bhat']
+        if d_fine != 0 and d_coarse / d_fine > 0:
+            observed_order = float(np.log2(d_coarse / d_fine))
+
+    result = {
+        'levels': levels,
+        'Bhat_finest': levels[-1]['Bhat'],
+        'Bhat_richardson': Bhat_R,
+        'richardson_error': R_error,
+        'observed_order': observed_order,
+        'n_evaluations': n_evals,
+        'n_evaluations_independent': int(sum(Nq_levels)),
+    }
+
+    if verbose:
+        print(f"{'Nq':>6} | {'new pts':>7} | {'B̂':>12} | {'B̂_Richardson':>14}")
+        print("-" * 50)
+        for lv in levels:
+            R_str = '—' if lv['Bhat_richardson'] is None else f"{lv['Bhat_richardson']:.8f}"
+            print(f"{lv['Nq']:>6} | {lv['n_new']:>7} | {lv['Bhat']:>12.8f} | {R_str:>14}")
+        print("-" * 50)
+        if Bhat_R is not None:
+            print(f"  Richardson B̂ = {Bhat_R:.8f} ± {R_error:.2e}")
+        if observed_order is not None:
+            print(f"  Observed order p = {observed_order:.2f} (trapezoid: 2)")
+        print(f"  Evaluations: {n_evals} nested vs {result['n_evaluations_independent']} independent")
+
+    return result
+
+
+def adaptive_bounce(params: Dict, tol: float = 1e-8, evaluator=None,
+                    n_initial: int = 16, max_evals: int = 4097,
+                    verbose: bool = True) -> Dict:
+    """
+    [Dc] Error-controlled adaptive B̂ = 2 ∫₀¹ √(2 M̂ V̂) dq.
+
+    Globally adaptive composite Simpson: each interval carries five
+    samples (a, a+h/4, a+h/2, a+3h/4, b), so the 3-point and 5-point
+    Simpson values S1, S2 give the local estimate |S2 - S1|. That is
+    conservative on purpose: the √ endpoint behaviour spoils the usual
+    /15 factor. Every interval whose error exceeds its share
+    tol·h of the budget is bisected. Each child reuses three of its
+    parent's samples, so a split costs 4 new evaluations, and the new
+    nodes from one sweep are evaluated in one batched call. Refinement
+    therefore goes to the endpoints instead of the smooth interior.
+
+    The uniform-grid trapezoid path (compute_Btilde) stays the reference
+    for frozen hashes; this is a diagnostic / fast-estimate integrator.
+
+    Args:
+        params: parameter dict
+        tol: target absolute error on B̂ (full bounce)
+        evaluator: callable q_array -> (Mhat, Vhat); default is the exact
+                   M̃/Ṽ with the cached normalization
+        n_initial: initial number of uniform intervals
+        max_evals: evaluation budget (stops unconverged if exceeded)
+        verbose: print a summary
+
+    Returns dict with 'Bhat', 'Bhat_half', 'error_estimate', 'n_evaluations',
+    'n_intervals', 'converged', 'q_nodes'.
+    """
+    if evaluator is None:
+        norm = compute_normalization(params)
+        M0, VB = norm['M0'], norm['VB']
+
+        def evaluator(q_values):
+            Mhat, Vhat = compute_hat_grid(q_values, params, M0, VB)
+            return Mhat, Vhat
+
+    def integrand(q_values):
+        Mhat, Vhat = evaluator(q_values)
+        return np.sqrt(2 * np.asarray(Mhat) * np.maximum(np.asarray(Vhat), 0))
+
+    # Interval table: rows are intervals, columns the five Simpson samples
+    edges = np.linspace(0, 1, n_initial + 1)
+    a, b = edges[:-1], edges[1:]
+    X = a[:, None] + (b - a)[:, None] * np.array([0.0, 0.25, 0.5, 0.75, 1.0])[None, :]
+    q_all = np.unique(X.ravel())
+    f_all = integrand(q_all)
+    F = f_all[np.searchsorted(q_all, X)]
+    n_evals = len(q_all)
+
+    def simpson(a, b, F):
+        h = b - a
+        S1 = h / 6.0 * (F[:, 0] + 4 * F[:, 2] + F[:, 4])
+        S2 = h / 12.0 * (F[:, 0] + 4 * F[:, 1] + 2 * F[:, 2] + 4 * F[:, 3] + F[:, 4])
+        return S2, np.abs(S2 - S1)
+
+    # Budget on the half-bounce integral (B̂ = 2 × half)
+    tol_half = 0.5 * tol
+    S, err = simpson(a, b, F)
+
+    while err.sum() > tol_half and n_evals + 4 * len(a) <= max_evals:
+        split = err > tol_half * (b - a)
+        if not np.any(split):
+            break
+        m = 0.5 * (a[split] + b[split])
+        Fs = F[split]
+
+        # Children [a, m] and [m, b]; new samples at the 1/8-points of the parent
+        a_c = np.concatenate([a[split], m])
+        b_c = np.concatenate([m, b[split]])
+        h_c = b_c - a_c
+        q_new = np.concatenate([a_c + 0.25 * h_c, a_c + 0.75 * h_c])
+        f_new = integrand(q_new)
+        n_evals += len(q_new)
+        n_c = len(a_c)
+        F_c = np.empty((n_c, 5))
+        half = len(m)
+        F_c[:half, 0], F_c[:half, 2], F_c[:half, 4] = Fs[:, 0], Fs[:, 1], Fs[:, 2]
+        F_c[half:, 0], F_c[half:, 2], F_c[half:, 4] = Fs[:, 2], Fs[:, 3], Fs[:, 4]
+        F_c[:, 1], F_c[:, 3] = f_new[:n_c], f_new[n_c:]
+
+        S_c, err_c = simpson(a_c, b_c, F_c)
+        keep = ~split
+        a = np.concatenate([a[keep], a_c])
+        b = np.concatenate([b[keep], b_c])
+        F = np.concatenate([F[keep], F_c])
+        S = np.concatenate([S[keep], S_c])
+        err = np.concatenate([err[keep], err_c])
+
+    order = np.argsort(a)
+    a, b, F = a[order], b[order], F[order]
+    Bhat_half = float(S.sum())
+    error_half = float(err.sum())
+
+    result = {
+        'Bhat': 2.0 * Bhat_half,
+        'Bhat_half': Bhat_half,
+        'error_estimate': 2.0 * error_half,
+        'tol': tol,
+        'n_evaluations': int(n_evals),
+        'n_intervals': int(len(a)),
+        'converged': bool(error_half <= tol_half),
+        'q_nodes': np.unique(np.concatenate([a, b])),
+    }
+
+    if verbose:
+        status = "converged" if result['converged'] else "NOT converged (budget)"
+        print(f"  Adaptive B̂ = {result['Bhat']:.10f} ± {result['error_estimate']:.2e} "
+              f"(tol {tol:.0e}, {status})")
+        print(f"  Evaluations: {n_evals} on {len(a)} intervals "
+              f"(min h = {np.min(b - a):.2e}, max h = {np.max(b - a):.2e})")
+
+    return result
 
 
 # =============================================================================
@@ -695,7 +1512,8 @@ def write_json_artifact(data: dict, filepath: str, deterministic: bool = False)
 # =============================================================================
 
 def convergence_sweep(params: Dict, grid_sizes: List[int] = [200, 400, 800],
-                      tolerances: List[float] = [1e-6, 1e-8, 1e-10]) -> Dict:
+                      tolerances: List[float] = [1e-6, 1e-8, 1e-10],
+                      refinement: str = 'independent') -> Dict:
     """
     [Dc] Step 10a: Convergence sweep to verify numerical stability.
 
@@ -703,6 +1521,12 @@ def convergence_sweep(params: Dict, grid_sizes: List[int] = [200, 400, 800],
     - Grid size convergence (Nq = 200, 400, 800)
     - Integrator tolerance convergence (1e-6, 1e-8, 1e-10)
 
+    refinement: 'independent' rebuilds every grid (legacy); 'nested' maps
+                grid_sizes to the nearest 2^k+1, reuses coarse-level values
+                and adds a Richardson estimate under results['richardson'];
+                'adaptive' keeps the uniform table and adds an
+                error-controlled B̂ (tol 1e-8) under results['adaptive'].
+
     Returns dict with convergence data.
     """
     print("\n" + "=" * 70)
@@ -721,16 +1545,32 @@ def convergence_sweep(params: Dict, grid_sizes: List[int] = [200, 400, 800],
     print(f"{'Nq':>6} | {'B̂_exact':>12} | {'Q̂(1)':>10} | {'ΔB̂ (%)':>10}")
     print("-" * 50)
 
+    if refinement == 'nested':
+        Nq_levels = [2**int(round(np.log2(N))) + 1 for N in grid_sizes]
+        nested = nested_grid_refinement(params, Nq_levels, verbose=False)
+        Bhat_prev = None
+        for lv in nested['levels']:
+            delta_pct = 0.0 if Bhat_prev is None else abs(lv['Bhat'] - Bhat_prev) / Bhat_prev * 100
+            print(f"{lv['Nq']:>6} | {lv['Bhat']:>12.6f} | {lv['Qhat1']:>10.6f} | {delta_pct:>10.3f}")
+            results['grid_convergence'].append({
+                'Nq': lv['Nq'], 'Bhat': lv['Bhat'], 'Qhat1': lv['Qhat1'], 'delta_pct': delta_pct
+            })
+            Bhat_prev = lv['Bhat']
+        results['richardson'] = {k: nested[k] for k in
+                                 ('Bhat_richardson', 'richardson_error', 'observed_order',
+                                  'n_evaluations', 'n_evaluations_independent')}
+        print(f"Richardson B̂ = {nested['Bhat_richardson']:.6f} ± {nested['richardson_error']:.1e} "
+              f"({nested['n_evaluations']} evals vs {nested['n_evaluations_independent']})")
+        grid_sizes = []
+    elif refinement not in ('independent', 'adaptive'):
+        raise ValueError(f"Unknown refinement mode: {refinement}")
+
     Bhat_prev = None
     for Nq in grid_sizes:
         q_grid = np.linspace(0, 1, Nq)
 
         # Compute exact M̃, Ṽ (normalized to unit peak)
-        Mtilde = np.zeros(Nq)
-        Vtilde = np.zeros(Nq)
-        for i, q in enumerate(q_grid):
-            Mtilde[i] = compute_Mtilde_exact(q, params, M0)
-            Vtilde[i] = compute_Vtilde_exact(q, params, VB)
+        Mtilde, Vtilde = compute_hat_grid(q_grid, params, M0, VB)
 
         Qtilde = compute_Qtilde(q_grid, Mtilde)
         Btilde = compute_Btilde(q_grid, Mtilde, Vtilde, 0.0)
@@ -743,6 +1583,11 @@ def convergence_sweep(params: Dict, grid_sizes: List[int] = [200, 400, 800],
         })
         Bhat_prev = Btilde
 
+    if refinement == 'adaptive':
+        adaptive = adaptive_bounce(params, tol=1e-8, verbose=True)
+        results['adaptive'] = {k: adaptive[k] for k in
+                               ('Bhat', 'error_estimate', 'n_evaluations', 'n_intervals', 'converged')}
+
     # Tolerance convergence (fixed grid = 400)
     # Note: scipy.integrate.quad tolerance affects r-integral, not q-grid
     print("\nIntegrator tolerance convergence (Nq = 400):")
@@ -888,11 +1733,7 @@ def error_decomposition(params: Dict, Nq: int = 400) -> Dict:
 
     q_grid = np.linspace(0, 1, Nq)
 
-    Mtilde_exact = np.zeros(Nq)
-    Vtilde_exact = np.zeros(Nq)
-    for i, q in enumerate(q_grid):
-        Mtilde_exact[i] = compute_Mtilde_exact(q, params, M0)
-        Vtilde_exact[i] = compute_Vtilde_exact(q, params, VB)
+    Mtilde_exact, Vtilde_exact = compute_hat_grid(q_grid, params, M0, VB)
 
     # Fit improved Fourier coefficients
     print("\nFitting improved Fourier coefficients...")
@@ -987,7 +1828,7 @@ def error_decomposition(params: Dict, Nq: int = 400) -> Dict:
 # STEP 11: BASELINE DISAMBIGUATION & WEIGHTED FIT [Dc]
 # =============================================================================
 
-def baseline_registry(params: Dict, Nq: int = 401) -> Dict:
+def baseline_registry(params: Dict, Nq: int = 401, norm: Dict = None) -> Dict:
     """
     [Dc] Step 11a: Explicit baseline registry with clear labels.
 
@@ -996,6 +1837,8 @@ def baseline_registry(params: Dict, Nq: int = 401) -> Dict:
     - FIT_V2: Step-10 improved Fourier fit
     - EXACT: Direct Gaussian integration
 
+    norm: precomputed compute_normalization(params) (step graph).
+
     Returns comparison table and integrand sensitivity data.
     """
     print("\n" + "=" * 70)
@@ -1003,14 +1846,14 @@ def baseline_registry(params: Dict, Nq: int = 401) -> Dict:
     print("=" * 70)
 
     # Get normalization
-    norm = compute_normalization(params)
+    if norm is None:
+        norm = compute_normalization(params)
     M0, VB = norm['M0'], norm['VB']
 
     q_grid = np.linspace(0, 1, Nq)
 
     # EXACT shapes
-    Mhat_exact = np.array([compute_Mtilde_exact(q, params, M0) for q in q_grid])
-    Vhat_exact = np.array([compute_Vtilde_exact(q, params, VB) for q in q_grid])
+    Mhat_exact, Vhat_exact = compute_hat_grid(q_grid, params, M0, VB)
 
     # INTERP_V1: Original Step-8 style (simple cos²/sin², normalized to unit peak)
     # M̂_V1(q) = cos²(πq) normalized so M̂(0)=1
@@ -1380,7 +2223,7 @@ def weighted_Mhat_fit(baseline_data: Dict, sensitivity_data: Dict) -> Dict:
 # STEP 14: UNCERTAINTY BUDGET AND LOCAL SENSITIVITY [Dc]
 # =============================================================================
 
-def uncertainty_budget(params: Dict, Nq_default: int = 401) -> Dict:
+def uncertainty_budget(params: Dict, Nq_default: int = 401, norm: Dict = None) -> Dict:
     """
     [Dc] Step 14a: Uncertainty budget for B̂ and physical B.
 
@@ -1389,6 +2232,8 @@ def uncertainty_budget(params: Dict, Nq_default: int = 401) -> Dict:
     (ii) Quadrature tolerance sweep
     (iii) Model-form uncertainty (EXACT vs surrogates)
 
+    norm: precomputed compute_normalization(params) (step graph).
+
     Returns combined uncertainty (RSS and conservative max).
     """
     print("\n" + "=" * 70)
@@ -1396,7 +2241,8 @@ def uncertainty_budget(params: Dict, Nq_default: int = 401) -> Dict:
     print("=" * 70)
 
     # Get normalization
-    norm = compute_normalization(params)
+    if norm is None:
+        norm = compute_normalization(params)
     M0, VB = norm['M0'], norm['VB']
 
     results = {
@@ -1410,9 +2256,9 @@ def uncertainty_budget(params: Dict, Nq_default: int = 401) -> Dict:
     tol_ref = 1e-10
     q_ref = np.linspace(0, 1, Nq_ref)
 
-    def compute_Bhat_at_settings(Nq, tol):
-        """Compute B̂ at given grid size and tolerance."""
-        q_grid = np.linspace(0, 1, Nq)
+    def hat_values_at_tol(q_grid, tol):
+        """Compute M̂, V̂ on q_grid at given quadrature tolerance."""
+        Nq = len(q_grid)
         Mhat = np.zeros(Nq)
         Vhat = np.zeros(Nq)
         for i, q in enumerate(q_grid):
@@ -1428,6 +2274,12 @@ def uncertainty_budget(params: Dict, Nq_default: int = 401) -> Dict:
                 V_val, _ = quad(V_integrand, 0, r_max, args=(q, params),
                                limit=200, epsabs=tol, epsrel=tol)
                 Vhat[i] = V_val / VB if VB > 0 else 0.0
+        return Mhat, Vhat
+
+    def compute_Bhat_at_settings(Nq, tol):
+        """Compute B̂ at given grid size and tolerance."""
+        q_grid = np.linspace(0, 1, Nq)
+        Mhat, Vhat = hat_values_at_tol(q_grid, tol)
         return compute_Btilde(q_grid, Mhat, Vhat, 0.0)
 
     # (i) Grid discretization sweep
@@ -1436,15 +2288,27 @@ def uncertainty_budget(params: Dict, Nq_default: int = 401) -> Dict:
     print(f"{'Nq':>6} | {'B̂':>12} | {'ΔB̂ vs 801':>12}")
     print("-" * 50)
 
-    Bhat_ref = compute_Bhat_at_settings(Nq_ref, 1e-8)
+    # Nested grids: 201 ⊂ 401 ⊂ 801, so only the inserted points are evaluated
     grid_sizes = [201, 401, 801]
+    nested = nested_grid_refinement(params, grid_sizes,
+                                    evaluator=lambda q: hat_values_at_tol(q, 1e-8),
+                                    verbose=False)
+    Bhat_ref = nested['Bhat_finest']
 
-    for Nq in grid_sizes:
-        Bhat = compute_Bhat_at_settings(Nq, 1e-8)
+    for lv in nested['levels']:
+        Nq, Bhat = lv['Nq'], lv['Bhat']
         delta = abs(Bhat - Bhat_ref) / Bhat_ref * 100
         print(f"{Nq:>6} | {Bhat:>12.6f} | {delta:>11.4f}%")
         results['grid'].append({'Nq': Nq, 'Bhat': Bhat, 'delta_pct': delta})
 
+    results['grid_richardson'] = {
+        'Bhat_richardson': nested['Bhat_richardson'],
+        'richardson_error': nested['richardson_error'],
+        'observed_order': nested['observed_order'],
+    }
+    print(f"Richardson (201/401/801): B̂ = {nested['Bhat_richardson']:.6f} "
+          f"± {nested['richardson_error']:.1e}")
+
     delta_grid = results['grid'][1]['delta_pct']  # 401 vs 801
     print(f"\nGrid uncertainty (Nq=401 vs 801): δ_grid = {delta_grid:.4f}%")
 
@@ -1580,8 +2444,7 @@ def local_sensitivity(params: Dict, baseline_data: Dict = None, Nq: int = 401) -
         norm = compute_normalization(params)
         M0, VB = norm['M0'], norm['VB']
         q_grid = np.linspace(0, 1, Nq)
-        Mhat_exact = np.array([compute_Mtilde_exact(q, params, M0) for q in q_grid])
-        Vhat_exact = np.array([compute_Vtilde_exact(q, params, VB) for q in q_grid])
+        Mhat_exact, Vhat_exact = compute_hat_grid(q_grid, params, M0, VB)
     else:
         q_grid = baseline_data['q_grid']
         Mhat_exact = baseline_data['Mhat_exact']
@@ -1691,6 +2554,99 @@ def local_sensitivity(params: Dict, baseline_data: Dict = None, Nq: int = 401) -
     }
 
 
+# -----------------------------------------------------------------------------
+# PARAMETER GRADIENTS BY COMPLEX STEP [Dc]
+# -----------------------------------------------------------------------------
+# The fixed-node kernel is analytic in (A0, w, ell, sigma), so shifting one
+# parameter by i·h gives f(θ + ih) = f(θ) + ih f′(θ) + O(h²). The shift has
+# no subtractive cancellation, so h can be 1e-30 and the derivative is
+# exact to rounding. The nominal row and one complex row per parameter form
+# a single (1 + P, Nq, n) tensor: values and the full gradient come from one
+# radial pass. The normalization maxima are taken at the nominal argmax
+# (envelope theorem on the scan grid), as compute_normalization does.
+
+SENSITIVITY_PARAMS = ('A0', 'w', 'ell', 'sigma')
+COMPLEX_STEP = 1e-30
+
+
+def compute_MV_with_derivatives(q_values: np.ndarray, params: Dict,
+                                thetas: tuple = SENSITIVITY_PARAMS,
+                                n_nodes: int = None) -> Dict:
+    """
+    [Dc] M(q), V(q) and ∂M/∂θ, ∂V/∂θ for θ in thetas, in one kernel call.
+
+    Returns dict with 'M', 'V' (real arrays), 'dM', 'dV' ({θ: array}), and
+    the complex rows 'M_c', 'V_c' (row 0 nominal, row k = θ_k + ih).
+    """
+    n_nodes = n_nodes or RADIAL_NODES
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+    profile_type = params.get('profile_type', 'parabolic')
+    Aq = amplitude_factor(q_values, profile_type) * np.ones_like(q_values)
+    dAdq = d_amplitude_dq(q_values, profile_type) * np.ones_like(q_values)
+
+    rows = {k: np.full(1 + len(thetas), params[k], dtype=complex) for k in SENSITIVITY_PARAMS}
+    for j, theta in enumerate(thetas, start=1):
+        rows[theta][j] += 1j * COMPLEX_STEP
+    M_c, V_c = _MV_from_amplitudes(Aq[None, :], dAdq[None, :],
+                                   {k: v[:, None] for k, v in rows.items()}, n_nodes)
+
+    return {
+        'M': M_c[0].real, 'V': V_c[0].real,
+        'dM': {t: M_c[j].imag / COMPLEX_STEP for j, t in enumerate(thetas, start=1)},
+        'dV': {t: V_c[j].imag / COMPLEX_STEP for j, t in enumerate(thetas, start=1)},
+        'M_c': M_c, 'V_c': V_c,
+    }
+
+
+def bhat_parameter_gradient(params: Dict = None, Nq: int = 401,
+                            thetas: tuple = SENSITIVITY_PARAMS,
+                            verbose: bool = True) -> Dict:
+    """
+    [Dc] B̂ and the full gradient ∂B̂/∂θ at roughly the cost of one baseline.
+
+    Same pipeline as the baseline (compute_normalization scan on
+    linspace(0.01, 0.99, 99), M̂ = M/M₀, Ṽ = V/V_B, B̂ = 2∫√(2M̂V̂) dq on
+    linspace(0, 1, Nq)), evaluated on complex parameter rows with the
+    fixed-node kernel. Points where M̂V̂ ≤ 0 are clipped as in compute_Btilde.
+
+    Returns dict with 'Bhat', 'gradient' {θ: ∂B̂/∂θ}, 'elasticity'
+    {θ: ∂ln B̂/∂ln θ}, 'M0', 'VB'.
+    """
+    if params is None:
+        params = PARAMS
+
+    q_scan = np.linspace(0.01, 0.99, 99)
+    q_grid = np.linspace(0, 1, Nq)
+    res = compute_MV_with_derivatives(np.concatenate([q_scan, q_grid]), params, thetas)
+    M_c, V_c = res['M_c'], res['V_c']
+    n_scan = len(q_scan)
+
+    # Maxima at the nominal argmax (its location does not move to first order)
+    iM = np.argmax(M_c[0, :n_scan].real)
+    iV = np.argmax(V_c[0, :n_scan].real)
+    Mhat = M_c[:, n_scan:] / M_c[:, iM:iM + 1]
+    Vhat = V_c[:, n_scan:] / V_c[:, iV:iV + 1]
+
+    prod = 2.0 * Mhat * Vhat
+    I = np.where(prod.real > 0, np.sqrt(np.where(prod.real > 0, prod, 1.0)), 0.0)
+    B_c = 2.0 * trapezoid(I, q_grid, axis=1)
+
+    Bhat = float(B_c[0].real)
+    gradient = {t: float(B_c[j].imag / COMPLEX_STEP) for j, t in enumerate(thetas, start=1)}
+    elasticity = {t: gradient[t] * params[t] / Bhat for t in thetas}
+
+    if verbose:
+        print(f"\nB̂ parameter gradient (complex step, Nq = {Nq}) [Dc]:")
+        print(f"  B̂ = {Bhat:.10f}")
+        print(f"  {'θ':>6} | {'∂B̂/∂θ':>14} | {'∂ln B̂/∂ln θ':>14}")
+        print("  " + "-" * 40)
+        for t in thetas:
+            print(f"  {t:>6} | {gradient[t]:>14.6e} | {elasticity[t]:>14.6e}")
+
+    return {'Bhat': Bhat, 'gradient': gradient, 'elasticity': elasticity,
+            'M0': float(M_c[0, iM].real), 'VB': float(V_c[0, iV].real), 'Nq': Nq}
+
+
 # =============================================================================
 # STEP 15: PROFILE ROBUSTNESS (GAUSSIAN vs PARABOLIC) [P]
 # =============================================================================
@@ -1878,8 +2834,7 @@ def analytic_crosscheck(params: Dict, baseline_data: Dict = None) -> Dict:
         norm = compute_normalization(params)
         M0, VB = norm['M0'], norm['VB']
         q_grid = np.linspace(0, 1, 401)
-        Mhat_exact = np.array([compute_Mtilde_exact(q, params, M0) for q in q_grid])
-        Vhat_exact = np.array([compute_Vtilde_exact(q, params, VB) for q in q_grid])
+        Mhat_exact, Vhat_exact = compute_hat_grid(q_grid, params, M0, VB)
         Bhat_exact = compute_Btilde(q_grid, Mhat_exact, Vhat_exact, 0.0)
     else:
         q_grid = baseline_data['q_grid']
@@ -1959,6 +2914,8 @@ def tau_uncertainty_propagation(
     delta_Bhat_rel: float = 0.014,  # 1.4% from Step 14
     tau_cal: float = 879.0,         # [Cal] τ = 879 s
     A_SM: float = 1.0e18,           # Typical weak decay prefactor [s^-1]
+    sampling: str = None,           # None | 'sobol' | 'lhs' | 'mc'
+    n_samples: int = 4096,
 ) -> Dict:
     """
     [DIAG] Step 17: Propagate bounce uncertainty to lifetime uncertainty.
@@ -1988,6 +2945,11 @@ def tau_uncertainty_propagation(
         Calibrated lifetime [s], default 879 s.
     A_SM : float
         WKB prefactor [s^-1], default 10^18 (typical weak decay scale).
+    sampling : str, optional
+        Also run tau_uncertainty_sampling with this sampler; its result is
+        returned under 'sampling'. None (default) keeps the linear estimate only.
+    n_samples : int
+        Sample count for the sampling mode.
 
     Returns
     -------
@@ -2062,7 +3024,7 @@ def tau_uncertainty_propagation(
     print("  of the WKB formula to the dimensionless shape computation.")
     print("  The calibration absorbs this by adjusting amplitude scales.")
 
-    return {
+    results = {
         'tau_cal': tau_cal,
         'A_SM': A_SM,
         'B_over_hbar': B_over_hbar,
@@ -2070,6 +3032,165 @@ def tau_uncertainty_propagation(
         'delta_tau_rel': delta_tau_rel,
         'delta_tau_abs': delta_tau_abs,
     }
+    if sampling is not None:
+        results['sampling'] = tau_uncertainty_sampling(n_samples=n_samples, sampler=sampling,
+                                                       tau_cal=tau_cal, A_SM=A_SM)
+    return results
+
+
+# -----------------------------------------------------------------------------
+# SAMPLING-BASED (QMC) PROPAGATION [DIAG]
+# -----------------------------------------------------------------------------
+# Samples (A0, w, ell, sigma, p) where p is the super-Gaussian profile
+# exponent (p = 1 is the parabolic baseline). Each chunk of samples is one
+# (S, Nq, n_nodes) fixed-node tensor, normalized with the Step 31
+# convention (interior maxima). Chunks are independent and go through
+# pool_map. τ follows from τ = τ_cal exp[(B_phys/ℏ)(B̂/B̂_ref − 1)] with
+# amplitude scales held fixed, which matches assumption (1) of Step 17.
+
+TAU_SAMPLING_PARAMS = ('A0', 'w', 'ell', 'sigma', 'p')
+TAU_SAMPLING_REL_SPREAD = 0.05            # ±5% uniform on A0, w, ell, sigma
+TAU_SAMPLING_P_RANGE = (1.0, 1.2)         # profile exponent prior
+TAU_SAMPLING_CHUNK = 256                  # samples per tensor evaluation
+
+
+def _bhat_sample_chunk(args: tuple) -> np.ndarray:
+    """[Dc] Full-convention B̂ for a chunk of parameter samples (pool work item)."""
+    theta, Nq, n_nodes = args
+    q_grid = np.linspace(0, 1, Nq)
+    A0, w, ell, sigma, p = (theta[:, k][:, None] for k in range(5))
+
+    Aq = amplitude_super_gaussian(q_grid[None, :], p)
+    dAdq = d_amplitude_super_gaussian_dq(q_grid[None, :], p)
+    M_raw, V_raw = _MV_from_amplitudes(Aq, dAdq, {'A0': A0, 'w': w, 'ell': ell, 'sigma': sigma},
+                                       n_nodes)
+
+    # Step 31 normalization: interior maxima (~1% excluded at each end)
+    n_exclude = max(1, Nq // 100)
+    M0 = np.max(M_raw[:, n_exclude:-n_exclude], axis=1, keepdims=True)
+    VB = np.max(V_raw[:, n_exclude:-n_exclude], axis=1, keepdims=True)
+    I_exact = np.sqrt(2.0 * np.maximum(M_raw / M0, 0) * np.maximum(V_raw / VB, 0))
+    return 2.0 * trapezoid(I_exact, q_grid, axis=1)
+
+
+def tau_uncertainty_sampling(params: Dict = None, n_samples: int = 4096,
+                             sampler: str = 'sobol', seed: int = 0,
+                             rel_spread: float = None, p_range: tuple = None,
+                             Nq: int = 201, tau_cal: float = 879.0, A_SM: float = 1.0e18,
+                             workers: int = None, verbose: bool = True) -> Dict:
+    """
+    [DIAG] Quasi-Monte Carlo propagation of (A0, w, ell, sigma, p) to B̂ and τ.
+
+    Args:
+        params: central parameter dict (uses PARAMS if None)
+        n_samples: number of samples (Sobol: rounded up to a power of 2)
+        sampler: 'sobol' (scrambled), 'lhs' (Latin hypercube) or 'mc'
+        seed: sampler seed
+        rel_spread: relative half-width for A0, w, ell, sigma
+                    (default TAU_SAMPLING_REL_SPREAD)
+        p_range: (p_min, p_max) for the profile exponent (default TAU_SAMPLING_P_RANGE)
+        Nq: q-grid size per sample
+        tau_cal, A_SM: as in tau_uncertainty_propagation
+        workers: processes for sample chunks (None → WORKERS)
+        verbose: print percentiles and the convergence table
+
+    Returns dict with 'Bhat' and 'tau' percentile tables, 'Bhat_ref', sample
+    moments, the 'convergence' table over sample-count prefixes, and the
+    raw 'Bhat_samples' / 'tau_samples'.
+    """
+    from scipy.stats import qmc
+
+    if params is None:
+        params = PARAMS
+    rel_spread = TAU_SAMPLING_REL_SPREAD if rel_spread is None else rel_spread
+    p_range = TAU_SAMPLING_P_RANGE if p_range is None else p_range
+
+    d = len(TAU_SAMPLING_PARAMS)
+    if sampler == 'sobol':
+        m = int(np.ceil(np.log2(max(n_samples, 2))))
+        unit = qmc.Sobol(d=d, scramble=True, seed=seed).random_base2(m)
+    elif sampler == 'lhs':
+        unit = qmc.LatinHypercube(d=d, seed=seed).random(n_samples)
+    elif sampler == 'mc':
+        unit = np.random.default_rng(seed).random((n_samples, d))
+    else:
+        raise ValueError(f"Unknown sampler: {sampler} (expected 'sobol', 'lhs' or 'mc')")
+    n_samples = len(unit)
+
+    center = np.array([params[k] for k in TAU_SAMPLING_PARAMS[:4]], dtype=float)
+    lo = np.concatenate([center * (1 - rel_spread), [p_range[0]]])
+    hi = np.concatenate([center * (1 + rel_spread), [p_range[1]]])
+    theta = qmc.scale(unit, lo, hi)
+
+    # Reference B̂ with the same engine and normalization at the central point
+    theta_ref = np.concatenate([center, [1.0]])[None, :]
+    Bhat_ref = float(_bhat_sample_chunk((theta_ref, Nq, RADIAL_NODES))[0])
+
+    chunks = [(theta[i:i + TAU_SAMPLING_CHUNK], Nq, RADIAL_NODES)
+              for i in range(0, n_samples, TAU_SAMPLING_CHUNK)]
+    Bhat = np.concatenate(pool_map(_bhat_sample_chunk, chunks, workers))
+
+    B_over_hbar = np.log(A_SM * tau_cal)
+    tau = tau_cal * np.exp(B_over_hbar * (Bhat / Bhat_ref - 1.0))
+
+    pct = [2.5, 16.0, 50.0, 84.0, 97.5]
+
+    def pct_table(x):
+        return {f'p{q:g}': float(v) for q, v in zip(pct, np.percentile(x, pct))}
+
+    # Estimator convergence over nested prefixes (balanced for Sobol)
+    convergence = []
+    n = 64
+    while n <= n_samples:
+        t = tau[:n]
+        convergence.append({
+            'n': n,
+            'Bhat_mean': float(np.mean(Bhat[:n])),
+            'tau_median': float(np.median(t)),
+            'tau_p16': float(np.percentile(t, 16)),
+            'tau_p84': float(np.percentile(t, 84)),
+            'rel_spread_68': float((np.percentile(t, 84) - np.percentile(t, 16)) / (2 * np.median(t))),
+        })
+        n *= 2
+
+    result = {
+        'sampler': sampler,
+        'n_samples': n_samples,
+        'seed': seed,
+        'parameters': list(TAU_SAMPLING_PARAMS),
+        'bounds': {k: (float(a), float(b)) for k, a, b in zip(TAU_SAMPLING_PARAMS, lo, hi)},
+        'Nq': Nq,
+        'Bhat_ref': Bhat_ref,
+        'B_over_hbar': B_over_hbar,
+        'Bhat': pct_table(Bhat),
+        'tau': pct_table(tau),
+        'Bhat_mean': float(np.mean(Bhat)),
+        'Bhat_std': float(np.std(Bhat, ddof=1)),
+        'delta_Bhat_rel_68': float((np.percentile(Bhat, 84) - np.percentile(Bhat, 16)) / (2 * Bhat_ref)),
+        'convergence': convergence,
+        'Bhat_samples': Bhat,
+        'tau_samples': tau,
+    }
+
+    if verbose:
+        print(f"\nSampling propagation [DIAG]: {sampler}, N = {n_samples}, Nq = {Nq}")
+        for k, (a, b) in result['bounds'].items():
+            print(f"  {k:>6} ∈ [{a:.6g}, {b:.6g}]")
+        print(f"  B̂_ref = {Bhat_ref:.6f} (p = 1, central parameters)")
+        print()
+        print(f"  {'':>6} | " + " | ".join(f"{'p' + format(q, 'g'):>10}" for q in pct))
+        print("  " + "-" * 66)
+        print(f"  {'B̂':>6} | " + " | ".join(f"{v:>10.6f}" for v in result['Bhat'].values()))
+        print(f"  {'τ [s]':>6} | " + " | ".join(f"{v:>10.4g}" for v in result['tau'].values()))
+        print()
+        print(f"  {'N':>6} | {'⟨B̂⟩':>10} | {'τ median':>10} | {'τ p16':>10} | {'τ p84':>10}")
+        print("  " + "-" * 56)
+        for c in convergence:
+            print(f"  {c['n']:>6} | {c['Bhat_mean']:>10.6f} | {c['tau_median']:>10.4g} | "
+                  f"{c['tau_p16']:>10.4g} | {c['tau_p84']:>10.4g}")
+        print(f"\n  68% half-width: δB̂/B̂ = {result['delta_Bhat_rel_68']*100:.2f}%")
+
+    return result
 
 
 # =============================================================================
@@ -2081,11 +3202,12 @@ def tau_uncertainty_propagation(
 
 from scipy.optimize import minimize_scalar, brentq
 
-def compute_V_with_width(q: float, w: float, params: Dict) -> float:
+def compute_V_with_width(q: float, w: float, params: Dict, method: str = None) -> float:
     """
     [Dc] Compute V(q) for a given width w.
 
     The brane energy functional for fixed q and Gaussian radial profile.
+    method: 'quad' (reference) or 'gauss_laguerre'; None → RADIAL_QUADRATURE.
     """
     A0, ell, sigma = params['A0'], params['ell'], params['sigma']
     profile_type = params.get('profile_type', 'parabolic')
@@ -2094,6 +3216,9 @@ def compute_V_with_width(q: float, w: float, params: Dict) -> float:
     if abs(Aq) < 1e-15 or w < 1e-10:
         return 0.0
 
+    if (method or RADIAL_QUADRATURE) != 'quad':
+        return float(compute_VM_pairs(np.array([q]), np.array([w]), params, method=method)[0][0])
+
     def integrand(r):
         if r < 1e-15:
             return 0.0
@@ -2110,9 +3235,11 @@ def compute_V_with_width(q: float, w: float, params: Dict) -> float:
     return result
 
 
-def compute_M_with_width(q: float, w: float, params: Dict) -> float:
+def compute_M_with_width(q: float, w: float, params: Dict, method: str = None) -> float:
     """
     [Dc] Compute M(q) for a given width w.
+
+    method: 'quad' (reference) or 'gauss_laguerre'; None → RADIAL_QUADRATURE.
     """
     A0, ell, sigma = params['A0'], params['ell'], params['sigma']
     profile_type = params.get('profile_type', 'parabolic')
@@ -2122,6 +3249,9 @@ def compute_M_with_width(q: float, w: float, params: Dict) -> float:
     if w < 1e-10:
         return 0.0
 
+    if (method or RADIAL_QUADRATURE) != 'quad':
+        return float(compute_VM_pairs(np.array([q]), np.array([w]), params, method=method)[1][0])
+
     def integrand(r):
         if r < 1e-15:
             return 0.0
@@ -2132,9 +3262,114 @@ def compute_M_with_width(q: float, w: float, params: Dict) -> float:
         df_dq_sq = (A0 * dAdq)**2 * exp_r2_w2
         return sigma * df_dq_sq * 4 * np.pi * r**2 * warp
 
-    r_max = 20 * w
-    result, _ = quad(integrand, 0, r_max, limit=100)
-    return result
+    r_max = 20 * w
+    result, _ = quad(integrand, 0, r_max, limit=100)
+    return result
+
+
+# -----------------------------------------------------------------------------
+# (q, w) LATTICE EVALUATION AND VECTORIZED WIDTH MINIMIZATION [Dc]
+# -----------------------------------------------------------------------------
+# The fixed-node radial engine takes A(q) and w element-wise, so V and M on
+# a full (q, w) lattice — or on arbitrary (q_i, w_i) pairs, one per
+# minimizer lane — are single tensor evaluations. 'quad' keeps the
+# per-pair reference integrals above.
+
+def compute_VM_pairs(q_values: np.ndarray, w_values: np.ndarray, params: Dict,
+                     method: str = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [Dc] V(q_i; w_i), M(q_i; w_i) for broadcast-compatible q and w arrays.
+
+    Returns: (V, M) with the broadcast shape; same zero conventions as
+             compute_V_with_width / compute_M_with_width.
+    """
+    method = method or RADIAL_QUADRATURE
+    q_b, w_b = np.broadcast_arrays(np.asarray(q_values, dtype=float),
+                                   np.asarray(w_values, dtype=float))
+
+    if method == 'quad':
+        V = np.array([compute_V_with_width(q, w, params, method='quad')
+                      for q, w in zip(q_b.ravel(), w_b.ravel())]).reshape(q_b.shape)
+        M = np.array([compute_M_with_width(q, w, params, method='quad')
+                      for q, w in zip(q_b.ravel(), w_b.ravel())]).reshape(q_b.shape)
+        return V, M
+    if method != 'gauss_laguerre':
+        raise ValueError(f"Unknown radial quadrature method: {method}")
+
+    profile_type = params.get('profile_type', 'parabolic')
+    Aq = amplitude_factor(q_b, profile_type)
+    dAdq = d_amplitude_dq(q_b, profile_type) * np.ones_like(q_b)
+    w_safe = np.where(w_b < 1e-10, 1.0, w_b)
+
+    M, V = _MV_from_amplitudes(Aq, dAdq, params, RADIAL_NODES, w=w_safe)
+    V = np.where((np.abs(Aq) < 1e-15) | (w_b < 1e-10), 0.0, V)
+    M = np.where(w_b < 1e-10, 0.0, M)
+    return V, M
+
+
+def compute_VM_lattice(q_values: np.ndarray, w_values: np.ndarray, params: Dict,
+                       method: str = None) -> Tuple[np.ndarray, np.ndarray]:
+    """[Dc] V, M on the full (q, w) lattice; returns arrays of shape (Nq, Nw)."""
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+    w_values = np.atleast_1d(np.asarray(w_values, dtype=float))
+    return compute_VM_pairs(q_values[:, None], w_values[None, :], params, method=method)
+
+
+def golden_section_minimize_batch(objective, lo, hi, xtol: float = 1e-5,
+                                  max_iter: int = 200, n_polish: int = 21) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [Def] Array-wise bounded golden-section search with local-grid polishing.
+
+    objective(x) maps an array of K lane positions to K values (one
+    independent 1-D problem per lane). All lanes advance together, so each
+    iteration is one batched objective call.
+
+    Polishing: the objective is sampled on n_polish points spanning the
+    final bracket, the best sample and its neighbours are fitted with a
+    parabola, and its vertex is accepted if it improves the objective.
+
+    Returns: (x_min, f_min) arrays of shape (K,)
+    """
+    invphi = (np.sqrt(5.0) - 1.0) / 2.0
+    a = np.array(lo, dtype=float, copy=True)
+    b = np.array(hi, dtype=float, copy=True)
+    c = b - invphi * (b - a)
+    d = a + invphi * (b - a)
+    fc, fd = objective(c), objective(d)
+
+    for _ in range(max_iter):
+        if np.all(b - a < xtol):
+            break
+        left = fc < fd  # Minimum in [a, d]
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+        c_new = b - invphi * (b - a)
+        d_new = a + invphi * (b - a)
+        # Reuse the interior point that survives; evaluate the new one
+        x_eval = np.where(left, c_new, d_new)
+        f_eval = objective(x_eval)
+        c, d, fc, fd = (np.where(left, c_new, d), np.where(left, c, d_new),
+                        np.where(left, f_eval, fd), np.where(left, fc, f_eval))
+
+    # Polish on a fine local grid across the final bracket
+    K = len(a)
+    t = np.linspace(0.0, 1.0, n_polish)
+    X = a[:, None] + (b - a)[:, None] * t[None, :]
+    F = objective(X.ravel()).reshape(K, n_polish)
+    j = np.clip(np.argmin(F, axis=1), 1, n_polish - 2)
+    rows = np.arange(K)
+    x0, x1, x2 = X[rows, j - 1], X[rows, j], X[rows, j + 1]
+    f0, f1, f2 = F[rows, j - 1], F[rows, j], F[rows, j + 1]
+    denom = (x1 - x0) * (f1 - f2) - (x1 - x2) * (f1 - f0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_par = x1 - 0.5 * ((x1 - x0)**2 * (f1 - f2) - (x1 - x2)**2 * (f1 - f0)) / denom
+    x_par = np.where(np.isfinite(x_par), np.clip(x_par, x0, x2), x1)
+    f_par = objective(x_par)
+
+    x_best = X[rows, np.argmin(F, axis=1)]
+    f_best = np.min(F, axis=1)
+    improve = f_par < f_best
+    return np.where(improve, x_par, x_best), np.where(improve, f_par, f_best)
 
 
 def width_scan_VM(q0: float = 0.5, w_list: list = None, params: Dict = None) -> Dict:
@@ -2158,16 +3393,9 @@ def width_scan_VM(q0: float = 0.5, w_list: list = None, params: Dict = None) ->
     print()
 
     # Compute V and M at each w
-    V_values = []
-    M_values = []
-    for w in w_list:
-        V = compute_V_with_width(q0, w, params)
-        M = compute_M_with_width(q0, w, params)
-        V_values.append(V)
-        M_values.append(M)
-
-    V_values = np.array(V_values)
-    M_values = np.array(M_values)
+    V_lat, M_lat = compute_VM_lattice(np.array([q0]), np.array(w_list, dtype=float), params)
+    V_values = V_lat[0]
+    M_values = M_lat[0]
 
     # Normalize to shape functions using w=0.5 as reference
     w_ref = 0.5
@@ -2269,8 +3497,7 @@ def width_scan_Bhat(w_list: list = None, params: Dict = None, Nq: int = 201) ->
         VB = norm['VB']
 
         # Compute M̂, V̂ at this w
-        Mhat = np.array([compute_Mtilde_exact(q, params_w, M0) for q in q_grid])
-        Vhat = np.array([compute_Vtilde_exact(q, params_w, VB) for q in q_grid])
+        Mhat, Vhat = compute_hat_grid(q_grid, params_w, M0, VB)
 
         # Compute bounce
         Bhat = compute_Btilde(q_grid, Mhat, Vhat, 0.0)
@@ -2326,12 +3553,10 @@ def width_scan_Bhat(w_list: list = None, params: Dict = None, Nq: int = 201) ->
     norm_plus = compute_normalization(params_plus)
     norm_minus = compute_normalization(params_minus)
 
-    Mhat_plus = np.array([compute_Mtilde_exact(q, params_plus, norm_plus['M0']) for q in q_grid])
-    Vhat_plus = np.array([compute_Vtilde_exact(q, params_plus, norm_plus['VB']) for q in q_grid])
+    Mhat_plus, Vhat_plus = compute_hat_grid(q_grid, params_plus, norm_plus['M0'], norm_plus['VB'])
     Bhat_plus = compute_Btilde(q_grid, Mhat_plus, Vhat_plus, 0.0)
 
-    Mhat_minus = np.array([compute_Mtilde_exact(q, params_minus, norm_minus['M0']) for q in q_grid])
-    Vhat_minus = np.array([compute_Vtilde_exact(q, params_minus, norm_minus['VB']) for q in q_grid])
+    Mhat_minus, Vhat_minus = compute_hat_grid(q_grid, params_minus, norm_minus['M0'], norm_minus['VB'])
     Bhat_minus = compute_Btilde(q_grid, Mhat_minus, Vhat_minus, 0.0)
 
     # d ln B̂ / d ln w = (w / B̂) * (dB̂/dw)
@@ -2380,7 +3605,8 @@ def constrained_width(R0: float, params: Dict) -> float:
     return w_constrained
 
 
-def exact_constrained_baseline(params: Dict, R0: float = None, Nq: int = 401) -> Dict:
+def exact_constrained_baseline(params: Dict, R0: float = None, Nq: int = 401,
+                               norm: Dict = None) -> Dict:
     """
     [Dc] Step 19b: EXACT_CONSTRAINED baseline with RMS width constraint.
 
@@ -2389,6 +3615,9 @@ def exact_constrained_baseline(params: Dict, R0: float = None, Nq: int = 401) ->
 
     This makes the width determination well-posed: w is no longer arbitrary
     but determined by the physical constraint R_rms = R0 [Def].
+
+    norm: precomputed compute_normalization(params) for the unconstrained
+    baseline (step graph).
     """
     print("\n" + "=" * 70)
     print("STEP 19b: CONSTRAINED WIDTH PRINCIPLE [Dc]")
@@ -2420,17 +3649,15 @@ def exact_constrained_baseline(params: Dict, R0: float = None, Nq: int = 401) ->
     VB_c = norm_c['VB']
 
     q_grid = np.linspace(0, 1, Nq)
-    Mhat_c = np.array([compute_Mtilde_exact(q, params_constrained, M0_c) for q in q_grid])
-    Vhat_c = np.array([compute_Vtilde_exact(q, params_constrained, VB_c) for q in q_grid])
+    Mhat_c, Vhat_c = compute_hat_grid(q_grid, params_constrained, M0_c, VB_c)
     Bhat_constrained = compute_Btilde(q_grid, Mhat_c, Vhat_c, 0.0)
 
     # Compute original EXACT baseline for comparison
-    norm_orig = compute_normalization(params)
+    norm_orig = norm if norm is not None else compute_normalization(params)
     M0_orig = norm_orig['M0']
     VB_orig = norm_orig['VB']
 
-    Mhat_orig = np.array([compute_Mtilde_exact(q, params, M0_orig) for q in q_grid])
-    Vhat_orig = np.array([compute_Vtilde_exact(q, params, VB_orig) for q in q_grid])
+    Mhat_orig, Vhat_orig = compute_hat_grid(q_grid, params, M0_orig, VB_orig)
     Bhat_exact = compute_Btilde(q_grid, Mhat_orig, Vhat_orig, 0.0)
 
     # Compare
@@ -2506,8 +3733,7 @@ def predictivity_from_width_precision(params: Dict, constrained_data: Dict = Non
         params_pert['w'] = w_pert
 
         norm_pert = compute_normalization(params_pert)
-        Mhat_pert = np.array([compute_Mtilde_exact(q, params_pert, norm_pert['M0']) for q in q_grid])
-        Vhat_pert = np.array([compute_Vtilde_exact(q, params_pert, norm_pert['VB']) for q in q_grid])
+        Mhat_pert, Vhat_pert = compute_hat_grid(q_grid, params_pert, norm_pert['M0'], norm_pert['VB'])
         Bhat_pert = compute_Btilde(q_grid, Mhat_pert, Vhat_pert, 0.0)
 
         delta_Bhat_frac = (Bhat_pert - Bhat_ref) / Bhat_ref
@@ -2574,7 +3800,7 @@ def predictivity_from_width_precision(params: Dict, constrained_data: Dict = Non
     }
 
 
-def step19_complete(params: Dict = None) -> Dict:
+def step19_complete(params: Dict = None, constrained: Dict = None) -> Dict:
     """
     [DIAG] Run complete Step 19 analysis.
 
@@ -2582,6 +3808,8 @@ def step19_complete(params: Dict = None) -> Dict:
     19a: Width scan (V̂, M̂, B̂ vs w) to verify runaway
     19b: Constrained width principle (R_rms = R₀)
     19c: Predictivity impact (what precision is needed)
+
+    constrained: precomputed exact_constrained_baseline(params) (step graph)
     """
     if params is None:
         params = PARAMS
@@ -2599,7 +3827,8 @@ def step19_complete(params: Dict = None) -> Dict:
     Bhat_scan = width_scan_Bhat(params=params)
 
     # 19b: Constrained baseline
-    constrained = exact_constrained_baseline(params)
+    if constrained is None:
+        constrained = exact_constrained_baseline(params)
 
     # 19c: Predictivity impact
     predictivity = predictivity_from_width_precision(params, constrained)
@@ -2717,6 +3946,51 @@ def stabilized_width(q: float, params: Dict, lam: float,
     return w_star, F_star, V_star
 
 
+def stabilized_width_batch(q_values: np.ndarray, params: Dict, lam: float,
+                           w_bounds: tuple = (0.1, 2.0),
+                           method: str = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    [Dc] w*(q) for a whole q array.
+
+    'quad' loops stabilized_width (reference, minimize_scalar per q);
+    'gauss_laguerre' runs one array-wise golden-section search over all q
+    with batched V(q_i; w_i). Same boundary convention (Aq ≈ 0 → w_ref).
+
+    Returns: (w_star, F_star, V_star) arrays
+    """
+    method = method or RADIAL_QUADRATURE
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+
+    if method == 'quad':
+        out = np.array([stabilized_width(q, params, lam, w_bounds) for q in q_values])
+        return out[:, 0], out[:, 1], out[:, 2]
+
+    profile_type = params.get('profile_type', 'parabolic')
+    active = np.abs(amplitude_factor(q_values, profile_type)) >= 1e-10
+    w_star = np.full(len(q_values), params.get('w', 0.5), dtype=float)
+    F_star = np.zeros(len(q_values))
+    V_star = np.zeros(len(q_values))
+
+    q_act = q_values[active]
+    if len(q_act):
+        n_lanes = len(q_act)
+
+        def objective(w):
+            # w holds one or more positions per lane (lane-major)
+            q_rep = np.repeat(q_act, len(w) // n_lanes)
+            V, _ = compute_VM_pairs(q_rep, w, params, method=method)
+            return V + lam / (w * w)
+
+        lo = np.full(n_lanes, w_bounds[0])
+        hi = np.full(n_lanes, w_bounds[1])
+        w_act, F_act = golden_section_minimize_batch(objective, lo, hi)
+        w_star[active] = w_act
+        F_star[active] = F_act
+        V_star[active] = compute_VM_pairs(q_act, w_act, params, method=method)[0]
+
+    return w_star, F_star, V_star
+
+
 def baseline_exact_stabilized(params: Dict, Nq: int = 401) -> Dict:
     """
     [Dc] Step 20: EXACT_STABILIZED baseline with stabilized width.
@@ -2754,11 +4028,7 @@ def baseline_exact_stabilized(params: Dict, Nq: int = 401) -> Dict:
     # Compute w*(q) along the q-grid
     print(f"Computing w*(q) on {Nq}-point grid...")
     q_grid = np.linspace(0, 1, Nq)
-    w_star_grid = np.zeros(Nq)
-
-    for i, q in enumerate(q_grid):
-        w_star, _, _ = stabilized_width(q, params, lam)
-        w_star_grid[i] = w_star
+    w_star_grid, _, _ = stabilized_width_batch(q_grid, params, lam)
 
     # Statistics on stabilized width
     w_interior = w_star_grid[10:-10]
@@ -2780,8 +4050,7 @@ def baseline_exact_stabilized(params: Dict, Nq: int = 401) -> Dict:
     M0_stab = norm_stab['M0']
     VB_stab = norm_stab['VB']
 
-    Mhat_stab = np.array([compute_Mtilde_exact(q, params_stab, M0_stab) for q in q_grid])
-    Vhat_stab = np.array([compute_Vtilde_exact(q, params_stab, VB_stab) for q in q_grid])
+    Mhat_stab, Vhat_stab = compute_hat_grid(q_grid, params_stab, M0_stab, VB_stab)
     Bhat_stab = compute_Btilde(q_grid, Mhat_stab, Vhat_stab, 0.0)
 
     # Compute original EXACT baseline for comparison
@@ -2789,8 +4058,7 @@ def baseline_exact_stabilized(params: Dict, Nq: int = 401) -> Dict:
     M0_orig = norm_orig['M0']
     VB_orig = norm_orig['VB']
 
-    Mhat_orig = np.array([compute_Mtilde_exact(q, params, M0_orig) for q in q_grid])
-    Vhat_orig = np.array([compute_Vtilde_exact(q, params, VB_orig) for q in q_grid])
+    Mhat_orig, Vhat_orig = compute_hat_grid(q_grid, params, M0_orig, VB_orig)
     Bhat_exact = compute_Btilde(q_grid, Mhat_orig, Vhat_orig, 0.0)
 
     # Compare
@@ -2855,15 +4123,13 @@ def width_to_B_budget(params: Dict, stabilized_data: Dict = None,
     params_plus = params.copy()
     params_plus['w'] = w_plus
     norm_plus = compute_normalization(params_plus)
-    Mhat_plus = np.array([compute_Mtilde_exact(q, params_plus, norm_plus['M0']) for q in q_grid])
-    Vhat_plus = np.array([compute_Vtilde_exact(q, params_plus, norm_plus['VB']) for q in q_grid])
+    Mhat_plus, Vhat_plus = compute_hat_grid(q_grid, params_plus, norm_plus['M0'], norm_plus['VB'])
     Bhat_plus = compute_Btilde(q_grid, Mhat_plus, Vhat_plus, 0.0)
 
     params_minus = params.copy()
     params_minus['w'] = w_minus
     norm_minus = compute_normalization(params_minus)
-    Mhat_minus = np.array([compute_Mtilde_exact(q, params_minus, norm_minus['M0']) for q in q_grid])
-    Vhat_minus = np.array([compute_Vtilde_exact(q, params_minus, norm_minus['VB']) for q in q_grid])
+    Mhat_minus, Vhat_minus = compute_hat_grid(q_grid, params_minus, norm_minus['M0'], norm_minus['VB'])
     Bhat_minus = compute_Btilde(q_grid, Mhat_minus, Vhat_minus, 0.0)
 
     # d ln B̂ / d ln w
@@ -2963,7 +4229,8 @@ def width_to_B_budget(params: Dict, stabilized_data: Dict = None,
 
 
 def authoritative_width_sensitivity(params: Dict = None, Nq: int = 401,
-                                     w_ref: float = 0.5, dw_frac: float = 0.01) -> Dict:
+                                     w_ref: float = 0.5, dw_frac: float = 0.01,
+                                     method: str = 'fd') -> Dict:
     """
     [Dc] Step 20 AUTHORITATIVE: Compute d ln B̂ / d ln w at w=w_ref.
 
@@ -2973,6 +4240,10 @@ def authoritative_width_sensitivity(params: Dict = None, Nq: int = 401,
     The sensitivity coefficient determines how width uncertainty propagates
     to bounce uncertainty: δB̂/B̂ = |d ln B̂/d ln w| × (δw/w).
 
+    method: 'fd' (reference) re-runs normalization + grid at w ± dw;
+            'complex_step' takes the slope from bhat_parameter_gradient in one
+            pass (Bhat_plus/minus are then the first-order values at w ± dw).
+
     Returns:
         Dict with:
         - dlnB_dlnw: local sensitivity at w_ref
@@ -2988,12 +4259,22 @@ def authoritative_width_sensitivity(params: Dict = None, Nq: int = 401,
 
     # Compute B̂ at w_ref, w_ref ± dw
     results = {}
-    for label, w in [('ref', w_ref), ('plus', w_ref + dw), ('minus', w_ref - dw)]:
+    if method == 'complex_step':
+        params_w = params.copy()
+        params_w['w'] = w_ref
+        grad = bhat_parameter_gradient(params_w, Nq=Nq, thetas=('w',), verbose=False)
+        results['ref'] = grad['Bhat']
+        results['plus'] = grad['Bhat'] + grad['gradient']['w'] * dw
+        results['minus'] = grad['Bhat'] - grad['gradient']['w'] * dw
+    elif method != 'fd':
+        raise ValueError(f"Unknown sensitivity method: {method}")
+
+    for label, w in ([('ref', w_ref), ('plus', w_ref + dw), ('minus', w_ref - dw)]
+                     if method == 'fd' else []):
         params_w = params.copy()
         params_w['w'] = w
         norm = compute_normalization(params_w)
-        Mhat = np.array([compute_Mtilde_exact(q, params_w, norm['M0']) for q in q_grid])
-        Vhat = np.array([compute_Vtilde_exact(q, params_w, norm['VB']) for q in q_grid])
+        Mhat, Vhat = compute_hat_grid(q_grid, params_w, norm['M0'], norm['VB'])
         Bhat = compute_Btilde(q_grid, Mhat, Vhat, 0.0)
         results[label] = Bhat
 
@@ -3025,7 +4306,8 @@ def authoritative_width_sensitivity(params: Dict = None, Nq: int = 401,
     }
 
 
-def step20_tau_sensitivity_budget(params: Dict = None, B_over_hbar: float = 48.0) -> Dict:
+def step20_tau_sensitivity_budget(params: Dict = None, B_over_hbar: float = 48.0,
+                                  sens: Dict = None, constrained: Dict = None) -> Dict:
     """
     [DIAG] Step 20: τ diagnostic uncertainty budget from width contribution.
 
@@ -3039,6 +4321,9 @@ def step20_tau_sensitivity_budget(params: Dict = None, B_over_hbar: float = 48.0
     With the RMS constraint, δw/w depends on δR0/R0, which is [Def] = 0
     if R0 is a baseline definition, or depends on derivation if R0 is derived.
 
+    sens / constrained: precomputed authoritative_width_sensitivity(params) and
+    exact_constrained_baseline(params); computed here when omitted.
+
     Returns:
         Dict with sensitivity budget entries
     """
@@ -3046,12 +4331,14 @@ def step20_tau_sensitivity_budget(params: Dict = None, B_over_hbar: float = 48.0
         params = PARAMS
 
     # Get authoritative sensitivity
-    sens = authoritative_width_sensitivity(params)
+    if sens is None:
+        sens = authoritative_width_sensitivity(params)
     dlnB_dlnw = sens['dlnB_dlnw']
     Bhat_ref = sens['Bhat_ref']
 
     # Get constrained baseline from Step 19b
-    constrained = exact_constrained_baseline(params)
+    if constrained is None:
+        constrained = exact_constrained_baseline(params)
     w_constrained = constrained['w_constrained']
     R0 = constrained['R0']
 
@@ -3098,7 +4385,7 @@ def step20_tau_sensitivity_budget(params: Dict = None, B_over_hbar: float = 48.0
     }
 
 
-def step20_complete(params: Dict = None) -> Dict:
+def step20_complete(params: Dict = None, sens: Dict = None, constrained: Dict = None) -> Dict:
     """
     [Dc] Run complete Step 20 analysis (PATCHED: reconciled with Step 19).
 
@@ -3107,6 +4394,9 @@ def step20_complete(params: Dict = None) -> Dict:
     - Computes authoritative d ln B̂ / d ln w
     - Provides τ diagnostic uncertainty budget for width contribution
     - Keeps λ-regularizer as DIAG alternative only
+
+    sens / constrained: precomputed width sensitivity and constrained
+    baseline (step graph); shared with 20c instead of recomputed.
     """
     if params is None:
         params = PARAMS
@@ -3127,7 +4417,8 @@ def step20_complete(params: Dict = None) -> Dict:
     print("-" * 70)
     print("STEP 20a: AUTHORITATIVE WIDTH SENSITIVITY [Dc]")
     print("-" * 70)
-    sens = authoritative_width_sensitivity(params)
+    if sens is None:
+        sens = authoritative_width_sensitivity(params)
     print(f"  B̂ at w=0.5:    {sens['Bhat_ref']:.6f}")
     print(f"  B̂ at w=0.495:  {sens['Bhat_minus']:.6f}")
     print(f"  B̂ at w=0.505:  {sens['Bhat_plus']:.6f}")
@@ -3139,7 +4430,8 @@ def step20_complete(params: Dict = None) -> Dict:
     print("-" * 70)
     print("STEP 20b: STEP 19b CLOSURE (RMS CONSTRAINT) [Dc]")
     print("-" * 70)
-    constrained = exact_constrained_baseline(params)
+    if constrained is None:
+        constrained = exact_constrained_baseline(params)
     print(f"  R0 = {constrained['R0']:.6f} [Def]")
     print(f"  w* = R0/√(5/2) = {constrained['w_constrained']:.4f}")
     print(f"  B̂_constrained = {constrained['Bhat_constrained']:.6f}")
@@ -3149,7 +4441,7 @@ def step20_complete(params: Dict = None) -> Dict:
     print("-" * 70)
     print("STEP 20c: τ DIAGNOSTIC UNCERTAINTY BUDGET [DIAG]")
     print("-" * 70)
-    budget = step20_tau_sensitivity_budget(params)
+    budget = step20_tau_sensitivity_budget(params, sens=sens, constrained=constrained)
     print(f"  Using B/ℏ ≈ {budget['B_over_hbar']} from calibration")
     print()
     print("  Width → Bounce → Lifetime propagation:")
@@ -3345,14 +4637,7 @@ def integrand_surrogate_fit(q_grid: np.ndarray, I_exact_values: np.ndarray,
     A = basis * prefactor[:, np.newaxis]
 
     # Weights
-    if weight_type == 'uniform':
-        w = np.ones_like(I_exact_values)
-    elif weight_type == 'integrand':
-        w = np.maximum(I_exact_values, 1e-15)
-    elif weight_type == 'integrand_sq':
-        w = np.maximum(I_exact_values ** 2, 1e-30)
-    else:
-        raise ValueError(f"Unknown weight_type: {weight_type}")
+    w = _surrogate_weights(I_exact_values, weight_type)
 
     # Weighted least squares: minimize ||W^{1/2}(Ax - b)||²
     W_sqrt = np.diag(np.sqrt(w))
@@ -3388,7 +4673,8 @@ def integrand_surrogate_fit(q_grid: np.ndarray, I_exact_values: np.ndarray,
 
 def step21_fit_convergence(params: Dict = None, Nq: int = 401,
                            orders: List[int] = [1, 2, 3, 4, 5, 6],
-                           weight_type: str = 'uniform') -> Dict:
+                           weight_type: str = 'uniform',
+                           engine: str = 'lstsq') -> Dict:
     """
     [Dc] Step 21: Convergence study for integrand surrogate fitting.
 
@@ -3399,6 +4685,8 @@ def step21_fit_convergence(params: Dict = None, Nq: int = 401,
         Nq: grid size (default 401 for reproducibility)
         orders: list of basis orders to test
         weight_type: weighting scheme for fit
+        engine: 'lstsq' refits each order (reference); 'incremental' takes
+                all orders from one surrogate_fit_all_orders QR
 
     Returns:
         Dict with convergence table and achieved precision
@@ -3418,8 +4706,7 @@ def step21_fit_convergence(params: Dict = None, Nq: int = 401,
     norm = compute_normalization(params)
     M0, VB = norm['M0'], norm['VB']
 
-    Mhat = np.array([compute_Mtilde_exact(q, params, M0) for q in q_grid])
-    Vhat = np.array([compute_Vtilde_exact(q, params, VB) for q in q_grid])
+    Mhat, Vhat = compute_hat_grid(q_grid, params, M0, VB)
 
     # Compute exact integrand
     I_exact = np.array([integrand_exact(q_grid[i], Mhat[i], Vhat[i])
@@ -3439,9 +4726,18 @@ def step21_fit_convergence(params: Dict = None, Nq: int = 401,
     results = []
     target_pct = 0.2  # Target: ≤0.2%
 
+    if engine == 'incremental':
+        all_fits = surrogate_fit_all_orders(q_grid, I_exact, max_order=max(orders),
+                                            basis='step21', weight_type=weight_type)['fits']
+    elif engine != 'lstsq':
+        raise ValueError(f"Unknown surrogate engine: {engine}")
+
     for order in orders:
-        fit = integrand_surrogate_fit(q_grid, I_exact, order=order,
-                                       weight_type=weight_type)
+        if engine == 'incremental':
+            fit = all_fits[order]
+        else:
+            fit = integrand_surrogate_fit(q_grid, I_exact, order=order,
+                                          weight_type=weight_type)
         I_sur = fit['I_sur_values']
 
         # Compute surrogate bounce by direct integration
@@ -3578,7 +4874,7 @@ def step21_tau_closure(params: Dict = None, Nq: int = 401,
     }
 
 
-def step21_complete(params: Dict = None, Nq: int = 401) -> Dict:
+def step21_complete(params: Dict = None, Nq: int = 401, sens: Dict = None) -> Dict:
     """
     [Dc] Run complete Step 21 analysis: integrand-level surrogate and predictivity closure.
 
@@ -3594,6 +4890,7 @@ def step21_complete(params: Dict = None, Nq: int = 401) -> Dict:
     Args:
         params: parameter dict (uses PARAMS if None)
         Nq: grid size (default 401)
+        sens: precomputed authoritative_width_sensitivity(params, Nq=Nq)
 
     Returns:
         Dict with complete Step 21 results
@@ -3619,7 +4916,8 @@ def step21_complete(params: Dict = None, Nq: int = 401) -> Dict:
     print()
 
     # Get width sensitivity for context
-    sens = authoritative_width_sensitivity(params, Nq=Nq)
+    if sens is None or sens['Nq'] != Nq:
+        sens = authoritative_width_sensitivity(params, Nq=Nq)
     print(f"Width sensitivity (from Step 20): d ln B̂/d ln w = {sens['dlnB_dlnw']:.6f}")
     print("  → Width contribution to τ is NEGLIGIBLE (closed in Step 20)")
     print()
@@ -3725,14 +5023,7 @@ def step22_surrogate_fit(q_grid: np.ndarray, I_exact_values: np.ndarray,
     A = basis * prefactor[:, np.newaxis]
 
     # Weights
-    if weight_type == 'uniform':
-        w = np.ones_like(I_exact_values)
-    elif weight_type == 'integrand':
-        w = np.maximum(I_exact_values, 1e-15)
-    elif weight_type == 'integrand_sq':
-        w = np.maximum(I_exact_values ** 2, 1e-30)
-    else:
-        raise ValueError(f"Unknown weight_type: {weight_type}")
+    w = _surrogate_weights(I_exact_values, weight_type)
 
     # Weighted least squares
     W_sqrt = np.diag(np.sqrt(w))
@@ -3763,6 +5054,114 @@ def step22_surrogate_fit(q_grid: np.ndarray, I_exact_values: np.ndarray,
     }
 
 
+# -----------------------------------------------------------------------------
+# INCREMENTAL ALL-ORDERS SURROGATE ENGINE [Dc]
+# -----------------------------------------------------------------------------
+# All surrogate bases are nested: the order-k design matrix is the first k
+# columns of the order-K one. A single Householder QR of the max-order
+# weighted design matrix therefore contains the QR factorization of every
+# lower order (its leading k×k block of R and first k columns of Q), so
+# each order adds one column and costs one k×k triangular solve. Residual
+# norms follow from ‖b‖² − ‖Qᵀb[:k]‖² without refitting.
+
+SURROGATE_BASES = ('step21', 'fourier', 'chebyshev', 'legendre')
+
+
+def surrogate_basis_matrix(q: np.ndarray, order: int, basis: str = 'fourier') -> np.ndarray:
+    """
+    [Def] Symmetric surrogate basis φ_k(q), k < order, shape (len(q), order).
+
+    'step21'    — integrand_surrogate_basis (mixed cosine/polynomial, order ≤ 8)
+    'fourier'   — step22_high_precision_basis (cos 2πkq)
+    'chebyshev' — T_2k(2q−1), orthogonal on [0,1] and symmetric about q=½
+    'legendre'  — P_2k(2q−1), same with unit weight
+    """
+    q = np.atleast_1d(q)
+    if basis == 'step21':
+        return integrand_surrogate_basis(q, order)
+    if basis == 'fourier':
+        return step22_high_precision_basis(q, order)
+    if basis in ('chebyshev', 'legendre'):
+        family = np.polynomial.chebyshev if basis == 'chebyshev' else np.polynomial.legendre
+        x = 2.0 * q - 1.0
+        # Even-degree columns only (symmetry φ_k(q) = φ_k(1-q))
+        V = (family.chebvander if basis == 'chebyshev' else family.legvander)(x, 2 * (order - 1))
+        return V[:, 0::2]
+    raise ValueError(f"Unknown surrogate basis: {basis} (expected one of {SURROGATE_BASES})")
+
+
+def _surrogate_weights(I_exact_values: np.ndarray, weight_type: str) -> np.ndarray:
+    """[Def] Least-squares weights shared by the surrogate fits."""
+    if weight_type == 'uniform':
+        return np.ones_like(I_exact_values)
+    if weight_type == 'integrand':
+        return np.maximum(I_exact_values, 1e-15)
+    if weight_type == 'integrand_sq':
+        return np.maximum(I_exact_values ** 2, 1e-30)
+    raise ValueError(f"Unknown weight_type: {weight_type}")
+
+
+def surrogate_fit_all_orders(q_grid: np.ndarray, I_exact_values: np.ndarray,
+                             max_order: int = 10, basis: str = 'fourier',
+                             weight_type: str = 'uniform') -> Dict:
+    """
+    [Dc] Fit every surrogate order 1..max_order from one QR factorization.
+
+    I_sur^(k)(q) = q(1-q) Σ_{j<k} a_j φ_j(q), weighted least squares as in
+    integrand_surrogate_fit / step22_surrogate_fit.
+
+    Args:
+        q_grid: grid of q values
+        I_exact_values: exact integrand values
+        max_order: highest order (number of basis functions)
+        basis: one of SURROGATE_BASES
+        weight_type: 'uniform', 'integrand', or 'integrand_sq'
+
+    Returns:
+        Dict with 'fits' {order: fit dict with 'coeffs', 'I_sur_values',
+        'Bhat_sur' (full convention), 'rmse', 'rel_rmse_pct', 'max_abs_err',
+        'weighted_residual', 'cond_R'}, plus 'basis', 'weight_type', 'max_order'.
+    """
+    from scipy.linalg import solve_triangular
+
+    q_grid = np.asarray(q_grid, dtype=float)
+    I_exact_values = np.asarray(I_exact_values, dtype=float)
+
+    prefactor = q_grid * (1.0 - q_grid)
+    A = surrogate_basis_matrix(q_grid, max_order, basis) * prefactor[:, np.newaxis]
+    w = _surrogate_weights(I_exact_values, weight_type)
+    w_sqrt = np.sqrt(w)
+
+    Q, R = np.linalg.qr(w_sqrt[:, np.newaxis] * A)
+    b = w_sqrt * I_exact_values
+    Qtb = Q.T @ b
+    b_norm_sq = float(b @ b)
+    I_mean = np.mean(I_exact_values)
+
+    fits = {}
+    for k in range(1, max_order + 1):
+        R_k = R[:k, :k]
+        coeffs = solve_triangular(R_k, Qtb[:k])
+        I_sur_values = A[:, :k] @ coeffs
+        residual = I_exact_values - I_sur_values
+        rmse = np.sqrt(np.mean(residual ** 2))
+        diag = np.abs(np.diag(R_k))
+        fits[k] = {
+            'coeffs': coeffs,
+            'order': k,
+            'I_sur_values': I_sur_values,
+            'Bhat_sur': bounce_full(I_sur_values, q_grid),
+            'rmse': rmse,
+            'rel_rmse_pct': rmse / I_mean * 100 if I_mean > 0 else 0,
+            'max_abs_err': np.max(np.abs(residual)),
+            'weighted_residual': np.sqrt(max(b_norm_sq - float(Qtb[:k] @ Qtb[:k]), 0.0)),
+            'cond_R': float(np.linalg.cond(R_k)) if diag.min() > 0 else np.inf,
+            'weight_type': weight_type,
+        }
+
+    return {'fits': fits, 'basis': basis, 'weight_type': weight_type, 'max_order': max_order}
+
+
 def step22_numerical_integration_check(q_grid: np.ndarray, I_values: np.ndarray,
                                         Nq_ref: int = 2001) -> Dict:
     """
@@ -3810,7 +5209,8 @@ def step22_numerical_integration_check(q_grid: np.ndarray, I_values: np.ndarray,
 
 def step22_convergence_study(params: Dict = None, Nq: int = 801,
                              orders: List[int] = None,
-                             weight_type: str = 'uniform') -> Dict:
+                             weight_type: str = 'uniform',
+                             engine: str = 'lstsq') -> Dict:
     """
     [Dc] Step 22: High-precision convergence study for integrand surrogate.
 
@@ -3827,6 +5227,8 @@ def step22_convergence_study(params: Dict = None, Nq: int = 801,
         Nq: grid size (increased for higher precision)
         orders: list of orders to test (default 1..10)
         weight_type: weighting scheme
+        engine: 'lstsq' refits each order (reference); 'incremental' takes
+                all orders from one surrogate_fit_all_orders QR
 
     Returns:
         Dict with convergence analysis and best result
@@ -3850,8 +5252,7 @@ def step22_convergence_study(params: Dict = None, Nq: int = 801,
     norm = compute_normalization(params)
     M0, VB = norm['M0'], norm['VB']
 
-    Mhat = np.array([compute_Mtilde_exact(q, params, M0) for q in q_grid])
-    Vhat = np.array([compute_Vtilde_exact(q, params, VB) for q in q_grid])
+    Mhat, Vhat = compute_hat_grid(q_grid, params, M0, VB)
 
     # Compute exact integrand
     I_exact = np.array([integrand_exact(q_grid[i], Mhat[i], Vhat[i])
@@ -3881,9 +5282,18 @@ def step22_convergence_study(params: Dict = None, Nq: int = 801,
     target_5pct = 0.104  # δB̂/B̂ for 5% τ target
     target_1pct = 0.021  # δB̂/B̂ for 1% τ target
 
+    if engine == 'incremental':
+        all_fits = surrogate_fit_all_orders(q_grid, I_exact, max_order=max(orders),
+                                            basis='fourier', weight_type=weight_type)['fits']
+    elif engine != 'lstsq':
+        raise ValueError(f"Unknown surrogate engine: {engine}")
+
     for order in orders:
-        fit = step22_surrogate_fit(q_grid, I_exact, order=order,
-                                   weight_type=weight_type)
+        if engine == 'incremental':
+            fit = all_fits[order]
+        else:
+            fit = step22_surrogate_fit(q_grid, I_exact, order=order,
+                                       weight_type=weight_type)
         I_sur = fit['I_sur_values']
 
         # Compute surrogate bounce
@@ -4132,7 +5542,7 @@ def step22_complete(params: Dict = None, Nq: int = 801) -> Dict:
 # =============================================================================
 
 def step24_repro_lock(params: Dict = None, Nq: int = 801, deterministic: bool = True,
-                      verify_frozen: bool = True) -> Dict:
+                      verify_frozen: bool = True, integrand: Dict = None) -> Dict:
     """
     [DIAG] Step 24: Reproducibility lock for Step 22/23 closure numbers.
 
@@ -4148,6 +5558,7 @@ def step24_repro_lock(params: Dict = None, Nq: int = 801, deterministic: bool =
         Nq: Grid size (default: 801)
         deterministic: If True (default), use fixed timestamp for byte-identical output
         verify_frozen: If True (default), verify data_sha256 matches frozen hash
+        integrand: precomputed interior_integrand_grid(params, Nq) (step graph)
 
     Returns:
         Dict with repro manifest and closure data
@@ -4212,24 +5623,9 @@ def step24_repro_lock(params: Dict = None, Nq: int = 801, deterministic: bool =
     print()
 
     # Compute exact B̂
-    q_grid = np.linspace(0, 1, Nq)
-    I_exact = np.zeros(Nq)
-    Mhat_vals = np.zeros(Nq)
-    Vhat_vals = np.zeros(Nq)
-
-    norm = compute_normalization(params)
-    M0, VB = norm['M0'], norm['VB']
-
-    for i, q in enumerate(q_grid):
-        if q < 1e-10 or q > 1 - 1e-10:
-            Mhat_vals[i] = 0.0
-            Vhat_vals[i] = 0.0
-        else:
-            Mtilde = compute_Mtilde_exact(q, params, M0)
-            Vtilde = compute_Vtilde_exact(q, params, VB)
-            Mhat_vals[i] = Mtilde
-            Vhat_vals[i] = Vtilde
-        I_exact[i] = np.sqrt(2 * max(0, Mhat_vals[i]) * max(0, Vhat_vals[i]))
+    if integrand is None or integrand['Nq'] != Nq:
+        integrand = interior_integrand_grid(params, Nq=Nq)
+    q_grid, I_exact = integrand['q_grid'], integrand['I_exact']
 
     # Compute exact B̂ using canonical convention helpers
     Bhat_half = bounce_half(I_exact, q_grid)
@@ -4480,7 +5876,7 @@ def step24_repro_lock(params: Dict = None, Nq: int = 801, deterministic: bool =
 # =============================================================================
 
 def step26_numerical_audit(params: Dict = None, verbose: bool = True, deterministic: bool = True,
-                           verify_frozen: bool = True) -> Dict:
+                           verify_frozen: bool = True, integrand: Dict = None) -> Dict:
     """
     [DIAG] Step 26: Numerical forensics audit for Step 22 closure.
 
@@ -4498,6 +5894,8 @@ def step26_numerical_audit(params: Dict = None, verbose: bool = True, determinis
         verbose: Print progress (default: True)
         deterministic: If True (default), use fixed timestamp for byte-identical output
         verify_frozen: If True (default), verify data_sha256 matches frozen hash (Step 29)
+        integrand: precomputed interior_integrand_grid(params) reused for the
+            Nq=801 grids (step graph)
 
     Returns:
         Dict with audit results suitable for JSON export
@@ -4566,24 +5964,13 @@ def step26_numerical_audit(params: Dict = None, verbose: bool = True, determinis
     # -------------------------------------------------------------------------
     # 2. Helper: compute exact integrand on a grid
     # -------------------------------------------------------------------------
-    def compute_I_exact_on_grid(Nq: int) -> tuple:
-        """Compute exact integrand I(q) = sqrt(2*M*V) on Nq-point grid."""
-        q_grid = np.linspace(0, 1, Nq)
-        I_exact = np.zeros(Nq)
-
-        norm = compute_normalization(params)
-        M0, VB = norm['M0'], norm['VB']
-
-        for i, q in enumerate(q_grid):
-            if q < 1e-10 or q > 1 - 1e-10:
-                Mhat = 0.0
-                Vhat = 0.0
-            else:
-                Mhat = compute_Mtilde_exact(q, params, M0)
-                Vhat = compute_Vtilde_exact(q, params, VB)
-            I_exact[i] = np.sqrt(2 * max(0, Mhat) * max(0, Vhat))
+    grids = {} if integrand is None else {integrand['Nq']: integrand}
 
-        return q_grid, I_exact
+    def compute_I_exact_on_grid(Nq: int) -> tuple:
+        """Compute exact integrand I(q) = sqrt(2*M*V) on Nq-point grid (once per Nq)."""
+        if Nq not in grids:
+            grids[Nq] = interior_integrand_grid(params, Nq=Nq)
+        return grids[Nq]['q_grid'], grids[Nq]['I_exact']
 
     # -------------------------------------------------------------------------
     # 3. QUADRATURE CROSS-CHECK
@@ -4618,18 +6005,12 @@ def step26_numerical_audit(params: Dict = None, verbose: bool = True, determinis
     q_gl = (xi + 1.0) / 2.0
     w_gl = wi / 2.0
 
-    # Evaluate integrand at GL points
-    norm = compute_normalization(params)
-    M0, VB = norm['M0'], norm['VB']
+    # Evaluate integrand at GL points (same normalization as the reference grid)
+    M0, VB = grids[Nq_quad]['M0'], grids[Nq_quad]['VB']
     I_gl = np.zeros(n_gl)
-    for i, q in enumerate(q_gl):
-        if q < 1e-10 or q > 1 - 1e-10:
-            Mhat = 0.0
-            Vhat = 0.0
-        else:
-            Mhat = compute_Mtilde_exact(q, params, M0)
-            Vhat = compute_Vtilde_exact(q, params, VB)
-        I_gl[i] = np.sqrt(2 * max(0, Mhat) * max(0, Vhat))
+    Mhat_gl, Vhat_gl = compute_interior_hat_grid(q_gl, params, M0, VB)
+    for i in range(n_gl):
+        I_gl[i] = np.sqrt(2 * max(0, Mhat_gl[i]) * max(0, Vhat_gl[i]))
 
     # Full bounce: factor of 2
     Bhat_half_gl = float(np.sum(w_gl * I_gl))
@@ -4795,6 +6176,14 @@ def step26_numerical_audit(params: Dict = None, verbose: bool = True, determinis
     fit_ridge_pass = delta_ridge <= fit_tol
     fit_all_pass = fit_qr_pass and fit_ridge_pass
 
+    # [DIAG] Conditioning of the order-`order` fit: production Fourier basis
+    # vs the orthogonal (even Chebyshev) basis spanning the same role
+    cond_by_basis = {
+        b: surrogate_fit_all_orders(q_grid_fit, I_exact_fit, max_order=order,
+                                    basis=b)['fits'][order]['cond_R']
+        for b in ('fourier', 'chebyshev')
+    }
+
     fit_conditioning_results = {
         'Nq': Nq_fit,
         'order': order,
@@ -4809,6 +6198,8 @@ def step26_numerical_audit(params: Dict = None, verbose: bool = True, determinis
         'qr_pass': fit_qr_pass,
         'ridge_pass': fit_ridge_pass,
         'all_pass': fit_all_pass,
+        'cond_R_fourier': cond_by_basis['fourier'],
+        'cond_R_chebyshev': cond_by_basis['chebyshev'],
     }
 
     if verbose:
@@ -4816,6 +6207,8 @@ def step26_numerical_audit(params: Dict = None, verbose: bool = True, determinis
         print(f"  Reference (lstsq):       B̂_sur = {Bhat_lstsq:.12f}")
         print(f"  QR-based solve:          B̂_sur = {Bhat_qr:.12f}  (Δ = {delta_qr:.8f}%)")
         print(f"  Ridge (λ={lam_ridge}): B̂_sur = {Bhat_ridge:.12f}  (Δ = {delta_ridge:.8f}%)")
+        print(f"  cond(R): Fourier = {cond_by_basis['fourier']:.3e}, "
+              f"Chebyshev = {cond_by_basis['chebyshev']:.3e}  [DIAG]")
         print(f"  Tolerance: {fit_tol}%")
         print(f"  QR-solve:   {'PASS' if fit_qr_pass else 'FAIL'}")
         print(f"  Ridge:      {'PASS' if fit_ridge_pass else 'FAIL'}")
@@ -5321,7 +6714,7 @@ def amplitude_super_gaussian(q: float, p: float = 3.0) -> float:
         p: Shape parameter (p=1 gives parabolic; p>1 steeper)
     """
     base = 4.0 * q * (1.0 - q)  # Parabolic with max=1 at q=0.5
-    # Scale by 0.25 to match parabolic peak
+    # Scale by 0.25 to match parabolic peak (array-native: q may be an array)
     return 0.25 * (base ** p)
 
 
@@ -5332,9 +6725,13 @@ def d_amplitude_super_gaussian_dq(q: float, p: float = 3.0) -> float:
     dA/dq = 0.25 * p * [4q(1-q)]^(p-1) * 4*(1-2q)
     """
     base = 4.0 * q * (1.0 - q)
-    if base < 1e-15:
-        return 0.0
-    return 0.25 * p * (base ** (p - 1)) * 4.0 * (1.0 - 2.0 * q)
+    if np.ndim(base) == 0:
+        if base < 1e-15:
+            return 0.0
+        return 0.25 * p * (base ** (p - 1)) * 4.0 * (1.0 - 2.0 * q)
+    safe = np.where(base < 1e-15, 1.0, base)
+    return np.where(base < 1e-15, 0.0,
+                    0.25 * p * (safe ** (p - 1)) * 4.0 * (1.0 - 2.0 * q))
 
 
 def amplitude_quartic(q: float) -> float:
@@ -5364,13 +6761,17 @@ def amplitude_spline(q: float) -> float:
     A(q) = 0.25 * [6t⁵ - 15t⁴ + 10t³] for the rise, mirrored for fall.
     Scaled by 0.25 so max = 0.25 at q=0.5 (matching parabolic peak).
     """
-    if q <= 0.5:
-        t = 2.0 * q  # Map [0, 0.5] → [0, 1]
-        raw = t * t * t * (10.0 - 15.0 * t + 6.0 * t * t)
-    else:
-        t = 2.0 * (1.0 - q)  # Map [0.5, 1] → [1, 0]
-        raw = t * t * t * (10.0 - 15.0 * t + 6.0 * t * t)
-    return 0.25 * raw
+    if np.ndim(q) == 0:
+        if q <= 0.5:
+            t = 2.0 * q  # Map [0, 0.5] → [0, 1]
+            raw = t * t * t * (10.0 - 15.0 * t + 6.0 * t * t)
+        else:
+            t = 2.0 * (1.0 - q)  # Map [0.5, 1] → [1, 0]
+            raw = t * t * t * (10.0 - 15.0 * t + 6.0 * t * t)
+        return 0.25 * raw
+    q = np.asarray(q, dtype=float)
+    t = np.where(q <= 0.5, 2.0 * q, 2.0 * (1.0 - q))  # Mirror about q = 1/2
+    return 0.25 * (t * t * t * (10.0 - 15.0 * t + 6.0 * t * t))
 
 
 def d_amplitude_spline_dq(q: float) -> float:
@@ -5381,16 +6782,22 @@ def d_amplitude_spline_dq(q: float) -> float:
                = 0.5 * [30t² - 60t³ + 30t⁴]
                = 15t²(1-t)²
     """
-    if q <= 0.5:
-        t = 2.0 * q
-        return 0.25 * 2.0 * 30.0 * t * t * ((1.0 - t) ** 2)
-    else:
-        t = 2.0 * (1.0 - q)
-        return -0.25 * 2.0 * 30.0 * t * t * ((1.0 - t) ** 2)
+    if np.ndim(q) == 0:
+        if q <= 0.5:
+            t = 2.0 * q
+            return 0.25 * 2.0 * 30.0 * t * t * ((1.0 - t) ** 2)
+        else:
+            t = 2.0 * (1.0 - q)
+            return -0.25 * 2.0 * 30.0 * t * t * ((1.0 - t) ** 2)
+    q = np.asarray(q, dtype=float)
+    rising = q <= 0.5
+    t = np.where(rising, 2.0 * q, 2.0 * (1.0 - q))
+    return np.where(rising, 1.0, -1.0) * (0.25 * 2.0 * 30.0 * t * t * ((1.0 - t) ** 2))
 
 
 def compute_bounce_with_profile(params: Dict, profile_func, d_profile_func,
-                                 Nq: int = 401, normalize: bool = True) -> Dict:
+                                 Nq: int = 401, normalize: bool = True,
+                                 method: str = None) -> Dict:
     """
     [Dc] Compute bounce integral using a specified profile function.
 
@@ -5400,11 +6807,16 @@ def compute_bounce_with_profile(params: Dict, profile_func, d_profile_func,
         d_profile_func: Function q → dA/dq derivative
         Nq: Grid resolution
         normalize: If True, normalize M and V to dimensionless forms
+        method: 'quad' (per-q closures, reference) or 'gauss_laguerre'
+                (batched); None selects RADIAL_QUADRATURE
 
     Returns:
         Dict with Bhat_full, Bhat_half, M0, VB, and arrays
     """
-    from scipy.integrate import quad
+
+    if (method or RADIAL_QUADRATURE) != 'quad':
+        return compute_bounce_profiles_batch(params, [(profile_func, d_profile_func)],
+                                             Nq=Nq, method=method)[0]
 
     A0 = params['A0']
     w = params['w']
@@ -5452,6 +6864,13 @@ def compute_bounce_with_profile(params: Dict, profile_func, d_profile_func,
         M_raw[i], _ = quad(M_integrand, 0, 20 * w, limit=200)
         V_raw[i], _ = quad(V_integrand, 0, 20 * w, limit=200)
 
+    return _bounce_from_raw_MV(q_grid, M_raw, V_raw)
+
+
+def _bounce_from_raw_MV(q_grid: np.ndarray, M_raw: np.ndarray, V_raw: np.ndarray) -> Dict:
+    """[Dc] Normalize raw M(q), V(q) and integrate the bounce (Step 31 convention)."""
+    Nq = len(q_grid)
+
     # Normalization — exclude endpoints to match canonical compute_normalization
     # which uses q_scan = np.linspace(0.01, 0.99, 99). We exclude ~1% at each end.
     n_exclude = max(1, Nq // 100)  # Exclude at least 1 point, ~1% of grid
@@ -5482,6 +6901,94 @@ def compute_bounce_with_profile(params: Dict, profile_func, d_profile_func,
     }
 
 
+# =============================================================================
+# ARRAY-NATIVE PROFILE FAMILIES [Def]
+# =============================================================================
+# Every member maps a q array to A(q) and dA/dq in one call. Bounces for a
+# whole list of families (or super-Gaussian exponents) are evaluated as a
+# single (P, Nq, n_nodes) tensor by compute_bounce_profiles_batch.
+
+PROFILE_FAMILIES = {
+    'gaussian': {
+        'name': 'Gaussian (baseline)',
+        'A': lambda q: amplitude_factor(q, 'parabolic'),
+        'dA': lambda q: d_amplitude_dq(q, 'parabolic'),
+    },
+    'supergauss_p3': {
+        'name': 'Super-Gaussian p=3',
+        'A': lambda q: amplitude_super_gaussian(q, p=3.0),
+        'dA': lambda q: d_amplitude_super_gaussian_dq(q, p=3.0),
+    },
+    'supergauss_p4': {
+        'name': 'Super-Gaussian p=4',
+        'A': lambda q: amplitude_super_gaussian(q, p=4.0),
+        'dA': lambda q: d_amplitude_super_gaussian_dq(q, p=4.0),
+    },
+    'quartic': {
+        'name': 'Quartic',
+        'A': amplitude_quartic,
+        'dA': d_amplitude_quartic_dq,
+    },
+    'spline': {
+        'name': 'Spline (C²)',
+        'A': amplitude_spline,
+        'dA': d_amplitude_spline_dq,
+    },
+}
+
+
+def super_gaussian_family(p_values) -> List[Tuple]:
+    """[Def] (A, dA/dq) pairs for a list of super-Gaussian exponents p."""
+    return [((lambda q, p=p: amplitude_super_gaussian(q, p=p)),
+             (lambda q, p=p: d_amplitude_super_gaussian_dq(q, p=p)))
+            for p in p_values]
+
+
+def _eval_profile_on_grid(func, q_grid: np.ndarray) -> np.ndarray:
+    """[Def] Evaluate a profile on a grid; scalar-only callables are looped."""
+    try:
+        values = np.asarray(func(q_grid), dtype=float)
+        if values.shape == q_grid.shape:
+            return values
+        return np.broadcast_to(values, q_grid.shape).copy()
+    except (TypeError, ValueError):
+        return np.array([func(q) for q in q_grid], dtype=float)
+
+
+def compute_bounce_profiles_batch(params: Dict, profiles: List, Nq: int = 401,
+                                  method: str = None) -> List[Dict]:
+    """
+    [Dc] Bounce integrals for many profile families in one batched pass.
+
+    Args:
+        params: Parameter dict (A0, w, ell, sigma)
+        profiles: list of PROFILE_FAMILIES keys or (A, dA/dq) callable pairs
+        Nq: Grid resolution
+        method: 'quad' loops compute_bounce_with_profile (reference);
+                'gauss_laguerre' evaluates the (P, Nq, n) tensor at once.
+                None selects RADIAL_QUADRATURE.
+
+    Returns:
+        List of dicts (same layout as compute_bounce_with_profile), in order
+    """
+    method = method or RADIAL_QUADRATURE
+    pairs = [(PROFILE_FAMILIES[p]['A'], PROFILE_FAMILIES[p]['dA']) if isinstance(p, str) else p
+             for p in profiles]
+
+    if method == 'quad':
+        return [compute_bounce_with_profile(params, A, dA, Nq=Nq, method='quad')
+                for A, dA in pairs]
+    if method != 'gauss_laguerre':
+        raise ValueError(f"Unknown radial quadrature method: {method}")
+
+    q_grid = np.linspace(0, 1, Nq)
+    A_stack = np.stack([_eval_profile_on_grid(A, q_grid) for A, _ in pairs])
+    dA_stack = np.stack([_eval_profile_on_grid(dA, q_grid) for _, dA in pairs])
+    M_raw, V_raw = _MV_from_amplitudes(A_stack, dA_stack, params, RADIAL_NODES)
+
+    return [_bounce_from_raw_MV(q_grid, M_raw[k], V_raw[k]) for k in range(len(pairs))]
+
+
 def step31_model_form_audit(params: Dict = None, Nq: int = 401,
                              deterministic: bool = True, verbose: bool = True) -> Dict:
     """
@@ -5539,38 +7046,15 @@ def step31_model_form_audit(params: Dict = None, Nq: int = 401,
     w_baseline = params.get('w', 0.5)
     R0_baseline = w_baseline * np.sqrt(5.0 / 2.0)
 
-    # Define profile families
+    # Define profile families (array-native registry members)
     profile_families = [
         {
-            'name': 'Gaussian (baseline)',
-            'short': 'gaussian',
-            'func': lambda q: amplitude_factor(q, 'parabolic'),
-            'd_func': lambda q: d_amplitude_dq(q, 'parabolic'),
-        },
-        {
-            'name': 'Super-Gaussian p=3',
-            'short': 'supergauss_p3',
-            'func': lambda q: amplitude_super_gaussian(q, p=3.0),
-            'd_func': lambda q: d_amplitude_super_gaussian_dq(q, p=3.0),
-        },
-        {
-            'name': 'Super-Gaussian p=4',
-            'short': 'supergauss_p4',
-            'func': lambda q: amplitude_super_gaussian(q, p=4.0),
-            'd_func': lambda q: d_amplitude_super_gaussian_dq(q, p=4.0),
-        },
-        {
-            'name': 'Quartic',
-            'short': 'quartic',
-            'func': amplitude_quartic,
-            'd_func': d_amplitude_quartic_dq,
-        },
-        {
-            'name': 'Spline (C²)',
-            'short': 'spline',
-            'func': amplitude_spline,
-            'd_func': d_amplitude_spline_dq,
-        },
+            'name': PROFILE_FAMILIES[short]['name'],
+            'short': short,
+            'func': PROFILE_FAMILIES[short]['A'],
+            'd_func': PROFILE_FAMILIES[short]['dA'],
+        }
+        for short in ('gaussian', 'supergauss_p3', 'supergauss_p4', 'quartic', 'spline')
     ]
 
     # Constraint variations (as fractions of baseline)
@@ -5623,20 +7107,26 @@ def step31_model_form_audit(params: Dict = None, Nq: int = 401,
         print(f"{'Profile':<22} | {'Constraint':<12} | {'B̂_full':<12} | {'δB̂/B̂ (%)':<10} | {'δτ/τ (%)':<10}")
         print("-" * 70)
 
+    # All profile families share one batched pass per constraint (width)
+    case_results = {}
+    for constraint in constraint_variations:
+        params_case = params.copy()
+        params_case['w'] = w_baseline * constraint['factor']
+        batch = compute_bounce_profiles_batch(
+            params_case,
+            [(profile['func'], profile['d_func']) for profile in profile_families],
+            Nq=Nq
+        )
+        for profile, case_result in zip(profile_families, batch):
+            case_results[(profile['short'], constraint['short'])] = case_result
+
     for profile in profile_families:
         for constraint in constraint_variations:
             # Apply constraint to width
             w_case = w_baseline * constraint['factor']
-            params_case = params.copy()
-            params_case['w'] = w_case
-
-            # Compute bounce
-            case_result = compute_bounce_with_profile(
-                params_case,
-                profile['func'],
-                profile['d_func'],
-                Nq=Nq
-            )
+
+            # Bounce from the batched pass
+            case_result = case_results[(profile['short'], constraint['short'])]
             Bhat_case = case_result['Bhat_full']
 
             # Compute deltas relative to baseline
@@ -6123,14 +7613,11 @@ def step32_profile_canonicalization(params: Dict = None, Nq: int = 401,
     # 4. COMPUTE BOUNCE ACTION FOR CANONICAL PROFILE
     # =========================================================================
 
-    # Compute B̂ for canonical profile
-    bounce_canon = compute_bounce_with_profile(
-        params, profile_canonical, d_profile_canonical, Nq=Nq
-    )
-
-    # Compute B̂ for pure parabolic baseline
-    bounce_para = compute_bounce_with_profile(
-        params, profile_parabolic, d_profile_parabolic, Nq=Nq
+    # Compute B̂ for canonical profile and pure parabolic baseline (one batch)
+    bounce_canon, bounce_para = compute_bounce_profiles_batch(
+        params,
+        [(profile_canonical, d_profile_canonical), (profile_parabolic, d_profile_parabolic)],
+        Nq=Nq
     )
 
     Bhat_canon = bounce_canon['Bhat_full']
@@ -6392,6 +7879,706 @@ def extract_canonical_payload_step32(data: dict) -> dict:
     }
 
 
+# =============================================================================
+# STEP GRAPH RUNNER [Def]
+# =============================================================================
+# Each step declares its upstream steps, the params it reads, keyword
+# arguments and the artifacts it writes. The runner executes a requested
+# subset in dependency order and memoizes every step result under
+#
+#   input_hash = sha256(step code + kwargs + params + radial settings
+#                       + input_hash of every upstream step)
+#
+# "step code" is the source of the step function plus every module-level
+# function, class and constant it transitively references (found by walking
+# co_names of the code objects over this module's globals), so editing a
+# helper such as compute_hat_grid re-runs exactly the steps that reach it.
+# Runtime knobs that do not change results (WORKERS, cache directories)
+# are left out.
+#
+# A step is SKIPPED when its input_hash matches the last run, its pickled
+# result is present and its declared artifacts still exist.
+#
+# Intermediates used by several steps (normalization, constrained baseline,
+# width sensitivity, the Nq=801 interior integrand) are graph nodes of their
+# own. 'inputs' maps a step keyword to the upstream node whose result is
+# passed in, so each is computed once per run. The normalization result is
+# also seeded into the content-keyed cache above (in the parent and in every
+# pool worker), so helpers that call compute_normalization(PARAMS) deep
+# inside a step reuse it instead of recomputing.
+
+STEP_CACHE_DIR = None                 # None → <script dir>/generated/step_cache
+_STEP_HASH_RUNTIME_NAMES = ('WORKERS', 'POOL_CHUNK_SIZE', 'NORMALIZATION_DISK_CACHE',
+                            'STEP_CACHE_DIR')
+
+
+def _step_source_hash(func) -> str:
+    """
+    [Def] SHA256 of func's source and of every module-level function, class
+    and constant it transitively references.
+
+    Instrumented functions are hashed through their originals, so
+    --instrument does not invalidate memoized steps.
+    """
+    import types
+    import hashlib
+    import inspect
+    g = globals()
+    seen_names, seen_objs, parts = set(), set(), []
+
+    def code_names(code):
+        names = set(code.co_names)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                names |= code_names(const)
+        return names
+
+    def visit_name(name):
+        if name in seen_names or name not in g or name in _STEP_HASH_RUNTIME_NAMES:
+            return
+        seen_names.add(name)
+        obj = _INSTRUMENT_ORIGINALS.get(name, g[name])
+        if name.startswith('_') and not isinstance(obj, (types.FunctionType, type)):
+            return  # Private caches and logs
+        visit(obj, name)
+
+    def visit(obj, label):
+        if isinstance(obj, (types.FunctionType, type)):
+            obj = inspect.unwrap(obj) if isinstance(obj, types.FunctionType) else obj
+            if getattr(obj, '__module__', None) != __name__ or id(obj) in seen_objs:
+                return
+            seen_objs.add(id(obj))
+            try:
+                parts.append(inspect.getsource(obj))
+            except (OSError, TypeError):
+                parts.append(f'{label}:{obj!r}')
+            codes = ([obj.__code__] if isinstance(obj, types.FunctionType) else
+                     [m.__code__ for m in vars(obj).values() if isinstance(m, types.FunctionType)])
+            for name in sorted(set().union(*map(code_names, codes))):
+                visit_name(name)
+        elif isinstance(obj, dict):
+            for key in sorted(obj, key=repr):
+                visit(obj[key], f'{label}[{key!r}]')
+        elif isinstance(obj, (list, tuple)):
+            for i, item in enumerate(obj):
+                visit(item, f'{label}[{i}]')
+        elif isinstance(obj, (bool, int, float, str, type(None))):
+            parts.append(f'{label}={obj!r}')
+
+    visit(func, func.__name__)
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _step_graph(deterministic: bool = True) -> Dict:
+    """[Def] Declarative step graph: name → {func, deps, inputs, kwargs, artifacts}."""
+    return {
+        'normalization': {'func': compute_normalization, 'deps': [],
+                          'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'baseline':      {'func': baseline_registry, 'deps': ['normalization'],
+                          'inputs': {'norm': 'normalization'},
+                          'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'constrained_baseline': {'func': exact_constrained_baseline, 'deps': ['normalization'],
+                                 'inputs': {'norm': 'normalization'},
+                                 'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'width_sensitivity': {'func': authoritative_width_sensitivity, 'deps': ['normalization'],
+                              'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'interior_integrand': {'func': interior_integrand_grid, 'deps': ['normalization'],
+                               'inputs': {'norm': 'normalization'},
+                               'args': (PARAMS,), 'kwargs': {'Nq': 801}, 'artifacts': []},
+        'step14':        {'func': uncertainty_budget, 'deps': ['normalization'],
+                          'inputs': {'norm': 'normalization'},
+                          'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'step15':        {'func': profile_robustness, 'deps': [],
+                          'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'step19':        {'func': step19_complete, 'deps': ['constrained_baseline'],
+                          'inputs': {'constrained': 'constrained_baseline'},
+                          'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'step20':        {'func': step20_complete,
+                          'deps': ['step19', 'width_sensitivity', 'constrained_baseline'],
+                          'inputs': {'sens': 'width_sensitivity',
+                                     'constrained': 'constrained_baseline'},
+                          'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'step21':        {'func': step21_complete, 'deps': ['normalization', 'width_sensitivity'],
+                          'inputs': {'sens': 'width_sensitivity'},
+                          'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'step22':        {'func': step22_complete, 'deps': ['normalization', 'step21'],
+                          'args': (PARAMS,), 'kwargs': {}, 'artifacts': []},
+        'step24':        {'func': step24_repro_lock, 'deps': ['step22', 'interior_integrand'],
+                          'inputs': {'integrand': 'interior_integrand'},
+                          'args': (), 'kwargs': {'deterministic': deterministic},
+                          'artifacts': ['step22_closure.json']},
+        'step26':        {'func': step26_numerical_audit, 'deps': ['step24', 'interior_integrand'],
+                          'inputs': {'integrand': 'interior_integrand'},
+                          'args': (), 'kwargs': {'deterministic': deterministic},
+                          'artifacts': ['step26_numerical_audit.json']},
+        'step28':        {'func': step28_hash_stability_tests, 'deps': ['step24'],
+                          'args': (), 'kwargs': {}, 'artifacts': []},
+        'step29':        {'func': step29_release_audit, 'deps': ['step24', 'step26', 'step28'],
+                          'args': (), 'kwargs': {}, 'artifacts': []},
+        'step31':        {'func': step31_model_form_audit, 'deps': [],
+                          'args': (), 'kwargs': {'deterministic': deterministic},
+                          'artifacts': ['step31_modelform_audit.json']},
+        'step32':        {'func': step32_profile_canonicalization, 'deps': ['step31'],
+                          'args': (), 'kwargs': {'deterministic': deterministic},
+                          'artifacts': ['step32_profile_canonical.json']},
+    }
+
+
+STEP_NAMES = tuple(_step_graph().keys())
+
+
+def _resolve_step_order(targets: List[str], graph: Dict) -> List[str]:
+    """[Def] Targets plus all upstream steps, in dependency order."""
+    order = []
+
+    def visit(name, stack=()):
+        if name not in graph:
+            raise ValueError(f"Unknown step: {name} (known: {', '.join(graph)})")
+        if name in stack:
+            raise ValueError(f"Cycle in step graph: {' → '.join(stack + (name,))}")
+        for dep in graph[name]['deps']:
+            visit(dep, stack + (name,))
+        if name not in order:
+            order.append(name)
+
+    for t in targets:
+        visit(t)
+    return order
+
+
+def _step_input_hash(name: str, node: Dict, upstream: Dict[str, str]) -> str:
+    """[Def] Content hash of everything a step reads."""
+    import json
+    import hashlib
+    payload = {
+        'step': name,
+        'source': _step_source_hash(node['func']),
+        'args': node['args'],
+        'kwargs': node['kwargs'],
+        'params': PARAMS,
+        'radial': [RADIAL_QUADRATURE, RADIAL_NODES],
+        'upstream': {d: upstream[d] for d in node['deps']},
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=repr)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _run_graph_step(args: tuple) -> tuple:
+    """[Def] Pool work item: run one graph step with captured stdout."""
+    import io
+    import pickle
+    import contextlib
+    name, deterministic, inputs, norm = args
+    if norm is not None:
+        _seed_normalization_cache(PARAMS, norm)
+    node = _step_graph(deterministic)[name]
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        result = node['func'](*node['args'], **node['kwargs'], **inputs)
+    try:
+        pickle.dumps(result)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None, buf.getvalue(), False
+    return result, buf.getvalue(), True
+
+
+def run_step_graph(targets: List[str], force: bool = False,
+                   deterministic: bool = True, workers: int = None) -> Dict:
+    """
+    [DIAG] Run the requested steps (plus dependencies), skipping unchanged ones.
+
+    Args:
+        targets: step names from STEP_NAMES
+        force: re-run every step regardless of cached input hashes
+        deterministic: passed to the artifact-writing steps
+        workers: processes for independent steps (None → WORKERS); steps
+                 whose dependencies are satisfied run as one parallel wave
+
+    Returns dict with 'results' (step → result), 'status' (step → 'RUN'/'SKIP'),
+    'input_hashes' and 'manifest_path'.
+    """
+    import json
+    import pickle
+    from pathlib import Path
+
+    graph = _step_graph(deterministic)
+    order = _resolve_step_order(targets, graph)
+
+    generated_dir = Path(__file__).parent / 'generated'
+    cache_dir = Path(STEP_CACHE_DIR) if STEP_CACHE_DIR else generated_dir / 'step_cache'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = cache_dir / 'manifest.json'
+    manifest = {}
+    if manifest_path.exists():
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+
+    print("=" * 70)
+    print("STEP GRAPH RUNNER")
+    print("=" * 70)
+    print(f"  Requested: {', '.join(targets)}")
+    print(f"  Order:     {' → '.join(order)}")
+    print()
+
+    input_hashes, results, status = {}, {}, {}
+    to_run = []
+    for name in order:
+        node = graph[name]
+        h = _step_input_hash(name, node, input_hashes)
+        input_hashes[name] = h
+        pickle_path = cache_dir / f'{name}_{h[:16]}.pkl'
+        artifacts_ok = all((generated_dir / a).exists() for a in node['artifacts'])
+
+        entry = manifest.get(name, {})
+        if (not force and entry.get('input_hash') == h and artifacts_ok
+                and pickle_path.exists()):
+            with open(pickle_path, 'rb') as f:
+                results[name] = pickle.load(f)
+            status[name] = 'SKIP'
+            print(f"  [SKIP] {name:<14} inputs unchanged ({h[:12]})")
+        else:
+            to_run.append(name)
+
+    def record(name, result, memoizable=True):
+        h = input_hashes[name]
+        pickle_path = cache_dir / f'{name}_{h[:16]}.pkl'
+        results[name] = result
+        status[name] = 'RUN'
+        try:
+            if not memoizable:
+                raise TypeError(name)
+            with open(pickle_path, 'wb') as f:
+                pickle.dump(result, f)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            pickle_path.unlink(missing_ok=True)  # Not memoizable; re-runs next time
+        manifest[name] = {'input_hash': h, 'result_file': pickle_path.name}
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    def step_inputs(name):
+        # Upstream results handed to the step in place of recomputing them
+        return {kw: results[dep] for kw, dep in graph[name].get('inputs', {}).items()}
+
+    def shared_norm():
+        # Baseline normalization from the graph node (also when SKIPped)
+        norm = results.get('normalization')
+        if norm is not None:
+            _seed_normalization_cache(PARAMS, norm)
+        return norm
+
+    workers = WORKERS if workers is None else workers
+    while to_run:
+        # Wave: every pending step whose dependencies are all finished
+        wave = [n for n in to_run if all(d in status for d in graph[n]['deps'])]
+        to_run = [n for n in to_run if n not in wave]
+
+        if workers <= 1 or len(wave) == 1:
+            for name in wave:
+                print(f"  [RUN]  {name:<14} input_hash {input_hashes[name][:12]}")
+                shared_norm()
+                record(name, graph[name]['func'](*graph[name]['args'], **graph[name]['kwargs'],
+                                                 **step_inputs(name)))
+            continue
+
+        print(f"  [RUN]  {', '.join(wave)} in parallel ({workers} workers)")
+        norm = shared_norm()
+        outputs = _get_pool(workers).map(_run_graph_step,
+                                         [(n, deterministic, step_inputs(n), norm) for n in wave])
+        for name, (result, text, memoizable) in zip(wave, outputs):
+            # Captured output is replayed in declaration order
+            print(f"  [RUN]  {name:<14} input_hash {input_hashes[name][:12]}")
+            print(text, end='')
+            record(name, result, memoizable)
+
+    # Steps report their own pass flags under one of these keys
+    failed = [name for name in order if isinstance(results[name], dict) and any(
+        results[name].get(k) is False for k in ('guards_passed', 'overall_pass', 'all_pass'))]
+
+    print()
+    print("-" * 70)
+    print("STEP GRAPH SUMMARY:")
+    for name in order:
+        print(f"  {name:<14} {status[name]:<5} {'FAIL ✗' if name in failed else 'OK'}")
+    print("-" * 70)
+
+    return {'results': results, 'status': status, 'input_hashes': input_hashes,
+            'failed': failed, 'all_pass': not failed, 'manifest_path': str(manifest_path)}
+
+
+# =============================================================================
+# FAST vs REFERENCE EQUIVALENCE HARNESS [DIAG]
+# =============================================================================
+# Runs graph steps under the reference configuration and under a fast one,
+# flattens every numeric leaf of the returned dicts and diffs them against
+# per-field tolerances. Fields are addressed by dotted paths
+# ('results[3].Bhat_sur'); tolerance patterns are fnmatch globs on those
+# paths, first match wins. Hashes (any hex-digest string, whatever the field
+# name), the FROZEN verification derived from them, and timings are
+# expected to move and are only reported.
+
+EQUIVALENCE_REFERENCE_CONFIG = {'RADIAL_QUADRATURE': 'quad', 'NORMALIZATION_DISK_CACHE': None}
+EQUIVALENCE_FAST_CONFIG = {'RADIAL_QUADRATURE': 'gauss_laguerre', 'NORMALIZATION_DISK_CACHE': None}
+# step28/step29 re-run step24 internally and compare against frozen hashes
+EQUIVALENCE_DEFAULT_SKIP = ('step28', 'step29')
+EQUIVALENCE_TOLERANCES = [
+    ('*sha256*', None),                          # None → informational only
+    ('*frozen_result*', None),                   # expected/actual data hash + pass flag
+    ('*frozen_verified*', None),
+    ('*timestamp*', None),
+    ('*time_s*', None),
+    ('*w_star*', {'rtol': 1e-4, 'atol': 1e-5}),  # bounded-minimizer xatol
+    ('*delta_*', {'rtol': 1e-5, 'atol': 1e-8}),  # differences of near-equal B̂ (cancellation)
+    ('*', {'rtol': 1e-6, 'atol': 1e-12}),
+]
+
+
+def _flatten_outputs(obj, prefix: str = '', out: Dict = None) -> Dict:
+    """[Def] Dotted-path → leaf map of a step result (numbers, bools, strings, arrays)."""
+    if out is None:
+        out = {}
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            _flatten_outputs(v, f"{prefix}.{k}" if prefix else str(k), out)
+    elif isinstance(obj, (list, tuple)) and not all(isinstance(v, (int, float, np.number)) for v in obj):
+        for i, v in enumerate(obj):
+            _flatten_outputs(v, f"{prefix}[{i}]", out)
+    elif isinstance(obj, (list, tuple, np.ndarray)):
+        arr = np.asarray(obj)
+        if arr.dtype.kind in 'biuf':
+            out[prefix] = arr.astype(float)
+        elif arr.dtype == object:
+            for i, v in enumerate(arr.ravel()):
+                _flatten_outputs(v, f"{prefix}[{i}]", out)
+    elif isinstance(obj, (bool, np.bool_, str)) or obj is None:
+        out[prefix] = obj
+    elif isinstance(obj, (int, float, np.number)):
+        out[prefix] = float(obj)
+    return out
+
+
+def _is_hex_digest(value) -> bool:
+    """[Def] True for a hex digest string (sha256/md5-like: >= 32 hex chars)."""
+    import re
+    return isinstance(value, str) and re.fullmatch(r'[0-9a-f]{32,}', value) is not None
+
+
+def _field_tolerance(path: str, tolerances: List) -> dict:
+    """[Def] First tolerance whose glob matches path (None → informational)."""
+    import fnmatch
+    for pattern, tol in tolerances:
+        if fnmatch.fnmatch(path, pattern):
+            return tol
+    return None
+
+
+def compare_step_outputs(reference, fast, tolerances: List = None) -> Dict:
+    """
+    [DIAG] Diff two step results field by field.
+
+    Returns dict with 'n_fields', 'failures' (list of per-field records),
+    'max_rel_dev', 'max_rel_dev_field', 'informational_changes'.
+    """
+    tolerances = EQUIVALENCE_TOLERANCES if tolerances is None else tolerances
+    ref_flat, fast_flat = _flatten_outputs(reference), _flatten_outputs(fast)
+
+    failures, info = [], []
+    max_rel, max_field = 0.0, None
+    for path in sorted(set(ref_flat) | set(fast_flat)):
+        tol = _field_tolerance(path, tolerances)
+        if path not in ref_flat or path not in fast_flat:
+            (info if tol is None else failures).append({'field': path, 'reason': 'missing'})
+            continue
+        a, b = ref_flat[path], fast_flat[path]
+
+        if isinstance(a, np.ndarray) or isinstance(b, float) and isinstance(a, float):
+            a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+            if a.shape != b.shape:
+                failures.append({'field': path, 'reason': f'shape {a.shape} vs {b.shape}'})
+                continue
+            both_nan = np.isnan(a) & np.isnan(b)
+            diff = np.where(both_nan, 0.0, np.abs(a - b))
+            scale = np.maximum(np.abs(a), np.finfo(float).tiny)
+            rel = float(np.max(np.where(both_nan, 0.0, diff / scale))) if diff.size else 0.0
+            if tol is None:
+                if rel > 0:
+                    info.append({'field': path, 'rel_dev': rel})
+                continue
+            if rel > max_rel:
+                max_rel, max_field = rel, path
+            if diff.size and np.any(diff > tol['atol'] + tol['rtol'] * np.abs(a)):
+                failures.append({'field': path, 'rel_dev': rel, 'rtol': tol['rtol'],
+                                 'atol': tol['atol']})
+        elif a != b:
+            informational = tol is None or (_is_hex_digest(a) and _is_hex_digest(b))
+            (info if informational else failures).append(
+                {'field': path, 'reason': f'{a!r} → {b!r}'})
+
+    return {'n_fields': len(ref_flat), 'failures': failures, 'max_rel_dev': max_rel,
+            'max_rel_dev_field': max_field, 'informational_changes': info}
+
+
+def _apply_config(config: Dict) -> Dict:
+    """[Def] Set module-level configuration; returns the previous values."""
+    g = globals()
+    previous = {k: g[k] for k in config}
+    g.update(config)
+    clear_normalization_cache()
+    return previous
+
+
+def equivalence_harness(steps: List[str] = None, fast_config: Dict = None,
+                        reference_config: Dict = None, tolerances: List = None,
+                        deterministic: bool = True, report_path: str = None,
+                        verbose: bool = True) -> Dict:
+    """
+    [DIAG] Run each step in fast and reference configuration and diff outputs.
+
+    Each step is run directly (no step-graph memoization) with stdout
+    captured, fast first so artifacts in generated/ end up from the
+    reference run. Module configuration is restored afterwards.
+
+    Args:
+        steps: step names (default: STEP_NAMES minus EQUIVALENCE_DEFAULT_SKIP)
+        fast_config / reference_config: module globals to set per run
+        tolerances: [(glob, {'rtol', 'atol'} | None), ...]
+        deterministic: passed to artifact-writing steps
+        report_path: optional JSON report path
+        verbose: print the per-step table
+
+    Returns dict with per-step 'steps' records and 'all_pass'.
+    """
+    import io
+    import json
+    import time
+    import contextlib
+
+    steps = [n for n in STEP_NAMES if n not in EQUIVALENCE_DEFAULT_SKIP] if steps is None else steps
+    fast_config = EQUIVALENCE_FAST_CONFIG if fast_config is None else fast_config
+    reference_config = EQUIVALENCE_REFERENCE_CONFIG if reference_config is None else reference_config
+    graph = _step_graph(deterministic)
+    for name in steps:
+        if name not in graph:
+            raise ValueError(f"Unknown step: {name} (known: {', '.join(graph)})")
+
+    def run(name, config):
+        previous = _apply_config(config)
+        node = graph[name]
+        try:
+            t0 = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = node['func'](*node['args'], **node['kwargs'])
+            return result, time.perf_counter() - t0
+        finally:
+            _apply_config(previous)
+
+    records = []
+    for name in steps:
+        fast_result, t_fast = run(name, fast_config)
+        ref_result, t_ref = run(name, reference_config)
+        diff = compare_step_outputs(ref_result, fast_result, tolerances)
+        records.append({
+            'step': name,
+            'time_ref_s': t_ref,
+            'time_fast_s': t_fast,
+            'speedup': t_ref / t_fast if t_fast > 0 else float('inf'),
+            'n_fields': diff['n_fields'],
+            'n_failures': len(diff['failures']),
+            'max_rel_dev': diff['max_rel_dev'],
+            'max_rel_dev_field': diff['max_rel_dev_field'],
+            'failures': diff['failures'],
+            'informational_changes': diff['informational_changes'],
+            'pass': not diff['failures'],
+        })
+
+    all_pass = all(r['pass'] for r in records)
+
+    if verbose:
+        print("\n" + "=" * 70)
+        print("FAST vs REFERENCE EQUIVALENCE [DIAG]")
+        print("=" * 70)
+        print(f"  Reference: {reference_config}")
+        print(f"  Fast:      {fast_config}")
+        print()
+        print(f"  {'step':<14} | {'fields':>6} | {'fail':>4} | {'max rel dev':>11} | "
+              f"{'t_ref (s)':>9} | {'t_fast (s)':>10} | {'speedup':>7}")
+        print("  " + "-" * 80)
+        for r in records:
+            print(f"  {r['step']:<14} | {r['n_fields']:>6} | {r['n_failures']:>4} | "
+                  f"{r['max_rel_dev']:>11.2e} | {r['time_ref_s']:>9.2f} | "
+                  f"{r['time_fast_s']:>10.2f} | {r['speedup']:>6.1f}x")
+        print("  " + "-" * 80)
+        for r in records:
+            for f in r['failures'][:5]:
+                print(f"  ✗ {r['step']}: {f}")
+            if r['n_failures'] > 5:
+                print(f"  ✗ {r['step']}: ... {r['n_failures'] - 5} more")
+        print(f"  EQUIVALENCE: {'PASS' if all_pass else 'FAIL'}")
+        print("=" * 70)
+
+    result = {'steps': records, 'all_pass': all_pass,
+              'reference_config': reference_config, 'fast_config': fast_config}
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump(result, f, indent=2, default=repr)
+    return result
+
+
+# =============================================================================
+# INTEGRAND / QUAD ACCOUNTING [DIAG]
+# =============================================================================
+# Opt-in. enable_instrumentation() swaps the module-level `quad`, the
+# batched fixed-node kernel and the graph step functions for counting
+# wrappers; disable_instrumentation() puts the originals back. When it is
+# off nothing is wrapped, so it costs nothing. Every quad call (including
+# the closure integrands in compute_V_with_width,
+# compute_bounce_with_profile, ...) is keyed by (innermost running step,
+# integrand qualname). quad calls made in pool worker processes are not
+# seen, so use WORKERS = 1 for complete counts.
+
+_INSTRUMENT_ORIGINALS = {}
+_INSTRUMENT_STATS = {}
+_INSTRUMENT_STACK = []
+
+
+def _instrument_record(name: str) -> Dict:
+    step = _INSTRUMENT_STACK[-1] if _INSTRUMENT_STACK else '<main>'
+    return _INSTRUMENT_STATS.setdefault((step, name), {
+        'quad_calls': 0, 'integrand_calls': 0, 'subdivisions': 0,
+        'batched_calls': 0, 'batched_points': 0, 'wall_s': 0.0})
+
+
+def _counting_quad(func, a, b, *args, **kwargs):
+    """[Def] scipy quad with integrand-call, subdivision and wall-time accounting."""
+    import time
+    import warnings
+    from scipy.integrate import IntegrationWarning
+
+    rec = _instrument_record(getattr(func, '__qualname__', repr(func)))
+
+    def counted(*x):
+        rec['integrand_calls'] += 1
+        return func(*x)
+
+    full_output = kwargs.pop('full_output', 0)
+    t0 = time.perf_counter()
+    out = _INSTRUMENT_ORIGINALS['quad'](counted, a, b, *args, full_output=1, **kwargs)
+    rec['wall_s'] += time.perf_counter() - t0
+    rec['quad_calls'] += 1
+    if len(out) > 2 and isinstance(out[2], dict):
+        rec['subdivisions'] += int(out[2].get('last', 0))
+    if full_output:
+        return out
+    if len(out) > 3:
+        # full_output=1 turns warnings into a message; restore quad's behaviour
+        warnings.warn(out[3], IntegrationWarning, stacklevel=2)
+    return out[:2]
+
+
+def _counting_MV_from_amplitudes(Aq, dAdq, params, n, w=None):
+    """[Def] Fixed-node kernel with batched-call and node-evaluation accounting."""
+    import time
+    rec = _instrument_record('_MV_from_amplitudes')
+    t0 = time.perf_counter()
+    out = _INSTRUMENT_ORIGINALS['_MV_from_amplitudes'](Aq, dAdq, params, n, w)
+    rec['wall_s'] += time.perf_counter() - t0
+    rec['batched_calls'] += 1
+    rec['batched_points'] += int(np.size(out[0])) * n
+    return out
+
+
+def _step_wrapper(name: str, func):
+    import functools
+
+    @functools.wraps(func)
+    def wrapped(*args, **kwargs):
+        _INSTRUMENT_STACK.append(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _INSTRUMENT_STACK.pop()
+    return wrapped
+
+
+def enable_instrumentation(reset: bool = True) -> None:
+    """[DIAG] Install the counting wrappers (idempotent)."""
+    if reset:
+        reset_instrumentation()
+    if _INSTRUMENT_ORIGINALS:
+        return
+    g = globals()
+    _INSTRUMENT_ORIGINALS['quad'] = g['quad']
+    _INSTRUMENT_ORIGINALS['_MV_from_amplitudes'] = g['_MV_from_amplitudes']
+    g['quad'] = _counting_quad
+    g['_MV_from_amplitudes'] = _counting_MV_from_amplitudes
+    for step, node in _step_graph().items():
+        fname = node['func'].__name__
+        if fname not in _INSTRUMENT_ORIGINALS:
+            _INSTRUMENT_ORIGINALS[fname] = g[fname]
+            g[fname] = _step_wrapper(step, g[fname])
+
+
+def disable_instrumentation() -> None:
+    """[DIAG] Restore the original functions; collected stats are kept."""
+    globals().update(_INSTRUMENT_ORIGINALS)
+    _INSTRUMENT_ORIGINALS.clear()
+
+
+def reset_instrumentation() -> None:
+    """[DIAG] Drop collected stats."""
+    _INSTRUMENT_STATS.clear()
+    _INSTRUMENT_STACK.clear()
+
+
+def instrumentation_report(json_path: str = None, csv_path: str = None,
+                           verbose: bool = True) -> List[Dict]:
+    """
+    [DIAG] Per (step, integrand) accounting rows, sorted by wall time.
+
+    Optionally exported as JSON and/or CSV; prints per-step totals.
+    """
+    import json
+
+    rows = [{'step': step, 'integrand': name, **rec}
+            for (step, name), rec in _INSTRUMENT_STATS.items()]
+    rows.sort(key=lambda r: -r['wall_s'])
+
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump(rows, f, indent=2)
+    if csv_path:
+        fields = ['step', 'integrand', 'quad_calls', 'integrand_calls', 'subdivisions',
+                  'batched_calls', 'batched_points', 'wall_s']
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    if verbose:
+        totals = {}
+        for r in rows:
+            t = totals.setdefault(r['step'], {'quad_calls': 0, 'integrand_calls': 0,
+                                              'batched_points': 0, 'wall_s': 0.0})
+            for k in t:
+                t[k] += r[k]
+        print("\n" + "=" * 70)
+        print("INTEGRAND / QUAD ACCOUNTING [DIAG]")
+        print("=" * 70)
+        print(f"  {'step':<14} | {'quad calls':>10} | {'integrand calls':>15} | "
+              f"{'fixed-node pts':>14} | {'quad+kernel s':>13}")
+        print("  " + "-" * 78)
+        for step, t in sorted(totals.items(), key=lambda kv: -kv[1]['wall_s']):
+            print(f"  {step:<14} | {t['quad_calls']:>10} | {t['integrand_calls']:>15} | "
+                  f"{t['batched_points']:>14} | {t['wall_s']:>13.2f}")
+        print("  " + "-" * 78)
+        for r in rows[:5]:
+            print(f"  top: {r['step']:<14} {r['integrand']:<45} {r['wall_s']:.2f} s")
+        if json_path or csv_path:
+            print(f"  Exported: {', '.join(p for p in (json_path, csv_path) if p)}")
+        print("=" * 70)
+
+    return rows
+
+
 # =============================================================================
 # MAIN COMPUTATION
 # =============================================================================
@@ -6822,12 +9009,64 @@ if __name__ == '__main__':
                         help='Disable deterministic mode (use live timestamps)')
     parser.add_argument('--all', action='store_true',
                         help='Run all steps (default behavior)')
+    parser.add_argument('--radial-quadrature', choices=RADIAL_QUADRATURE_METHODS,
+                        default='quad',
+                        help="Radial M/V integrator: 'quad' (reference, default; frozen "
+                             "hashes are defined for it) or 'gauss_laguerre' (batched fixed nodes)")
+    parser.add_argument('--run-steps', default=None,
+                        help='Comma-separated steps for the memoizing step-graph runner '
+                             f"({','.join(STEP_NAMES)}); unchanged steps are skipped")
+    parser.add_argument('--force', action='store_true',
+                        help='With --run-steps: re-run every step even if inputs are unchanged')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for per-q quads and independent graph steps '
+                             '(default 1 = serial; hashes are identical for any value)')
+    parser.add_argument('--norm-cache-dir', default=None,
+                        help='Directory for the on-disk normalization cache (default: in-process only)')
+    parser.add_argument('--instrument', nargs='?', const='generated/instrumentation', default=None,
+                        metavar='PREFIX',
+                        help='Count integrand/quad calls per step; writes PREFIX.json and PREFIX.csv')
+    parser.add_argument('--equivalence', nargs='?', const='', default=None, metavar='STEPS',
+                        help='Run fast vs reference equivalence harness on comma-separated '
+                             'steps (default: all but step28/step29)')
+    parser.add_argument('--equivalence-report', default=None,
+                        help='With --equivalence: write the JSON report to this path')
     args = parser.parse_args()
 
+    RADIAL_QUADRATURE = args.radial_quadrature
+    NORMALIZATION_DISK_CACHE = args.norm_cache_dir
+    WORKERS = max(1, args.workers)
+
     # Deterministic is now default; --no-deterministic overrides
     use_deterministic = not args.no_deterministic
 
-    if args.release_audit:
+    if args.instrument:
+        import atexit
+        from pathlib import Path
+        Path(args.instrument).parent.mkdir(parents=True, exist_ok=True)
+        enable_instrumentation()
+        atexit.register(lambda: instrumentation_report(f"{args.instrument}.json",
+                                                       f"{args.instrument}.csv"))
+
+    if args.equivalence is not None:
+        # Fast vs reference side-by-side diff
+        import sys
+        eq_steps = [t.strip() for t in args.equivalence.split(',') if t.strip()] or None
+        eq_results = equivalence_harness(eq_steps, deterministic=use_deterministic,
+                                         report_path=args.equivalence_report)
+        if not eq_results['all_pass']:
+            sys.exit(1)
+
+    elif args.run_steps:
+        # Step-graph runner: selected steps + dependencies, memoized by input hash
+        import sys
+        graph_results = run_step_graph([t.strip() for t in args.run_steps.split(',') if t.strip()],
+                                       force=args.force, deterministic=use_deterministic)
+        if not graph_results['all_pass']:
+            print(f"\n✗ Failed steps: {', '.join(graph_results['failed'])}")
+            sys.exit(1)
+
+    elif args.release_audit:
         # Run Step 29: Release audit (one-command reproduction)
         import sys
         step29_results = step29_release_audit()
@@ -6938,3 +9177,16 @@ if __name__ == '__main__':
     else:
         # Default: run all steps
         results = main()
+
+    if args.instrument or args.norm_cache_dir:
+        cache_stats = normalization_cache_stats()
+        print(f"\nNormalization cache: {cache_stats['misses']} computed, "
+              f"{cache_stats['hits']} memory hits, {cache_stats['disk_hits']} disk hits")
+
+    if RADIAL_QUADRATURE != 'quad':
+        # Automatic accuracy report for the fixed-node radial engine
+        import sys
+        radial_report = radial_quadrature_report()
+        if not radial_report['all_pass']:
+            print("\n✗ Radial quadrature cross-check FAILED")
+            sys.exit(1)
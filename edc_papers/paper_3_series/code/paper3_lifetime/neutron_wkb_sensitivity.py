@@ -28,7 +28,18 @@ import os
 import time
 import json
 import hashlib
+import shutil
 import sys
+import socket
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+
+try:
+    import fcntl  # Advisory file locks (POSIX)
+except ImportError:  # pragma: no cover - e.g. Windows: atomic writes only, no locking
+    fcntl = None
 
 # Full-5D reduction module (Phase-4)
 try:
@@ -42,6 +53,14 @@ except ImportError:
         FAIL = "FAIL"
         SKIP_OPEN = "SKIP_OPEN"
 
+# Shared bounded LRU cache (common/bounded_cache.py; imported after the
+# optional Full-5D module so the path fallback does not change its availability)
+try:
+    from bounded_cache import BoundedCache
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+    from bounded_cache import BoundedCache
+
 # =============================================================================
 # PERFORMANCE: TIMING INSTRUMENTATION
 # =============================================================================
@@ -111,8 +130,10 @@ def clear_timing_log():
 _CACHE_DIR = os.environ.get('NEUTRON_CACHE_DIR',
                             os.path.join(os.path.dirname(__file__) or '.', '.cache', 'neutron'))
 
-# RAM cache (process-level)
-_RAM_CACHE: Dict[str, Any] = {}
+# RAM cache (process-level, LRU-bounded; budget via NEUTRON_RAM_CACHE_MB).
+# Keys are "{kind}_{key}"; statistics are kept per kind.
+_RAM_CACHE = BoundedCache('neutron_ram', env_var='NEUTRON_RAM_CACHE_MB', default_mb=256,
+                          kind_of=lambda k: k.rsplit('_', 1)[0])
 
 # Cache statistics
 _CACHE_STATS = {'hits': 0, 'misses': 0}
@@ -169,11 +190,12 @@ def load_cache(kind: str, key: str) -> Tuple[bool, Any]:
 
     # Check RAM cache first
     ram_key = f"{kind}_{key}"
-    if ram_key in _RAM_CACHE:
+    cached = _RAM_CACHE.get(ram_key)
+    if cached is not None:
         _CACHE_STATS['hits'] += 1
         if PROFILE_TIMING:
             print(f"CACHE HIT (RAM) {kind} key={key[:8]}...")
-        return True, _RAM_CACHE[ram_key]
+        return True, cached
 
     # Check disk cache
     path = _cache_path(kind, key)
@@ -188,9 +210,13 @@ def load_cache(kind: str, key: str) -> Tuple[bool, Any]:
                 print(f"CACHE HIT (disk) {kind} key={key[:8]}...")
             return True, result
         except Exception as e:
-            if PROFILE_TIMING:
-                print(f"CACHE ERROR loading {kind}: {e}")
-            pass
+            # Unreadable entry (e.g. torn write by a pre-atomic writer):
+            # report it and drop it so it is recomputed
+            warnings.warn(f"Discarding unreadable cache entry {path}: {e}", RuntimeWarning)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
     _CACHE_STATS['misses'] += 1
     if PROFILE_TIMING:
@@ -198,6 +224,203 @@ def load_cache(kind: str, key: str) -> Tuple[bool, Any]:
     return False, None
 
 
+def _cache_contains(kind: str, key: str) -> bool:
+    """Check RAM/disk cache presence without loading or touching stats."""
+    return f"{kind}_{key}" in _RAM_CACHE or os.path.exists(_cache_path(kind, key))
+
+
+# -----------------------------------------------------------------------------
+# Multi-process safety: advisory locks and in-flight markers
+# -----------------------------------------------------------------------------
+# Writes are atomic (temp file + os.replace; grid appends under flock), so
+# concurrent readers never see torn entries. For expensive results, the
+# computing process holds an exclusive lock on "{kind}_{key}.inflight"
+# (which also records pid/host/start time); other processes needing the same
+# entry wait on that lock and then re-check the cache instead of recomputing.
+# flock is released by the kernel if the holder dies, so markers never go
+# stale. Without fcntl (non-POSIX) locking is a no-op.
+
+# Maximum wait for another process's in-flight result before computing anyway
+_CACHE_WAIT_TIMEOUT = float(os.environ.get('NEUTRON_CACHE_WAIT_S', '600'))
+
+
+@contextmanager
+def _file_lock(path: str, timeout: float = None):
+    """
+    Exclusive advisory lock on `path` (created if missing).
+
+    Yields True if the lock is held, False if locking is unavailable or the
+    timeout expired.
+    """
+    if fcntl is None:
+        yield False
+        return
+
+    fh = open(path, 'a+')
+    locked = False
+    try:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = False
+        while True:
+            try:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locked = True
+                break
+            except BlockingIOError:
+                if not waited and PROFILE_TIMING:
+                    print(f"CACHE WAIT {os.path.basename(path)}")
+                waited = True
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+                time.sleep(0.05)
+        yield locked
+    finally:
+        if locked:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        fh.close()
+
+
+@contextmanager
+def cache_inflight(kind: str, key: str):
+    """
+    In-flight marker for computing a cache entry.
+
+    Usage: check the cache; on a miss enter this context, re-check the cache
+    (another process may have finished it while we waited), then compute and
+    save inside the context.
+    """
+    _ensure_cache_dir()
+    path = os.path.join(_CACHE_DIR, f"{kind}_{key}.inflight")
+    with _file_lock(path, timeout=_CACHE_WAIT_TIMEOUT) as locked:
+        if locked:
+            with open(path, 'w') as fh:
+                fh.write(f"{socket.gethostname()} pid={os.getpid()} start={time.time():.3f}\n")
+        try:
+            yield
+        finally:
+            if locked:
+                open(path, 'w').close()  # Empty marker = not in flight
+
+
+# -----------------------------------------------------------------------------
+# Grid store: one array-backed file per (kind, parameter-hash) family
+# -----------------------------------------------------------------------------
+# Scalar-per-q results (Vtilde, Mtilde) are stored as raw float64 records
+# [q, value] appended to "{kind}_{family_key}.grid". Reads memory-map the
+# file and keep a q index in RAM (with the byte offset already indexed), so
+# a later read only maps the appended tail. A torn trailing record is ignored.
+
+_GRID_RECORD = 2  # float64 values per record: (q, value)
+
+
+def _grid_path(kind: str, family_key: str) -> str:
+    """Get file path for a grid-store family."""
+    _ensure_cache_dir()
+    return os.path.join(_CACHE_DIR, f"{kind}_{family_key}.grid")
+
+
+def _grid_q_key(q: float) -> float:
+    """q index key (same rounding as cache_key)."""
+    return round(float(q), 8)
+
+
+def _grid_index(kind: str, family_key: str) -> Dict[float, float]:
+    """
+    Return the q -> value index of a grid family, syncing with the file.
+
+    Only records appended since the last sync are mapped and indexed.
+    """
+    ram_key = f"{kind}_{family_key}"
+    entry = _RAM_CACHE.get(ram_key, kind=f"{kind}_grid")
+    if entry is None:
+        entry = {'index': {}, 'offset': 0}
+        _RAM_CACHE.put(ram_key, entry, kind=f"{kind}_grid")
+
+    path = _grid_path(kind, family_key)
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    record_bytes = _GRID_RECORD * 8
+    size -= size % record_bytes  # Ignore a torn trailing record
+
+    if size < entry['offset']:
+        # File was truncated/replaced: re-index from scratch
+        entry['index'], entry['offset'] = {}, 0
+    if size > entry['offset']:
+        try:
+            records = np.memmap(path, dtype=np.float64, mode='r', offset=entry['offset'],
+                                shape=((size - entry['offset']) // record_bytes, _GRID_RECORD))
+            entry['index'].update(zip((_grid_q_key(q) for q in records[:, 0]), records[:, 1].tolist()))
+            del records
+            entry['offset'] = size
+            _RAM_CACHE.refresh_size(ram_key)
+        except Exception as e:
+            if PROFILE_TIMING:
+                print(f"CACHE ERROR loading grid {kind}: {e}")
+
+    return entry['index']
+
+
+def load_grid(kind: str, family_key: str, q_values: np.ndarray,
+              count_stats: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load cached values of a grid family for many q in one call.
+
+    Parameters:
+        kind: Cache type ("Vtilde", "Mtilde")
+        family_key: cache_key(kind, params_dict) without q
+        q_values: q values to look up
+        count_stats: Count one hit/miss per q in the cache statistics
+
+    Returns:
+        (values, found): values (NaN where missing) and boolean mask
+    """
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+    index = _grid_index(kind, family_key)
+    values = np.array([index.get(_grid_q_key(q), np.nan) for q in q_values])
+    found = np.array([_grid_q_key(q) in index for q in q_values], dtype=bool)
+
+    if count_stats:
+        n_hit = int(np.sum(found))
+        _CACHE_STATS['hits'] += n_hit
+        _CACHE_STATS['misses'] += len(q_values) - n_hit
+        if PROFILE_TIMING:
+            print(f"CACHE GRID {kind} key={family_key[:8]}... hits={n_hit}/{len(q_values)}")
+
+    return values, found
+
+
+def append_grid(kind: str, family_key: str, q_values: np.ndarray, values: np.ndarray):
+    """
+    Append (q, value) records to a grid family (one write) and index them.
+
+    Parameters:
+        kind: Cache type
+        family_key: cache_key(kind, params_dict) without q
+        q_values: q values
+        values: Values for each q
+    """
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+    values = np.atleast_1d(np.asarray(values, dtype=float))
+    if len(q_values) == 0:
+        return
+
+    index = _grid_index(kind, family_key)
+    records = np.column_stack([q_values, values]).astype(np.float64)
+    try:
+        with open(_grid_path(kind, family_key), 'ab') as fh:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)  # Released on close
+            fh.write(records.tobytes())
+    except Exception as e:
+        if PROFILE_TIMING:
+            print(f"CACHE ERROR saving grid {kind}: {e}")
+    # Indexed now; the next sync re-maps these records from the file offset,
+    # which also picks up records appended by other processes
+    index.update(zip((_grid_q_key(q) for q in q_values), values.tolist()))
+
+
 def save_cache(kind: str, key: str, data: dict):
     """
     Save data to cache (both RAM and disk).
@@ -210,12 +433,22 @@ def save_cache(kind: str, key: str, data: dict):
     ram_key = f"{kind}_{key}"
     _RAM_CACHE[ram_key] = data
 
+    tmp_path = None
     try:
         path = _cache_path(kind, key)
-        np.savez_compressed(path, **data)
+        # Write a temp file in the same directory, then atomically rename:
+        # readers never see a partially written .npz
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=_CACHE_DIR)
+        with os.fdopen(fd, 'wb') as fh:
+            np.savez_compressed(fh, **data)
+        os.replace(tmp_path, path)
+        tmp_path = None
     except Exception as e:
         if PROFILE_TIMING:
             print(f"CACHE ERROR saving {kind}: {e}")
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def clear_cache(kind: str = None):
@@ -225,15 +458,15 @@ def clear_cache(kind: str = None):
     Parameters:
         kind: If specified, only clear this type. If None, clear all.
     """
-    global _RAM_CACHE, _CACHE_STATS
+    global _CACHE_STATS
 
     if kind is None:
         # Clear all
-        _RAM_CACHE = {}
+        _RAM_CACHE.clear()
         _CACHE_STATS = {'hits': 0, 'misses': 0}
         if os.path.exists(_CACHE_DIR):
             for f in os.listdir(_CACHE_DIR):
-                if f.endswith('.npz'):
+                if f.endswith(('.npz', '.grid', '.tmp', '.inflight')):
                     os.remove(os.path.join(_CACHE_DIR, f))
     else:
         # Clear specific kind
@@ -242,7 +475,7 @@ def clear_cache(kind: str = None):
             del _RAM_CACHE[k]
         if os.path.exists(_CACHE_DIR):
             for f in os.listdir(_CACHE_DIR):
-                if f.startswith(f"{kind}_") and f.endswith('.npz'):
+                if f.startswith(f"{kind}_") and f.endswith(('.npz', '.grid')):
                     os.remove(os.path.join(_CACHE_DIR, f))
 
 
@@ -254,10 +487,16 @@ def get_cache_stats() -> Dict[str, Any]:
         'hits': _CACHE_STATS['hits'],
         'misses': _CACHE_STATS['misses'],
         'total': total,
-        'hit_rate': hit_rate
+        'hit_rate': hit_rate,
+        'memory': get_memory_cache_stats(),
     }
 
 
+def get_memory_cache_stats() -> Dict[str, Any]:
+    """Per-kind RAM cache statistics (entries, bytes, hits, misses, evictions)."""
+    return {'ram': _RAM_CACHE.stats(), 'profile': _PROFILE_CACHE.stats()}
+
+
 def reset_cache_stats():
     """Reset cache statistics."""
     global _CACHE_STATS
@@ -314,8 +553,10 @@ DEFAULT_PHASE1_PARAMS = Phase1AnsatzParams()
 # Phase-3 gates internally set True for profile-specific tests
 USE_COMPUTED_PROFILE = False
 
-# Cache for computed profiles (avoids repeated expensive solves)
-_PROFILE_CACHE = {}
+# Cache for computed profiles (avoids repeated expensive solves).
+# LRU-bounded; budget via NEUTRON_PROFILE_CACHE_MB. Kind = solver.
+_PROFILE_CACHE = BoundedCache('neutron_profile', env_var='NEUTRON_PROFILE_CACHE_MB', default_mb=512,
+                              kind_of=lambda k: f"profile_{k[-1]}")
 
 
 # =============================================================================
@@ -684,13 +925,75 @@ USE_DERIVED_CLOSED_FORM = True  # DEFAULT: Use [Der] closed-form functions
 # =============================================================================
 
 def _profile_energy_functional(
+    f_grid: np.ndarray,
+    r_grid: np.ndarray,
+    q: Union[float, np.ndarray],
+    params: 'Phase1AnsatzParams'
+) -> Union[float, np.ndarray]:
+    """
+    [Dc] Compute static energy E[f; q] for defect profile.
+
+    The energy functional for a brane bulge in warped background:
+        E[f; q] = sigma * integral[ (sqrt(1 + |∇f|^2) - 1 + V_bulk(f)) * W(f) ] d^3x
+
+    where:
+        - sigma: brane tension
+        - |∇f|^2: squared gradient of embedding
+        - V_bulk(f): bulk potential constraining f (regularization)
+        - W(f): warp factor evaluated at f
+
+    Array implementation: f_grid may be one profile (n,) or a stack of
+    profiles (K, n) (e.g. one per q), evaluated in a single expression.
+    _profile_energy_functional_loop is the point-by-point reference.
+
+    Parameters:
+        f_grid: Profile values f(r) on radial grid, shape (n,) or (K, n)
+        r_grid: Radial coordinate grid
+        q: Collective coordinate(s) (controls amplitude; not used directly)
+        params: Ansatz parameters
+
+    Returns:
+        E[f; q] (total static energy): float, or array of shape (K,)
+
+    Status: [Dc] Energy computed from integrals under [P] metric assumptions.
+    """
+    f_grid = np.asarray(f_grid, dtype=float)
+    n = len(r_grid)
+    if n < 3:
+        return 0.0 if f_grid.ndim == 1 else np.zeros(f_grid.shape[0])
+
+    dr = r_grid[1] - r_grid[0]
+    lambda_reg = 0.01  # Regularization strength [P]
+
+    f = f_grid[..., 1:-1]
+    df_dr = (f_grid[..., 2:] - f_grid[..., :-2]) / (2.0 * dr)
+    W = np.exp(-2.0 * np.abs(f) / params.ell)
+    metric_contrib = np.sqrt(1.0 + df_dr ** 2) - 1.0
+    V_bulk = lambda_reg * f ** 2
+
+    integrand = (metric_contrib + V_bulk) * W * r_grid[1:-1] ** 2
+    energy = np.sum(integrand * dr, axis=-1) * (params.sigma * 4.0 * np.pi)
+
+    return float(energy) if np.ndim(energy) == 0 else energy
+
+
+def _residual_norm(residual: np.ndarray) -> Union[float, np.ndarray]:
+    """[Dc] RMS of the interior E-L residual; (n,) → float, (K, n) → (K,)."""
+    residual = np.asarray(residual, dtype=float)
+    norm = np.sqrt(np.sum(residual[..., 1:-1] ** 2, axis=-1) / max(residual.shape[-1] - 2, 1))
+    return float(norm) if np.ndim(norm) == 0 else norm
+
+
+def _profile_energy_functional_loop(
     f_grid: np.ndarray,
     r_grid: np.ndarray,
     q: float,
     params: 'Phase1AnsatzParams'
 ) -> float:
     """
-    [Dc] Compute static energy E[f; q] for defect profile.
+    [Dc] Point-by-point reference for _profile_energy_functional.
+
+    Kept for verification of the array implementation.
 
     The energy functional for a brane bulge in warped background:
         E[f; q] = sigma * integral[ (sqrt(1 + |∇f|^2) - 1 + V_bulk(f)) * W(f) ] d^3x
@@ -760,7 +1063,65 @@ def _euler_lagrange_residual(
     [Dc] Compute Euler-Lagrange residual δE/δf for profile optimization.
 
     The E-L equation for stationary profile is δE/δf = 0.
-    This function returns the residual vector R_i = (δE/δf)_i.
+    This function returns the residual vector R_j = ∂E/∂f_j of the
+    discretized energy (_profile_energy_functional), in closed form.
+
+    With d_i = (f_{i+1} - f_{i-1}) / (2 dr), g_i = sqrt(1 + d_i^2),
+    W_i = exp(-2|f_i|/ell) and c = 4π sigma, the energy is
+        E = c dr Σ_{i=1}^{n-2} (g_i - 1 + λ f_i^2) W_i r_i^2
+    so that, for interior j,
+        ∂E/∂f_j = c dr r_j^2 [2λ f_j W_j + (g_j - 1 + λ f_j^2) W'_j]
+                  + P_{j-1} - P_{j+1},   P_i = c r_i^2 W_i d_i / (2 g_i)
+    where W' = -2 sign(f)/ell W and P vanishes outside 1..n-2. This is
+    O(n) array work (f_grid may also be a (K, n) stack);
+    _euler_lagrange_residual_fd keeps the finite-difference version for
+    verification.
+
+    Returns:
+        Array of residual values at each interior grid point.
+
+    Status: [Dc] E-L residual computed analytically from the discrete energy.
+    """
+    f_grid = np.asarray(f_grid, dtype=float)
+    residual = np.zeros(f_grid.shape)
+
+    if len(r_grid) < 3:
+        return residual
+
+    dr = r_grid[1] - r_grid[0]
+    lambda_reg = 0.01  # Same as in energy functional [P]
+    c = params.sigma * 4.0 * np.pi
+
+    f = f_grid[..., 1:-1]
+    r2 = r_grid[1:-1] ** 2
+    d = (f_grid[..., 2:] - f_grid[..., :-2]) / (2.0 * dr)
+    g = np.sqrt(1.0 + d ** 2)
+    W = np.exp(-2.0 * np.abs(f) / params.ell)
+    dW = -2.0 * np.sign(f) / params.ell * W
+
+    # Local term (f_j enters W_j and V_bulk at its own point)
+    residual[..., 1:-1] = c * dr * r2 * (2.0 * lambda_reg * f * W + (g - 1.0 + lambda_reg * f ** 2) * dW)
+
+    # Gradient term: f_j enters d_{j-1} (+1/2dr) and d_{j+1} (-1/2dr)
+    P = np.zeros(f_grid.shape)
+    P[..., 1:-1] = c * r2 * W * d / (2.0 * g)
+    residual[..., 2:-1] += P[..., 1:-2]
+    residual[..., 1:-2] -= P[..., 2:-1]
+
+    return residual
+
+
+def _euler_lagrange_residual_fd(
+    f_grid: np.ndarray,
+    r_grid: np.ndarray,
+    q: float,
+    params: 'Phase1AnsatzParams'
+) -> np.ndarray:
+    """
+    [Dc] Finite-difference E-L residual (reference for the analytic gradient).
+
+    Perturbs each interior point by ±1e-8 and re-evaluates the energy:
+    O(n^2) work. Kept to verify _euler_lagrange_residual.
 
     Returns:
         Array of residual values at each interior grid point.
@@ -792,6 +1153,65 @@ def _euler_lagrange_residual(
     return residual
 
 
+def _euler_lagrange_hessian_banded(
+    f_grid: np.ndarray,
+    r_grid: np.ndarray,
+    q: float,
+    params: 'Phase1AnsatzParams'
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    [Dc] Analytic Hessian ∂²E/∂f_j∂f_k of the discretized energy, as bands.
+
+    Each energy term h_i = c dr r_i^2 W_i (g_i - 1 + λ f_i^2) couples f_i
+    (directly) and f_{i±1} (through d_i), so the Hessian is symmetric
+    pentadiagonal. With s = 1/(2 dr), B = g - 1 + λf^2, W'' = (2/ell)^2 W:
+        h_ff = c dr r^2 [W'' B + 4λ f W' + 2λ W]
+        h_fd = c dr r^2 W' d / g
+        h_dd = c dr r^2 W / g^3
+    and term i adds h_ff to (i,i), ±s h_fd to (i,i±1), s^2 h_dd to
+    (i±1,i±1) and -s^2 h_dd to (i-1,i+1).
+
+    Returns:
+        (diag, upper1, upper2): H[k,k] (n,), H[k,k+1] (n-1,), H[k,k+2] (n-2,)
+
+    Status: [Dc] Second variation computed analytically from the discrete energy.
+    """
+    n = len(r_grid)
+    diag = np.zeros(n)
+    upper1 = np.zeros(max(n - 1, 0))
+    upper2 = np.zeros(max(n - 2, 0))
+
+    if n < 3:
+        return diag, upper1, upper2
+
+    f_grid = np.asarray(f_grid, dtype=float)
+    dr = r_grid[1] - r_grid[0]
+    s = 1.0 / (2.0 * dr)
+    lambda_reg = 0.01  # Same as in energy functional [P]
+    a = params.sigma * 4.0 * np.pi * dr * r_grid[1:-1] ** 2
+
+    f = f_grid[1:-1]
+    d = (f_grid[2:] - f_grid[:-2]) * s
+    g = np.sqrt(1.0 + d ** 2)
+    W = np.exp(-2.0 * np.abs(f) / params.ell)
+    dW = -2.0 * np.sign(f) / params.ell * W
+    d2W = (2.0 / params.ell) ** 2 * W
+    B = g - 1.0 + lambda_reg * f ** 2
+
+    h_ff = a * (d2W * B + 4.0 * lambda_reg * f * dW + 2.0 * lambda_reg * W)
+    h_fd = a * dW * d / g
+    h_dd = a * W / g ** 3
+
+    diag[1:-1] += h_ff
+    diag[:-2] += s ** 2 * h_dd
+    diag[2:] += s ** 2 * h_dd
+    upper1[1:] += s * h_fd
+    upper1[:-1] -= s * h_fd
+    upper2 -= s ** 2 * h_dd
+
+    return diag, upper1, upper2
+
+
 def _solve_profile_relaxation(
     q: float,
     params: 'Phase1AnsatzParams',
@@ -841,7 +1261,7 @@ def _solve_profile_relaxation(
         residual = _euler_lagrange_residual(f_grid, r_grid, q, params)
 
         # Residual norm (L2)
-        residual_norm = np.sqrt(np.sum(residual[1:-1] ** 2) / max(len(residual) - 2, 1))
+        residual_norm = _residual_norm(residual)
         residual_history.append(residual_norm)
 
         # Check convergence
@@ -858,7 +1278,7 @@ def _solve_profile_relaxation(
     # Compute final energy and residual
     final_energy = _profile_energy_functional(f_grid, r_grid, q, params)
     final_residual = _euler_lagrange_residual(f_grid, r_grid, q, params)
-    final_residual_norm = np.sqrt(np.sum(final_residual[1:-1] ** 2) / max(len(final_residual) - 2, 1))
+    final_residual_norm = _residual_norm(final_residual)
 
     info = {
         'converged': final_residual_norm < tolerance,
@@ -871,13 +1291,126 @@ def _solve_profile_relaxation(
     return f_grid, r_grid, info
 
 
+def _solve_profile_newton(
+    q: float,
+    params: 'Phase1AnsatzParams',
+    initial_guess: np.ndarray = None,
+    max_iterations: int = 50,
+    tolerance: float = 1e-10
+) -> Tuple[np.ndarray, np.ndarray, dict]:
+    """
+    [Dc] Solve for stationary profile f*(r; q) by damped Newton iteration.
+
+    Solves the same fixed point as _solve_profile_relaxation (interior
+    E-L residual = 0 with f_0 = f_1 and f_{n-1} = 0), using the analytic
+    banded Hessian: each step is one (2,2)-banded solve, O(n). The step
+    is halved until the residual norm decreases (backtracking), so
+    convergence is quadratic near the solution.
+
+    Parameters:
+        q: Collective coordinate
+        params: Ansatz parameters
+        initial_guess: Starting profile (defaults to Gaussian ansatz)
+        max_iterations: Maximum Newton iterations
+        tolerance: Convergence tolerance on residual norm
+
+    Returns:
+        (f_grid, r_grid, info): Optimized profile, grid, and convergence info
+
+    Status: [Dc] Profile computed by energy stationarity (Newton).
+    """
+    from scipy.linalg import solve_banded
+
+    r_max_physical = params.r_max * params.ell0
+    r_grid = np.linspace(1e-10, r_max_physical, params.n_radial)
+
+    if initial_guess is None:
+        width = params.ell0 * (1.0 + params.beta * q)
+        amplitude = params.A0 * q * (1.0 - q)
+        initial_guess = amplitude * np.exp(-r_grid ** 2 / (2.0 * width ** 2))
+
+    f_grid = np.array(initial_guess, dtype=float)
+    f_grid[-1] = 0.0  # Dirichlet at r=r_max
+    f_grid[0] = f_grid[1]  # Neumann at r=0 (symmetry)
+
+    residual = _euler_lagrange_residual(f_grid, r_grid, q, params)
+    residual_norm = _residual_norm(residual)
+    residual_history = [residual_norm]
+    message = 'max_iterations reached'
+    iteration = 0
+
+    while iteration < max_iterations and params.n_radial >= 5:
+        if residual_norm < tolerance:
+            message = 'converged'
+            break
+        iteration += 1
+
+        # Jacobian of R[1:-1] w.r.t. f[1:-1], with f_0 = f_1 folded into column 0
+        diag, upper1, upper2 = _euler_lagrange_hessian_banded(f_grid, r_grid, q, params)
+        m = params.n_radial - 2
+        ab = np.zeros((5, m))
+        ab[0, 2:] = upper2[1:-1]
+        ab[1, 1:] = upper1[1:-1]
+        ab[2, :] = diag[1:-1]
+        ab[3, :-1] = upper1[1:-1]
+        ab[4, :-2] = upper2[1:-1]
+        ab[2, 0] += upper1[0]
+        ab[3, 0] += upper2[0]
+
+        try:
+            step = solve_banded((2, 2), ab, -residual[1:-1])
+        except np.linalg.LinAlgError:
+            message = 'singular Hessian'
+            break
+
+        # Backtracking on the residual norm
+        t = 1.0
+        while True:
+            f_trial = f_grid.copy()
+            f_trial[1:-1] += t * step
+            f_trial[0] = f_trial[1]
+            residual_trial = _euler_lagrange_residual(f_trial, r_grid, q, params)
+            norm_trial = _residual_norm(residual_trial)
+            if norm_trial < residual_norm or t < 1e-6:
+                break
+            t *= 0.5
+
+        if not norm_trial < residual_norm:
+            message = 'line search stalled'
+            break
+
+        f_grid, residual, residual_norm = f_trial, residual_trial, norm_trial
+        residual_history.append(residual_norm)
+    else:
+        if residual_norm < tolerance:
+            message = 'converged'
+
+    final_energy = _profile_energy_functional(f_grid, r_grid, q, params)
+
+    info = {
+        'converged': residual_norm < tolerance,
+        'solver': 'newton',
+        'message': message,
+        'iterations': iteration,
+        'final_residual_norm': residual_norm,
+        'final_energy': final_energy,
+        'residual_history': residual_history
+    }
+
+    return f_grid, r_grid, info
+
+
 # =============================================================================
 # PHASE-3: BVP SOLVER FOR PROFILE (Fast replacement for relaxation)
 # =============================================================================
 
-# Global solver selection: "bvp" (fast) or "relaxation" (original, slow)
+# Global solver selection: "bvp" (fast), "newton" (banded Newton) or
+# "relaxation" (original, slow)
 PROFILE_SOLVER = os.environ.get('PROFILE_SOLVER', 'bvp')
 
+# Disk-cache kind prefix per solver
+_PROFILE_CACHE_KINDS = {'bvp': 'profile_bvp', 'newton': 'profile_newton', 'relaxation': 'profile_relax'}
+
 
 def _bvp_ode_system(r: np.ndarray, y: np.ndarray, params: dict) -> np.ndarray:
     """
@@ -983,6 +1516,85 @@ def _bvp_boundary_conditions(ya: np.ndarray, yb: np.ndarray, params: dict) -> np
     return np.array([bc1, bc2])
 
 
+def _bvp_ode_jacobian(r: np.ndarray, y: np.ndarray, params: dict) -> np.ndarray:
+    """
+    Analytic Jacobian of _bvp_ode_system for solve_bvp (fun_jac).
+
+    Differentiates f'' = N / A exactly as implemented, with
+        N = RHS - term1 - term2,  A = r^2 W / g^3,
+    including the A clipping (dA = 0 where clipped) and the small-r
+    branch f'' = -2λf. W cancels analytically in f'', but the clipped
+    form is kept so the Jacobian matches the function solve_bvp sees.
+
+    Returns:
+        df/dy with shape (2, 2, m): [[0, 1], [∂f''/∂f, ∂f''/∂f']]
+    """
+    f = y[0]
+    fp = y[1]
+
+    ell = params['ell']
+    lambda_reg = params['lambda_reg']
+
+    W = np.exp(-2.0 * np.abs(f) / ell)
+    sign_f = np.sign(f)
+    sign_f = np.where(f == 0, 0, sign_f)
+    dW_df = -2.0 * sign_f / ell * W
+    d2W_df2 = (2.0 * sign_f / ell) ** 2 * W
+
+    g = np.sqrt(1.0 + fp**2)
+    r_safe = np.where(r < 1e-12, 1e-12, r)
+    r2 = r_safe**2
+
+    metric_term = g - 1.0 + lambda_reg * f**2
+    RHS = r2 * (metric_term * dW_df + 2.0 * lambda_reg * f * W)
+    A = r2 * W / g**3
+    term1 = 2.0 * r_safe * W * fp / g
+    term2 = r2 * dW_df * fp**2 / g
+
+    clipped = np.abs(A) < 1e-15
+    A_safe = np.where(clipped, 1e-15, A)
+    fpp = (RHS - term1 - term2) / A_safe
+
+    # ∂/∂f
+    dRHS_df = r2 * (2.0 * lambda_reg * f * dW_df + metric_term * d2W_df2
+                    + 2.0 * lambda_reg * W + 2.0 * lambda_reg * f * dW_df)
+    dterm1_df = 2.0 * r_safe * dW_df * fp / g
+    dterm2_df = r2 * d2W_df2 * fp**2 / g
+    dA_df = np.where(clipped, 0.0, r2 * dW_df / g**3)
+
+    # ∂/∂f'
+    dRHS_dfp = r2 * (fp / g) * dW_df
+    dterm1_dfp = 2.0 * r_safe * W / g**3
+    dterm2_dfp = r2 * dW_df * fp * (2.0 + fp**2) / g**3
+    dA_dfp = np.where(clipped, 0.0, -3.0 * r2 * W * fp / g**5)
+
+    dfpp_df = (dRHS_df - dterm1_df - dterm2_df - fpp * dA_df) / A_safe
+    dfpp_dfp = (dRHS_dfp - dterm1_dfp - dterm2_dfp - fpp * dA_dfp) / A_safe
+
+    mask_small_r = r < 1e-10
+    if np.any(mask_small_r):
+        dfpp_df = np.where(mask_small_r, -2.0 * lambda_reg, dfpp_df)
+        dfpp_dfp = np.where(mask_small_r, 0.0, dfpp_dfp)
+
+    jac = np.zeros((2, 2, len(f)))
+    jac[0, 1] = 1.0
+    jac[1, 0] = dfpp_df
+    jac[1, 1] = dfpp_dfp
+    return jac
+
+
+def _bvp_boundary_jacobian(ya: np.ndarray, yb: np.ndarray, params: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Analytic Jacobian of _bvp_boundary_conditions for solve_bvp (bc_jac).
+
+    Returns:
+        (dbc/dya, dbc/dyb), each of shape (2, 2)
+    """
+    dbc_dya = np.array([[0.0, 1.0], [0.0, 0.0]])
+    dbc_dyb = np.array([[0.0, 0.0], [1.0, 0.0]])
+    return dbc_dya, dbc_dyb
+
+
 def compute_profile_solve_bvp(
     q: float,
     params: 'Phase1AnsatzParams',
@@ -1011,19 +1623,11 @@ def compute_profile_solve_bvp(
 
     Status: [Dc] Profile computed by solving E-L equation as BVP.
     """
-    from scipy.integrate import solve_bvp
-
     if n_radial is None:
         n_radial = params.n_radial
     if r_max is None:
         r_max = params.r_max * params.ell0
 
-    # Parameters for ODE system
-    ode_params = {
-        'ell': params.ell,
-        'lambda_reg': 0.01,  # Same as in energy functional
-    }
-
     # Set up initial mesh
     r_grid = np.linspace(1e-10, r_max, n_radial)
 
@@ -1042,6 +1646,36 @@ def compute_profile_solve_bvp(
     # Initial guess array: shape (2, n_radial)
     y_init = np.vstack([f_init, fp_init])
 
+    f_out, r_out, info, _ = _solve_bvp_profile(q, params, r_grid, y_init, n_radial, r_max,
+                                               tol=tol, max_nodes=max_nodes)
+    return f_out, r_out, info
+
+
+def _solve_bvp_profile(
+    q: float,
+    params: 'Phase1AnsatzParams',
+    x_init: np.ndarray,
+    y_init: np.ndarray,
+    n_radial: int,
+    r_max: float,
+    tol: float = 1e-6,
+    max_nodes: int = 10000,
+    analytic_jacobian: bool = False
+) -> Tuple[np.ndarray, np.ndarray, dict, Any]:
+    """
+    [Dc] One solve_bvp call from mesh x_init / guess y_init (shared core).
+
+    Returns (f_out, r_out, info, sol); sol is None if the solver raised,
+    in which case f_out is the initial guess (fallback 'ansatz').
+    """
+    from scipy.integrate import solve_bvp
+
+    # Parameters for ODE system
+    ode_params = {
+        'ell': params.ell,
+        'lambda_reg': 0.01,  # Same as in energy functional
+    }
+
     # Solve BVP
     def ode_func(r, y):
         return _bvp_ode_system(r, y, ode_params)
@@ -1049,10 +1683,17 @@ def compute_profile_solve_bvp(
     def bc_func(ya, yb):
         return _bvp_boundary_conditions(ya, yb, ode_params)
 
+    jac_kwargs = {}
+    if analytic_jacobian:
+        jac_kwargs = {
+            'fun_jac': lambda r, y: _bvp_ode_jacobian(r, y, ode_params),
+            'bc_jac': lambda ya, yb: _bvp_boundary_jacobian(ya, yb, ode_params),
+        }
+
     try:
         with TimingContext('solve_bvp'):
-            sol = solve_bvp(ode_func, bc_func, r_grid, y_init,
-                           tol=tol, max_nodes=max_nodes, verbose=0)
+            sol = solve_bvp(ode_func, bc_func, x_init, y_init,
+                           tol=tol, max_nodes=max_nodes, verbose=0, **jac_kwargs)
 
         converged = sol.success
         message = sol.message if hasattr(sol, 'message') else ''
@@ -1066,7 +1707,7 @@ def compute_profile_solve_bvp(
 
         # Compute Euler-Lagrange residual norm for gate compatibility
         final_residual = _euler_lagrange_residual(f_out, r_out, q, params)
-        final_residual_norm = np.sqrt(np.sum(final_residual[1:-1] ** 2) / max(len(final_residual) - 2, 1))
+        final_residual_norm = _residual_norm(final_residual)
 
         niter = sol.niter if hasattr(sol, 'niter') else 0
         info = {
@@ -1082,10 +1723,10 @@ def compute_profile_solve_bvp(
         }
 
     except Exception as e:
-        # Fallback: return ansatz with failure flag
-        converged = False
-        f_out = f_init
-        r_out = r_grid
+        # Fallback: return initial guess with failure flag
+        sol = None
+        f_out = y_init[0]
+        r_out = x_init
         info = {
             'converged': False,
             'solver': 'bvp',
@@ -1095,7 +1736,98 @@ def compute_profile_solve_bvp(
             'iterations': 0,
         }
 
-    return f_out, r_out, info
+    return f_out, r_out, info, sol
+
+
+def compute_profiles_bvp_sweep(
+    q_values: np.ndarray,
+    params: 'Phase1AnsatzParams' = None,
+    tol: float = 1e-6,
+    max_nodes: int = 10000,
+    analytic_jacobian: bool = True,
+    continue_mesh: bool = True,
+    verbose: bool = False
+) -> Tuple[np.ndarray, np.ndarray, list]:
+    """
+    [Dc] Solve the profile BVP over a whole q grid by mesh continuation.
+
+    Walks q_values in the given order. Every point starts from its own
+    Gaussian ansatz, exactly like compute_profile_solve_bvp, so the sweep
+    stays on the same solution branch as the per-q cold solve. Only the
+    adapted mesh (sol.x) of the previous converged point is carried over
+    (continue_mesh), and solve_bvp is given the analytic Jacobians
+    _bvp_ode_jacobian / _bvp_boundary_jacobian.
+
+    The state is deliberately not warm-started from the neighbouring
+    solution: f ≡ 0 is stationary for every q, and each re-solve from a
+    converged profile drives it further towards it (max|f| fell from
+    ~1e-9 to ~1e-173 over 11 points), so warm-started profiles disagree
+    with the cold ones by orders of magnitude.
+
+    Without a warm start the sweep is no faster than per-q cold solves:
+    solve_bvp converges in one Newton iteration from the ansatz, and
+    81 points take ~0.3 s either way (the analytic Jacobian saves ~5%).
+    precompute_q_grid therefore fills the profile cache through
+    get_computed_profile; the sweep is kept for GATE 17b.
+
+    Parameters:
+        q_values: q grid to sweep (sorted grids give the best mesh reuse)
+        params: Ansatz parameters
+        tol: BVP solver tolerance
+        max_nodes: Maximum mesh nodes for adaptive refinement
+        analytic_jacobian: Supply fun_jac/bc_jac (default True)
+        continue_mesh: Start from the previous adapted mesh (default True);
+            with continue_mesh=False and analytic_jacobian=False every point
+            is computed exactly as compute_profile_solve_bvp
+        verbose: Print per-q convergence
+
+    Returns:
+        (f_profiles, r_grid, infos): profiles of shape (len(q_values), n_radial)
+        on the uniform output grid, and one info dict per q
+
+    Status: [Dc] Same BVP and same initial guess as compute_profile_solve_bvp;
+            continuation only changes the starting mesh.
+    """
+    if params is None:
+        params = DEFAULT_PHASE1_PARAMS
+
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+    n_radial = params.n_radial
+    r_max = params.r_max * params.ell0
+    r_grid = np.linspace(1e-10, r_max, n_radial)
+
+    f_profiles = np.zeros((len(q_values), n_radial))
+    infos = []
+    previous = None
+
+    with TimingContext('bvp_sweep'):
+        for i, q in enumerate(q_values):
+            # Same Gaussian ansatz guess as compute_profile_solve_bvp,
+            # on the previous adapted mesh when continuing the mesh
+            x_init = previous.x if (continue_mesh and previous is not None) else r_grid
+            width = params.ell0 * (1.0 + params.beta * q)
+            amplitude = params.A0 * q * (1.0 - q)
+            f_init = amplitude * np.exp(-x_init**2 / (2.0 * width**2))
+            fp_init = np.gradient(f_init, x_init)
+            fp_init[0] = 0.0  # Enforce f'(0)=0
+            y_init = np.vstack([f_init, fp_init])
+
+            f_out, _, info, sol = _solve_bvp_profile(
+                q, params, x_init, y_init, n_radial, r_max,
+                tol=tol, max_nodes=max_nodes, analytic_jacobian=analytic_jacobian)
+            info['mesh_continuation'] = x_init is not r_grid
+            info['continuation'] = True
+
+            f_profiles[i] = f_out
+            infos.append(info)
+            previous = sol if sol is not None and info['converged'] else None
+
+            if verbose:
+                print(f"  q={q:.4f}: converged={info['converged']} "
+                      f"iters={info['iterations']} nodes={info.get('n_nodes', 0)} "
+                      f"residual={info['final_residual_norm']:.2e}")
+
+    return f_profiles, r_grid, infos
 
 
 def get_computed_profile(
@@ -1113,70 +1845,108 @@ def get_computed_profile(
         q: Collective coordinate in [0, 1]
         params: Ansatz parameters
         use_cache: Whether to use cached profiles (default True)
-        solver: "bvp" or "relaxation" (default: PROFILE_SOLVER global)
+        solver: "bvp", "newton" or "relaxation" (default: PROFILE_SOLVER global)
 
     Returns:
         (f_grid, r_grid, info): Profile array, radial grid, convergence info
 
     Status: [Dc] Profile computed by solving E-L equation, not assumed.
     """
-    global _PROFILE_CACHE
-
     if params is None:
         params = DEFAULT_PHASE1_PARAMS
 
     if solver is None:
         solver = PROFILE_SOLVER
 
-    # Round q to avoid floating point key issues
-    q_key = round(q, 6)
-
-    # Cache key includes solver type
-    ram_cache_key = (q_key, params.n_radial, params.ell, params.ell0, params.A0, params.beta, solver)
-    if use_cache and ram_cache_key in _PROFILE_CACHE:
-        return _PROFILE_CACHE[ram_cache_key]
+    ram_cache_key = _profile_ram_key(q, params, solver)
+    if use_cache:
+        cached = _PROFILE_CACHE.get(ram_cache_key)
+        if cached is not None:
+            return cached
+
+    def from_disk(cached):
+        f_grid = cached['f_grid']
+        r_grid = cached['r_grid']
+        # Compute residual norm for gate compatibility (cached profiles are assumed good)
+        final_residual = _euler_lagrange_residual(f_grid, r_grid, q, params)
+        final_residual_norm = _residual_norm(final_residual)
+        info = {'converged': True, 'solver': solver, 'from_cache': True,
+                'final_residual_norm': final_residual_norm, 'iterations': 0,
+                'final_energy': _profile_energy_functional(f_grid, r_grid, q, params)}
+        _PROFILE_CACHE[ram_cache_key] = (f_grid, r_grid, info)
+        return f_grid, r_grid, info
 
     # Try disk cache
     if use_cache:
-        params_dict = {
-            'ell': params.ell, 'A0': params.A0, 'ell0': params.ell0,
-            'beta': params.beta, 'n_radial': params.n_radial,
-            'r_max': params.r_max, 'solver': solver,
-        }
-        disk_key = cache_key('profile_bvp' if solver == 'bvp' else 'profile_relax',
-                            params_dict, q=q)
+        disk_key = _profile_disk_key(q, params, solver)
         hit, cached = load_cache('profile', disk_key)
         if hit:
-            f_grid = cached['f_grid']
-            r_grid = cached['r_grid']
-            # Compute residual norm for gate compatibility (cached profiles are assumed good)
-            final_residual = _euler_lagrange_residual(f_grid, r_grid, q, params)
-            final_residual_norm = np.sqrt(np.sum(final_residual[1:-1] ** 2) / max(len(final_residual) - 2, 1))
-            info = {'converged': True, 'solver': solver, 'from_cache': True,
-                    'final_residual_norm': final_residual_norm, 'iterations': 0}
-            _PROFILE_CACHE[ram_cache_key] = (f_grid, r_grid, info)
-            return f_grid, r_grid, info
-
-    # Compute profile
-    with TimingContext(f'compute_profile_{solver}'):
-        if solver == 'bvp':
-            f_grid, r_grid, info = compute_profile_solve_bvp(q, params)
-        else:
-            f_grid, r_grid, info = _solve_profile_relaxation(q, params)
+            return from_disk(cached)
+
+    # Compute profile (waiting for, rather than duplicating, another process's solve)
+    with cache_inflight('profile', disk_key) if use_cache else nullcontext():
+        if use_cache and _cache_contains('profile', disk_key):
+            hit, cached = load_cache('profile', disk_key)
+            if hit:
+                return from_disk(cached)
+
+        with TimingContext(f'compute_profile_{solver}'):
+            if solver == 'bvp':
+                f_grid, r_grid, info = compute_profile_solve_bvp(q, params)
+            elif solver == 'newton':
+                f_grid, r_grid, info = _solve_profile_newton(q, params)
+            else:
+                f_grid, r_grid, info = _solve_profile_relaxation(q, params)
 
-    # Cache result (RAM)
-    if use_cache:
-        _PROFILE_CACHE[ram_cache_key] = (f_grid, r_grid, info)
-        # Cache to disk
-        save_cache('profile', disk_key, {'f_grid': f_grid, 'r_grid': r_grid})
+        # Cache result (RAM + disk)
+        if use_cache:
+            _store_computed_profile(q, params, solver, f_grid, r_grid, info)
 
     return f_grid, r_grid, info
 
 
+def _profile_ram_key(q: float, params: 'Phase1AnsatzParams', solver: str) -> tuple:
+    """RAM cache key for a computed profile (key includes solver type)."""
+    # Round q to avoid floating point key issues
+    q_key = round(q, 6)
+    return (q_key, params.n_radial, params.ell, params.ell0, params.A0, params.beta, solver)
+
+
+def _profile_disk_key(q: float, params: 'Phase1AnsatzParams', solver: str) -> str:
+    """Disk cache key for a computed profile (key includes solver type)."""
+    params_dict = {
+        'ell': params.ell, 'A0': params.A0, 'ell0': params.ell0,
+        'beta': params.beta, 'n_radial': params.n_radial,
+        'r_max': params.r_max, 'solver': solver,
+    }
+    return cache_key(_PROFILE_CACHE_KINDS.get(solver, 'profile_relax'), params_dict, q=q)
+
+
+def _store_computed_profile(
+    q: float,
+    params: 'Phase1AnsatzParams',
+    solver: str,
+    f_grid: np.ndarray,
+    r_grid: np.ndarray,
+    info: dict
+):
+    """Store a computed profile in the RAM and disk profile caches."""
+    _PROFILE_CACHE[_profile_ram_key(q, params, solver)] = (f_grid, r_grid, info)
+    save_cache('profile', _profile_disk_key(q, params, solver), {'f_grid': f_grid, 'r_grid': r_grid})
+
+
+def _mq_fd_stencil(q: float) -> tuple:
+    """q points whose profiles compute_Mq_from_5D_reduction reads (∂f/∂q stencil)."""
+    if q < _MQ_FD_STEP:
+        return (q, q + _MQ_FD_STEP)
+    if q > 1.0 - _MQ_FD_STEP:
+        return (q - _MQ_FD_STEP, q)
+    return (q - _MQ_FD_STEP, q, q + _MQ_FD_STEP)
+
+
 def clear_profile_cache():
     """Clear the computed profile cache."""
-    global _PROFILE_CACHE
-    _PROFILE_CACHE = {}
+    _PROFILE_CACHE.clear()
 
 
 # =============================================================================
@@ -1372,10 +2142,71 @@ def _warp_factor(y: float, params: Phase1AnsatzParams) -> float:
     return np.exp(-2.0 * abs(y) / params.ell)
 
 
+# Reduction-integral engine: "scalar" (per-point Python loop, reference) or
+# "array" (whole r grid per NumPy expression, ProfileInterpolant per q)
+REDUCTION_ENGINE = os.environ.get('REDUCTION_ENGINE', 'scalar')
+
+
+class ProfileInterpolant:
+    """
+    Array evaluator of f(r; q) and |∇f|^2 at one q, built once per q.
+
+    Mirrors _defect_profile / _grad_f_squared point for point: for a
+    computed profile [Dc] the grid is fetched once and evaluated with
+    clamped linear interpolation (f) and the same one-sided / central grid
+    differences (|∇f|^2); otherwise the Gaussian ansatz [H] is used.
+    """
+
+    def __init__(self, q: float, params: Phase1AnsatzParams, computed: bool = None):
+        if computed is None:
+            computed = USE_COMPUTED_PROFILE
+        self.q = q
+        self.params = params
+        self.computed = computed
+        if computed:
+            f_grid, r_grid, _ = get_computed_profile(q, params)
+            self.f_grid = np.asarray(f_grid, dtype=float)
+            self.r_grid = np.asarray(r_grid, dtype=float)
+        else:
+            self.width = params.ell0 * (1.0 + params.beta * q)
+            self.amplitude = params.A0 * q * (1.0 - q)
+
+    def f(self, r: np.ndarray) -> np.ndarray:
+        """f(r; q) on an array of radii."""
+        r = np.asarray(r, dtype=float)
+        if self.computed:
+            return np.interp(r, self.r_grid, self.f_grid)
+        return self.amplitude * np.exp(-r ** 2 / (2.0 * self.width ** 2))
+
+    def grad_f_squared(self, r: np.ndarray) -> np.ndarray:
+        """|∇f|^2 on an array of radii."""
+        r = np.asarray(r, dtype=float)
+        if not self.computed:
+            if self.width == 0:
+                return np.zeros_like(r)
+            return (r / self.width ** 2) ** 2 * self.f(r) ** 2
+
+        f_grid, r_grid = self.f_grid, self.r_grid
+        n = len(r_grid)
+        out = np.zeros_like(r)
+        if n < 2:
+            return out
+        dr = r_grid[1] - r_grid[0]
+
+        lo = r <= r_grid[0]
+        hi = ~lo & (r >= r_grid[-1])
+        mid = ~lo & ~hi
+        out[lo] = ((f_grid[1] - f_grid[0]) / dr) ** 2
+        idx = np.clip(np.searchsorted(r_grid, r[mid]), 1, n - 2)
+        out[mid] = ((f_grid[idx + 1] - f_grid[idx - 1]) / (2.0 * dr)) ** 2
+        return out
+
+
 def compute_Vq_from_5D_reduction(
     q: float,
     params: Phase1AnsatzParams = None,
-    n_radial: int = None
+    n_radial: int = None,
+    engine: str = None
 ) -> float:
     """
     [Dc] Compute V(q) from 5D reduction recipe under Phase-1 ansatz.
@@ -1390,6 +2221,7 @@ def compute_Vq_from_5D_reduction(
         q: Collective coordinate in [0, 1]
         params: Phase-1 ansatz parameters. Defaults to DEFAULT_PHASE1_PARAMS.
         n_radial: Override for radial discretization points
+        engine: "scalar" or "array" (default: REDUCTION_ENGINE global)
 
     Returns:
         V(q) in normalized units
@@ -1401,6 +2233,9 @@ def compute_Vq_from_5D_reduction(
         params = DEFAULT_PHASE1_PARAMS
     if n_radial is None:
         n_radial = params.n_radial
+    if (engine or REDUCTION_ENGINE) == 'array':
+        V, _ = compute_VM_from_5D_reduction_grid([q], params, n_radial, compute_M=False)
+        return float(V[0])
 
     # Set up radial grid
     r_max_physical = params.r_max * params.ell0
@@ -1425,10 +2260,15 @@ def compute_Vq_from_5D_reduction(
     return V
 
 
+# Step for the ∂f/∂q central difference in compute_Mq_from_5D_reduction
+_MQ_FD_STEP = 1e-6
+
+
 def compute_Mq_from_5D_reduction(
     q: float,
     params: Phase1AnsatzParams = None,
-    n_radial: int = None
+    n_radial: int = None,
+    engine: str = None
 ) -> float:
     """
     [Dc] Compute M(q) from 5D reduction recipe under Phase-1 ansatz.
@@ -1445,6 +2285,7 @@ def compute_Mq_from_5D_reduction(
         q: Collective coordinate in [0, 1]
         params: Phase-1 ansatz parameters. Defaults to DEFAULT_PHASE1_PARAMS.
         n_radial: Override for radial discretization points
+        engine: "scalar" or "array" (default: REDUCTION_ENGINE global)
 
     Returns:
         M(q) in normalized units
@@ -1456,6 +2297,9 @@ def compute_Mq_from_5D_reduction(
         params = DEFAULT_PHASE1_PARAMS
     if n_radial is None:
         n_radial = params.n_radial
+    if (engine or REDUCTION_ENGINE) == 'array':
+        _, M = compute_VM_from_5D_reduction_grid([q], params, n_radial, compute_V=False)
+        return float(M[0])
 
     # Set up radial grid
     r_max_physical = params.r_max * params.ell0
@@ -1463,7 +2307,7 @@ def compute_Mq_from_5D_reduction(
     dr = r_grid[1] - r_grid[0]
 
     # Compute ∂f/∂q numerically
-    dq = 1e-6
+    dq = _MQ_FD_STEP
     def df_dq(r, q_val):
         if q_val < dq:
             return (_defect_profile(r, q_val + dq, params) - _defect_profile(r, q_val, params)) / dq
@@ -1491,10 +2335,94 @@ def compute_Mq_from_5D_reduction(
     return M
 
 
+def compute_VM_from_5D_reduction_grid(
+    q_values: np.ndarray,
+    params: Phase1AnsatzParams = None,
+    n_radial: int = None,
+    compute_V: bool = True,
+    compute_M: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [Dc] Array evaluation of V(q) and M(q) over a whole q grid.
+
+    Same integrals as compute_Vq/Mq_from_5D_reduction (scalar reference),
+    evaluated as (K, n_radial) arrays: one ProfileInterpolant per distinct
+    q (including the ∂f/∂q stencil points q ± _MQ_FD_STEP), no per-point
+    profile lookups.
+
+    Parameters:
+        q_values: q grid (K values)
+        params: Phase-1 ansatz parameters. Defaults to DEFAULT_PHASE1_PARAMS.
+        n_radial: Override for radial discretization points
+        compute_V: Evaluate V(q) (else NaN)
+        compute_M: Evaluate M(q) (else NaN)
+
+    Returns:
+        (V, M): arrays of shape (K,)
+
+    Status: [Dc] Derived conditional on Phase-1 ansatz [P].
+    """
+    if params is None:
+        params = DEFAULT_PHASE1_PARAMS
+    if n_radial is None:
+        n_radial = params.n_radial
+
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+    K = len(q_values)
+
+    r_max_physical = params.r_max * params.ell0
+    r_grid = np.linspace(1e-10, r_max_physical, n_radial)
+    dr = r_grid[1] - r_grid[0]
+    r2 = r_grid ** 2
+
+    interpolants = {}
+
+    def profile(q_val):
+        if q_val not in interpolants:
+            interpolants[q_val] = ProfileInterpolant(q_val, params)
+        return interpolants[q_val]
+
+    f = np.array([profile(q).f(r_grid) for q in q_values]).reshape(K, n_radial)
+    W = np.exp(-2.0 * np.abs(f) / params.ell)
+
+    V = np.full(K, np.nan)
+    if compute_V:
+        grad_f_sq = np.array([profile(q).grad_f_squared(r_grid) for q in q_values]).reshape(K, n_radial)
+        metric_contrib = np.sqrt(1.0 + grad_f_sq) - 1.0
+        V = params.sigma * 4.0 * np.pi * np.sum(metric_contrib * W * r2 * dr, axis=1)
+
+    M = np.full(K, np.nan)
+    if compute_M:
+        dq = _MQ_FD_STEP
+        df_dq = np.empty((K, n_radial))
+        for k, q in enumerate(q_values):
+            if q < dq:
+                df_dq[k] = (profile(q + dq).f(r_grid) - f[k]) / dq
+            elif q > 1.0 - dq:
+                df_dq[k] = (f[k] - profile(q - dq).f(r_grid)) / dq
+            else:
+                df_dq[k] = (profile(q + dq).f(r_grid) - profile(q - dq).f(r_grid)) / (2.0 * dq)
+        M = 4.0 * np.pi * np.sum(df_dq ** 2 * W * r2 * dr, axis=1)
+        M = np.maximum(M, 1e-10)
+
+    return V, M
+
+
 # =============================================================================
 # PHASE-2: DIMENSIONLESS SHAPE FUNCTIONS (Vtilde, Mtilde)
 # =============================================================================
 
+def _vm_family_key(kind: str, params: Phase1AnsatzParams, n_rad: int) -> str:
+    """Grid-store family key for Vtilde/Mtilde (all inputs except q)."""
+    params_dict = {
+        'ell': params.ell, 'A0': params.A0, 'ell0': params.ell0,
+        'beta': params.beta, 'sigma': params.sigma,
+        'r_max': params.r_max, 'n_radial': n_rad,
+        'USE_COMPUTED_PROFILE': USE_COMPUTED_PROFILE
+    }
+    return cache_key(kind, params_dict)
+
+
 def compute_Vtilde_from_5D_reduction(
     q: float,
     params: Phase1AnsatzParams = None,
@@ -1528,18 +2456,12 @@ def compute_Vtilde_from_5D_reduction(
 
     n_rad = n_radial if n_radial is not None else params.n_radial
 
-    # Check cache
+    # Check cache (grid store, one family per parameter set)
     if use_cache:
-        params_dict = {
-            'ell': params.ell, 'A0': params.A0, 'ell0': params.ell0,
-            'beta': params.beta, 'sigma': params.sigma,
-            'r_max': params.r_max, 'n_radial': n_rad,
-            'USE_COMPUTED_PROFILE': USE_COMPUTED_PROFILE
-        }
-        key = cache_key('Vtilde', params_dict, q=q)
-        hit, cached = load_cache('Vtilde', key)
-        if hit:
-            return float(cached['value'])
+        family_key = _vm_family_key('Vtilde', params, n_rad)
+        cached, found = load_grid('Vtilde', family_key, [q])
+        if found[0]:
+            return float(cached[0])
 
     # Compute
     with TimingContext('compute_Vtilde_from_5D_reduction'):
@@ -1554,7 +2476,7 @@ def compute_Vtilde_from_5D_reduction(
 
     # Save to cache
     if use_cache:
-        save_cache('Vtilde', key, {'value': np.array(Vtilde)})
+        append_grid('Vtilde', family_key, [q], [Vtilde])
 
     return Vtilde
 
@@ -1592,18 +2514,12 @@ def compute_Mtilde_from_5D_reduction(
 
     n_rad = n_radial if n_radial is not None else params.n_radial
 
-    # Check cache
+    # Check cache (grid store, one family per parameter set)
     if use_cache:
-        params_dict = {
-            'ell': params.ell, 'A0': params.A0, 'ell0': params.ell0,
-            'beta': params.beta, 'sigma': params.sigma,
-            'r_max': params.r_max, 'n_radial': n_rad,
-            'USE_COMPUTED_PROFILE': USE_COMPUTED_PROFILE
-        }
-        key = cache_key('Mtilde', params_dict, q=q)
-        hit, cached = load_cache('Mtilde', key)
-        if hit:
-            return float(cached['value'])
+        family_key = _vm_family_key('Mtilde', params, n_rad)
+        cached, found = load_grid('Mtilde', family_key, [q])
+        if found[0]:
+            return float(cached[0])
 
     # Compute
     with TimingContext('compute_Mtilde_from_5D_reduction'):
@@ -1618,7 +2534,7 @@ def compute_Mtilde_from_5D_reduction(
 
     # Save to cache
     if use_cache:
-        save_cache('Mtilde', key, {'value': np.array(Mtilde)})
+        append_grid('Mtilde', family_key, [q], [Mtilde])
 
     return Mtilde
 
@@ -1655,18 +2571,79 @@ def get_Mtilde_normalization(params: Phase1AnsatzParams = None) -> float:
 # PRECOMPUTE PIPELINE: ONE PROFILE, ALL DERIVED
 # =============================================================================
 
+# Module switches a precompute worker process must share with its parent
+# (runtime overrides such as run_benchmark(force_computed_profile=True) are
+# not visible to a freshly imported or spawned module otherwise).
+_PRECOMPUTE_WORKER_STATE = (
+    'USE_COMPUTED_PROFILE', 'PROFILE_SOLVER', 'REDUCTION_ENGINE',
+    'USE_HISTORICAL_MODEL', 'USE_DERIVED_CLOSED_FORM', 'USE_PHASE2_PREFACTOR',
+    '_CACHE_DIR', '_CACHE_WAIT_TIMEOUT',
+)
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Worker count: None/1 -> serial, <= 0 -> all available cores."""
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return int(workers)
+
+
+def _precompute_worker_init(state: Dict[str, Any]):
+    """[Def] Process-pool initializer: mirror the parent's module switches."""
+    globals().update(state)
+
+
+def _precompute_chunk(
+    q_chunk: np.ndarray,
+    params: Phase1AnsatzParams,
+    n_radial: Optional[int],
+    want_V: np.ndarray,
+    want_M: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [Def] Worker task for precompute_q_grid: Vtilde/Mtilde on one q chunk.
+
+    Computed BVP profiles are cold solves that land in the shared disk
+    cache; the values are returned, not appended, so the parent stays
+    the only grid-store writer. Entries not requested are NaN.
+    """
+    V_vals = np.full(len(q_chunk), np.nan)
+    M_vals = np.full(len(q_chunk), np.nan)
+    for i, q in enumerate(q_chunk):
+        if want_V[i]:
+            V_vals[i] = compute_Vtilde_from_5D_reduction(q, params, n_radial, use_cache=False)
+        if want_M[i]:
+            M_vals[i] = compute_Mtilde_from_5D_reduction(q, params, n_radial, use_cache=False)
+    return V_vals, M_vals
+
+
 def precompute_q_grid(
     q_grid: np.ndarray,
     params: Phase1AnsatzParams = None,
     n_radial: int = None,
     compute_A0: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    workers: int = 1
 ) -> Dict[str, Any]:
     """
     Precompute Vtilde and Mtilde for entire q grid, populating cache.
 
     This function ensures expensive integrals are computed once and cached,
-    avoiding repeated computation during gate runs.
+    avoiding repeated computation during gate runs. Cached values come from
+    the grid store in one read per kind, and new values are appended in one
+    write per kind. Computed BVP profiles (USE_COMPUTED_PROFILE,
+    PROFILE_SOLVER='bvp') are solved on demand by get_computed_profile.
+
+    With workers > 1 the missing points are split into one chunk per
+    worker and computed in a process pool, so each worker pays the task
+    pickling and initializer cost once.
+    Results are collected in grid order and appended by this process
+    only, and every cached profile is computed exactly as a cold
+    get_computed_profile solve, so neither the stored grid nor the
+    profile cache depends on the worker count or on scheduling
+    (precompute_workers_consistency_gate).
 
     Parameters:
         q_grid: Array of q values to precompute
@@ -1674,6 +2651,7 @@ def precompute_q_grid(
         n_radial: Override for radial discretization
         compute_A0: Also precompute A0 (default False)
         verbose: Print progress
+        workers: Worker processes for missing points (1 = serial, 0 = all cores)
 
     Returns:
         Dictionary with:
@@ -1688,20 +2666,65 @@ def precompute_q_grid(
 
     q_grid = np.atleast_1d(q_grid)
     n_q = len(q_grid)
-
-    Vtilde_vals = np.zeros(n_q)
-    Mtilde_vals = np.zeros(n_q)
+    n_rad = n_radial if n_radial is not None else params.n_radial
 
     start_time = time.perf_counter()
 
     with TimingContext('precompute_q_grid'):
-        for i, q in enumerate(q_grid):
-            if verbose:
-                print(f"  Precomputing q={q:.3f} ({i+1}/{n_q})...")
-
-            # These will use cache if available, otherwise compute + cache
-            Vtilde_vals[i] = compute_Vtilde_from_5D_reduction(q, params, n_radial)
-            Mtilde_vals[i] = compute_Mtilde_from_5D_reduction(q, params, n_radial)
+        # One grid-store read per kind for the whole grid
+        V_key = _vm_family_key('Vtilde', params, n_rad)
+        M_key = _vm_family_key('Mtilde', params, n_rad)
+        Vtilde_vals, V_found = load_grid('Vtilde', V_key, q_grid)
+        Mtilde_vals, M_found = load_grid('Mtilde', M_key, q_grid)
+
+        if not (np.all(V_found) and np.all(M_found)):
+            # In-flight marker per family: a concurrent process filling the
+            # same grid is waited for, then only what is still missing is computed
+            with cache_inflight('VMgrid', V_key):
+                V_new, V_now = load_grid('Vtilde', V_key, q_grid, count_stats=False)
+                M_new, M_now = load_grid('Mtilde', M_key, q_grid, count_stats=False)
+                Vtilde_vals[V_now & ~V_found] = V_new[V_now & ~V_found]
+                Mtilde_vals[M_now & ~M_found] = M_new[M_now & ~M_found]
+                V_missing, M_missing = ~V_now, ~M_now
+                todo = np.flatnonzero(V_missing | M_missing)
+                n_workers = min(_resolve_workers(workers), len(todo))
+
+                if n_workers > 1:
+                    # One chunk per worker amortizes task start-up; map() returns
+                    # chunk results in submission order, so values land in grid order
+                    chunks = np.array_split(todo, n_workers)
+                    state = {name: globals()[name] for name in _PRECOMPUTE_WORKER_STATE}
+                    if verbose:
+                        print(f"  Precomputing {len(todo)} q points on {n_workers} workers...")
+                    with ProcessPoolExecutor(max_workers=n_workers,
+                                             initializer=_precompute_worker_init,
+                                             initargs=(state,)) as pool:
+                        results = pool.map(
+                            _precompute_chunk,
+                            [q_grid[idx] for idx in chunks],
+                            [params] * n_workers,
+                            [n_radial] * n_workers,
+                            [V_missing[idx] for idx in chunks],
+                            [M_missing[idx] for idx in chunks],
+                        )
+                        for idx, (V_chunk, M_chunk) in zip(chunks, results):
+                            Vtilde_vals[idx[V_missing[idx]]] = V_chunk[V_missing[idx]]
+                            Mtilde_vals[idx[M_missing[idx]]] = M_chunk[M_missing[idx]]
+
+                else:
+                    for i in todo:
+                        q = q_grid[i]
+                        if verbose:
+                            print(f"  Precomputing q={q:.3f} ({i+1}/{n_q})...")
+
+                        if V_missing[i]:
+                            Vtilde_vals[i] = compute_Vtilde_from_5D_reduction(q, params, n_radial, use_cache=False)
+                        if M_missing[i]:
+                            Mtilde_vals[i] = compute_Mtilde_from_5D_reduction(q, params, n_radial, use_cache=False)
+
+                # One append per kind for the newly computed points
+                append_grid('Vtilde', V_key, q_grid[V_missing], Vtilde_vals[V_missing])
+                append_grid('Mtilde', M_key, q_grid[M_missing], Mtilde_vals[M_missing])
 
         result = {
             'q': q_grid,
@@ -2290,6 +3313,62 @@ def reduction_integral_nontrivial_gate(
             return True, f"PASS: 5D integrals computed (shapes similar but numerically distinct). V_fine={V_fine:.4e}, V_hist={V_hist:.4e}"
 
 
+# =============================================================================
+# GATE 5b: REDUCTION ENGINE CONSISTENCY (array vs scalar)
+# =============================================================================
+
+def reduction_engine_consistency_gate(
+    q_test_values: list = None,
+    n_radial: int = 200,
+    rel_tolerance: float = 1e-9
+) -> Tuple[bool, str]:
+    """
+    Gate: Array reduction integrals match the scalar reference path.
+
+    Evaluates V(q), M(q) with engine='scalar' (per-point loop) and with
+    compute_VM_from_5D_reduction_grid (array, ProfileInterpolant per q),
+    for both the ansatz [H] and the computed [Dc] profile.
+
+    Parameters:
+        q_test_values: List of q values to test. Default: [0.0, 0.2, 0.5, 0.8, 1.0]
+        n_radial: Radial grid size for the comparison
+        rel_tolerance: Max relative difference (M uses a ∂f/∂q difference,
+            so cancellation limits agreement to ~1e-12)
+
+    Returns:
+        (passed, message): Boolean pass/fail and diagnostic message
+
+    Status: [Dc] Numerical-engine verification.
+    """
+    global USE_COMPUTED_PROFILE
+
+    if q_test_values is None:
+        q_test_values = [0.0, 0.2, 0.5, 0.8, 1.0]
+
+    params = Phase1AnsatzParams(n_radial=n_radial)
+    original_computed_profile = USE_COMPUTED_PROFILE
+    max_rel = {}
+    try:
+        for computed in (False, True):
+            USE_COMPUTED_PROFILE = computed
+            V_scalar = np.array([compute_Vq_from_5D_reduction(q, params, engine='scalar') for q in q_test_values])
+            M_scalar = np.array([compute_Mq_from_5D_reduction(q, params, engine='scalar') for q in q_test_values])
+            V_array, M_array = compute_VM_from_5D_reduction_grid(q_test_values, params)
+            label = 'computed' if computed else 'ansatz'
+            max_rel[label] = max(
+                np.max(np.abs(V_array - V_scalar) / np.maximum(np.abs(V_scalar), 1e-30)),
+                np.max(np.abs(M_array - M_scalar) / np.maximum(np.abs(M_scalar), 1e-30)),
+            )
+    finally:
+        USE_COMPUTED_PROFILE = original_computed_profile
+
+    worst = max(max_rel.values())
+    detail = ", ".join(f"{k}={v:.2e}" for k, v in max_rel.items())
+    if worst <= rel_tolerance:
+        return True, f"PASS: Array V/M match scalar path. max_rel_diff {detail} (tol {rel_tolerance:.0e})"
+    return False, f"FAIL: Array V/M differ from scalar path. max_rel_diff {detail} > {rel_tolerance:.0e}"
+
+
 # =============================================================================
 # GATE 6: HISTORICAL MODEL USAGE CHECK
 # =============================================================================
@@ -2675,6 +3754,86 @@ def profile_stationarity_gate(
         return False, f"FAIL: Profile stationarity issues - {'; '.join(issues)}"
 
 
+# =============================================================================
+# GATE 11b: ANALYTIC E-L GRADIENT CONSISTENCY (Phase-3)
+# =============================================================================
+
+def el_gradient_consistency_gate(
+    q_test_values: list = None,
+    n_radial: int = 60,
+    rel_tolerance: float = 1e-5
+) -> Tuple[bool, str]:
+    """
+    Gate: Analytic discrete E-L gradient matches the finite-difference one.
+
+    Compares _euler_lagrange_residual against _euler_lagrange_residual_fd
+    on the Gaussian ansatz and on a perturbed profile (all sign/branch
+    terms exercised), on a coarse grid to keep the O(n^2) reference cheap.
+    Also checks the array energy functional (single profile and stacked
+    over q) against the point-by-point _profile_energy_functional_loop,
+    and the banded Hessian (Newton solver) against differences of the
+    analytic gradient.
+
+    Parameters:
+        q_test_values: List of q values to test. Default: [0.2, 0.5, 0.8]
+        n_radial: Radial grid size for the comparison
+        rel_tolerance: Max |analytic - FD| / max|FD| (and energy rel. diff)
+
+    Returns:
+        (passed, message): Boolean pass/fail and diagnostic message
+
+    Status: [Dc] Phase-3 gradient verification.
+    """
+    if q_test_values is None:
+        q_test_values = [0.2, 0.5, 0.8]
+
+    params = Phase1AnsatzParams(n_radial=n_radial)
+    r_grid = np.linspace(1e-10, params.r_max * params.ell0, n_radial)
+    rng = np.random.default_rng(0)
+
+    max_rel = 0.0
+    profiles = []
+    for q in q_test_values:
+        width = params.ell0 * (1.0 + params.beta * q)
+        f_ansatz = params.A0 * q * (1.0 - q) * np.exp(-r_grid ** 2 / (2.0 * width ** 2))
+        f_perturbed = f_ansatz + 0.05 * rng.standard_normal(n_radial) * params.A0
+        for f in (f_ansatz, f_perturbed):
+            analytic = _euler_lagrange_residual(f, r_grid, q, params)
+            fd = _euler_lagrange_residual_fd(f, r_grid, q, params)
+            scale = max(np.max(np.abs(fd)), 1e-30)
+            max_rel = max(max_rel, np.max(np.abs(analytic - fd)) / scale)
+            profiles.append(f)
+
+    # Banded analytic Hessian vs central differences of the analytic gradient
+    hess_rel = 0.0
+    eps = 1e-6
+    for f in profiles[:2]:
+        diag, upper1, upper2 = _euler_lagrange_hessian_banded(f, r_grid, 0.0, params)
+        H = np.diag(diag) + np.diag(upper1, 1) + np.diag(upper1, -1) + np.diag(upper2, 2) + np.diag(upper2, -2)
+        H_fd = np.zeros_like(H)
+        for k in range(n_radial):
+            f_plus, f_minus = f.copy(), f.copy()
+            f_plus[k] += eps
+            f_minus[k] -= eps
+            H_fd[:, k] = (_euler_lagrange_residual(f_plus, r_grid, 0.0, params)
+                          - _euler_lagrange_residual(f_minus, r_grid, 0.0, params)) / (2.0 * eps)
+        scale = max(np.max(np.abs(H_fd[1:-1])), 1e-30)
+        hess_rel = max(hess_rel, np.max(np.abs(H[1:-1] - H_fd[1:-1])) / scale)
+
+    # Array energy (stacked over all test profiles) vs scalar loop
+    E_stack = _profile_energy_functional(np.stack(profiles), r_grid, 0.0, params)
+    E_loop = np.array([_profile_energy_functional_loop(f, r_grid, 0.0, params) for f in profiles])
+    energy_rel = float(np.max(np.abs(E_stack - E_loop) / np.maximum(np.abs(E_loop), 1e-30)))
+
+    if max_rel <= rel_tolerance and energy_rel <= rel_tolerance and hess_rel <= rel_tolerance:
+        return True, (f"PASS: Analytic E-L gradient matches FD. max_rel_diff={max_rel:.2e}, "
+                      f"hessian rel_diff={hess_rel:.2e}, "
+                      f"energy array/loop rel_diff={energy_rel:.2e} (tol {rel_tolerance:.0e})")
+    return False, (f"FAIL: Analytic E-L gradient / Hessian / array energy mismatch. max_rel_diff={max_rel:.2e}, "
+                   f"hessian rel_diff={hess_rel:.2e}, "
+                   f"energy rel_diff={energy_rel:.2e} (tol {rel_tolerance:.0e})")
+
+
 # =============================================================================
 # GATE 12: BOUNDARY CONDITIONS SANITY (Phase-3)
 # =============================================================================
@@ -3105,6 +4264,187 @@ def refinement_gate_bvp(
         return True, f"PASS [OPEN]: BVP converging. E_400->800_rel_change={final_change:.2%}. May need finer grid for full convergence."
 
 
+# =============================================================================
+# GATE 17b: BVP CONTINUATION SWEEP CONSISTENCY (Phase-3)
+# =============================================================================
+
+def bvp_sweep_consistency_gate(
+    q_values: list = None,
+    profile_tolerance: float = 1e-3,
+    energy_tolerance: float = 1e-3,
+    jacobian_tolerance: float = 1e-5
+) -> Tuple[bool, str]:
+    """
+    Gate: Continuation sweep agrees with cold per-q BVP solves.
+
+    Checks:
+    1. _bvp_ode_jacobian matches central differences of _bvp_ode_system
+    2. Every sweep profile converges
+    3. Sweep profiles match compute_profile_solve_bvp relative to the cold
+       profile's own scale, max|f_sweep - f_cold| / max|f_cold|, and the
+       energies agree relatively (the profiles are O(1e-9), so an absolute
+       or A0-scaled comparison could not detect a different branch)
+    4. The cold-settings sweep (analytic_jacobian=False,
+       continue_mesh=False) is bit-identical to the cold solves
+
+    Parameters:
+        q_values: q grid for the sweep. Default: 11 points in [0.05, 0.95]
+        profile_tolerance: Max |f_sweep - f_cold| / max|f_cold|
+        energy_tolerance: Max |E_sweep - E_cold| / |E_cold|
+        jacobian_tolerance: Max |J - J_fd| / (1 + |J_fd|)
+
+    Returns:
+        (passed, message): Boolean pass/fail and diagnostic message
+
+    Status: [Dc] Phase-3 BVP continuation verification.
+    """
+    if q_values is None:
+        q_values = np.linspace(0.05, 0.95, 11)
+
+    params = Phase1AnsatzParams(n_radial=200)  # Use smaller grid for speed
+
+    # 1. Analytic ODE Jacobian vs central differences
+    ode_params = {'ell': params.ell, 'lambda_reg': 0.01}
+    rng = np.random.default_rng(0)
+    r = np.linspace(1e-10, params.r_max * params.ell0, 50)
+    y = np.vstack([rng.normal(0.0, 0.3, r.size), rng.normal(0.0, 0.5, r.size)])
+    jac = _bvp_ode_jacobian(r, y, ode_params)
+    eps = 1e-7
+    jac_err = 0.0
+    for k in range(2):
+        y_plus, y_minus = y.copy(), y.copy()
+        y_plus[k] += eps
+        y_minus[k] -= eps
+        jac_fd = (_bvp_ode_system(r, y_plus, ode_params) - _bvp_ode_system(r, y_minus, ode_params)) / (2.0 * eps)
+        jac_err = max(jac_err, np.max(np.abs(jac[:, k] - jac_fd) / (1.0 + np.abs(jac_fd))))
+
+    # 2./3. Sweep vs cold solves
+    with TimingContext('bvp_sweep_consistency_test'):
+        f_sweep, r_grid, infos = compute_profiles_bvp_sweep(q_values, params)
+    f_exact, _, _ = compute_profiles_bvp_sweep(q_values, params, analytic_jacobian=False,
+                                               continue_mesh=False)
+    n_converged = sum(1 for info in infos if info.get('converged', False))
+    max_diff = 0.0
+    max_energy_diff = 0.0
+    n_identical = 0
+    for q, f_q, f_e, info in zip(q_values, f_sweep, f_exact, infos):
+        f_cold, _, info_cold = compute_profile_solve_bvp(q, params)
+        max_diff = max(max_diff, np.max(np.abs(f_q - f_cold)) / max(np.max(np.abs(f_cold)), 1e-300))
+        E_cold = info_cold.get('final_energy', float('nan'))
+        max_energy_diff = max(max_energy_diff,
+                              abs(info.get('final_energy', float('nan')) - E_cold) / max(abs(E_cold), 1e-300))
+        n_identical += int(np.array_equal(f_e, f_cold))
+
+    issues = []
+    if jac_err > jacobian_tolerance:
+        issues.append(f"ODE Jacobian rel_err={jac_err:.2e} > {jacobian_tolerance:.0e}")
+    if n_converged < len(q_values):
+        issues.append(f"only {n_converged}/{len(q_values)} sweep points converged")
+    if not max_diff <= profile_tolerance:
+        issues.append(f"sweep vs cold max|Δf|/max|f|={max_diff:.2e} > {profile_tolerance:.0e}")
+    if not max_energy_diff <= energy_tolerance:
+        issues.append(f"sweep vs cold energy rel_diff={max_energy_diff:.2e} > {energy_tolerance:.0e}")
+    if n_identical < len(q_values):
+        issues.append(f"cold-settings sweep bit-identical at only {n_identical}/{len(q_values)} points")
+
+    if not issues:
+        return True, (f"PASS: BVP sweep consistent. {n_converged}/{len(q_values)} converged, "
+                      f"max|Δf|/max|f|={max_diff:.2e}, energy rel_diff={max_energy_diff:.2e}, "
+                      f"cold-settings sweep identical {n_identical}/{len(q_values)}, "
+                      f"jac_rel_err={jac_err:.2e}")
+    return False, f"FAIL: BVP sweep issues - {'; '.join(issues)}"
+
+
+# =============================================================================
+# GATE 17c: PRECOMPUTE WORKER-COUNT INDEPENDENCE (Phase-3)
+# =============================================================================
+
+def precompute_workers_consistency_gate(
+    q_values: list = None,
+    worker_counts: tuple = (1, 3),
+    n_radial: int = 200
+) -> Tuple[bool, str]:
+    """
+    Gate: Cached profiles and Vtilde/Mtilde do not depend on the worker count.
+
+    Runs precompute_q_grid with computed BVP profiles once per worker
+    count, each into a fresh temporary cache directory, then reads back
+    from disk every cached profile (grid points and ∂f/∂q stencil points)
+    and compares them bitwise across worker counts, together with the
+    Vtilde/Mtilde grids and a cold get_computed_profile solve.
+
+    Parameters:
+        q_values: q grid. Default: 12 points in [0.01, 0.99]
+        worker_counts: Worker counts to compare (first is the reference)
+        n_radial: Radial grid size
+
+    Returns:
+        (passed, message): Boolean pass/fail and diagnostic message
+
+    Status: [Dc] Phase-3 caching determinism verification.
+    """
+    global USE_COMPUTED_PROFILE, _CACHE_DIR
+
+    if q_values is None:
+        q_values = np.linspace(0.01, 0.99, 12)
+
+    params = Phase1AnsatzParams(n_radial=n_radial)
+    q_values = np.atleast_1d(np.asarray(q_values, dtype=float))
+    q_profiles = sorted({q_s for q in q_values for q_s in _mq_fd_stencil(float(q))})
+
+    original_computed_profile = USE_COMPUTED_PROFILE
+    original_cache_dir = _CACHE_DIR
+    runs = []
+    tmp_dirs = []
+    try:
+        USE_COMPUTED_PROFILE = True
+        for workers in worker_counts:
+            _CACHE_DIR = tempfile.mkdtemp(prefix='neutron_workers_gate_')
+            tmp_dirs.append(_CACHE_DIR)
+            # RAM keys do not include the cache directory: start each run empty
+            _RAM_CACHE.clear()
+            clear_profile_cache()
+            data = precompute_q_grid(q_values, params, workers=workers)
+            _RAM_CACHE.clear()
+            profiles = []
+            for q_s in q_profiles:
+                hit, cached = load_cache('profile', _profile_disk_key(q_s, params, 'bvp'))
+                profiles.append(cached['f_grid'] if hit else None)
+            runs.append((workers, data['Vtilde'], data['Mtilde'], profiles))
+    finally:
+        USE_COMPUTED_PROFILE = original_computed_profile
+        _CACHE_DIR = original_cache_dir
+        _RAM_CACHE.clear()
+        clear_profile_cache()
+        for path in tmp_dirs:
+            shutil.rmtree(path, ignore_errors=True)
+
+    issues = []
+    ref_workers, V_ref, M_ref, prof_ref = runs[0]
+    n_missing = sum(1 for f in prof_ref if f is None)
+    if n_missing:
+        issues.append(f"{n_missing}/{len(q_profiles)} profiles not cached (workers={ref_workers})")
+    for workers, V_vals, M_vals, profiles in runs[1:]:
+        if not (np.array_equal(V_vals, V_ref) and np.array_equal(M_vals, M_ref)):
+            issues.append(f"Vtilde/Mtilde differ (workers={workers} vs {ref_workers})")
+        n_diff = sum(1 for f, f_ref in zip(profiles, prof_ref)
+                     if f is None or f_ref is None or not np.array_equal(f, f_ref))
+        if n_diff:
+            issues.append(f"{n_diff}/{len(q_profiles)} cached profiles differ (workers={workers} vs {ref_workers})")
+
+    # Cached profiles are the cold-solve profiles
+    q_mid = q_profiles[len(q_profiles) // 2]
+    f_cold, _, _ = compute_profile_solve_bvp(q_mid, params)
+    f_cached = prof_ref[len(q_profiles) // 2]
+    if f_cached is None or not np.array_equal(f_cached, f_cold):
+        issues.append(f"cached profile at q={q_mid:.4f} differs from the cold solve")
+
+    if not issues:
+        return True, (f"PASS: Precompute independent of worker count {list(worker_counts)}. "
+                      f"{len(q_profiles)} cached profiles and {len(q_values)} Vtilde/Mtilde values identical")
+    return False, f"FAIL: Precompute depends on worker count - {'; '.join(issues)}"
+
+
 # =============================================================================
 # WKB DECAY RATE CALCULATION
 # =============================================================================
@@ -3147,6 +4487,184 @@ def wkb_tunneling_rate(
     return gamma
 
 
+# =============================================================================
+# GATE SCHEDULER: SHARED ARTIFACTS, PARALLEL RUNS, RESULT CACHE
+# =============================================================================
+# Gates declare the shared artifacts they read (V/M grids entering A0 and the
+# B integral, computed profiles). run_gate_schedule builds every artifact
+# needed by a pending gate once, in this process, so the gates find it in
+# the grid store / profile cache. The gates are independent of each other
+# and then run concurrently in worker processes (each gate may toggle module
+# switches, which stay local to its process). With use_result_cache (CLI:
+# --gate-cache) results are cached under a hash of the gate inputs, including
+# the sources of the imported common/ modules, and unchanged gates are
+# replayed instead of run; replayed results are flagged in the summary.
+
+def _artifact_vm_grid(n_radial: int, n_q: int = None, workers: int = 1):
+    """V/M grid over linspace(0.01, 0.99, n_q) at default params with n_radial."""
+    params = Phase1AnsatzParams(n_radial=n_radial)
+    q_grid = np.linspace(0.01, 0.99, n_q if n_q is not None else n_radial)
+    precompute_q_grid(q_grid, params, workers=workers)
+
+
+def _build_vm_grid(workers: int = 1):
+    # B-integral grid of compute_A0_5D_transverse / p_stability at default n_radial
+    _artifact_vm_grid(Phase1AnsatzParams().n_radial, workers=workers)
+
+
+def _build_vm_grid_pm20(workers: int = 1):
+    # Same grid at the -20% / +20% resolutions of the stability gates
+    n_default = Phase1AnsatzParams().n_radial
+    for n in (int(n_default * 0.8), int(n_default * 1.2)):
+        _artifact_vm_grid(n, workers=workers)
+
+
+def _build_vm_normalization(workers: int = 1):
+    # get_Vtilde_normalization / get_Mtilde_normalization samples
+    _artifact_vm_grid(Phase1AnsatzParams().n_radial, n_q=50, workers=workers)
+
+
+def _build_bc_profiles(workers: int = 1):
+    # Profiles read (cached) by bc_sanity_gate
+    for q in (0.2, 0.5, 0.8):
+        get_computed_profile(q, DEFAULT_PHASE1_PARAMS)
+
+
+# Artifact name -> builder(workers)
+_GATE_ARTIFACTS = {
+    'VM_grid': _build_vm_grid,
+    'VM_grid_pm20': _build_vm_grid_pm20,
+    'VM_normalization': _build_vm_normalization,
+    'bc_profiles': _build_bc_profiles,
+}
+
+# Per-gate wall times of the last run_all_gates / run_core_gates_fast call
+_GATE_TIMINGS: Dict[str, Dict[str, Any]] = {}
+
+
+def get_gate_timings() -> Dict[str, Dict[str, Any]]:
+    """Per-gate wall time (s) and cache status of the last gate run."""
+    return {name: dict(t) for name, t in _GATE_TIMINGS.items()}
+
+
+# Imported common/ modules whose code the gates execute
+_GATE_SOURCE_MODULES = ('bounded_cache', 'full5d_reduction')
+
+_GATE_SOURCE_HASH = None
+
+
+def _gate_source_hash() -> str:
+    """
+    SHA256 of this module's source and of the imported common/ modules
+    (_GATE_SOURCE_MODULES); any code change invalidates cached gate results.
+    """
+    global _GATE_SOURCE_HASH
+    if _GATE_SOURCE_HASH is None:
+        paths = [os.path.abspath(__file__)]
+        for name in _GATE_SOURCE_MODULES:
+            module = sys.modules.get(name)
+            if module is not None and getattr(module, '__file__', None):
+                paths.append(os.path.abspath(module.__file__))
+        hasher = hashlib.sha256()
+        for path in paths:
+            with open(path, 'rb') as fh:
+                hasher.update(os.path.basename(path).encode('utf-8'))
+                hasher.update(hashlib.sha256(fh.read()).digest())
+        _GATE_SOURCE_HASH = hasher.hexdigest()[:16]
+    return _GATE_SOURCE_HASH
+
+
+def gate_input_key(name: str) -> str:
+    """
+    Cache key of a gate result: gate name, module and common/ sources,
+    model/solver switches, default Phase-1 parameters and numpy/scipy versions.
+    """
+    import scipy
+    state = {n: globals()[n] for n in _PRECOMPUTE_WORKER_STATE if not n.startswith('_')}
+    return cache_key('gate', {
+        'gate': name,
+        'source': _gate_source_hash(),
+        'state': state,
+        'defaults': asdict(DEFAULT_PHASE1_PARAMS),
+        'versions': (np.__version__, scipy.__version__),
+    })
+
+
+def _run_gate_timed(gate_func: Callable[[], Tuple[bool, str]]) -> Tuple[bool, str, float]:
+    """Run one gate; returns (passed, message, wall time in s)."""
+    start = time.perf_counter()
+    passed, message = gate_func()
+    return passed, message, time.perf_counter() - start
+
+
+def run_gate_schedule(
+    gates: list,
+    workers: int = 1,
+    use_result_cache: bool = False,
+    verbose: bool = False
+):
+    """
+    Run (name, gate_func, needs) gate specs; yield results in declaration order.
+
+    1. Gates whose input hash (gate_input_key) has a cached result are not run.
+    2. The artifacts in `needs` of the remaining gates are built once, here.
+    3. The remaining gates run serially (workers=1) or in a process pool.
+
+    Parameters:
+        gates: List of (name, gate_func, needs) with needs a tuple of
+            _GATE_ARTIFACTS names
+        workers: Worker processes (1 = serial in this process, 0 = all cores);
+            also used for the artifact precomputation
+        use_result_cache: Reuse / store gate results in the disk cache
+            (default False: every gate is executed)
+        verbose: Print artifact build times
+
+    Yields:
+        (name, passed, message, wall_time, cached)
+    """
+    cached_results = {}
+    pending = []
+    for name, gate_func, needs in gates:
+        if use_result_cache:
+            hit, data = load_cache('gate', gate_input_key(name))
+            if hit:
+                cached_results[name] = (bool(data['passed']), str(data['message']))
+                continue
+        pending.append((name, gate_func, needs))
+
+    # Shared artifacts, each built once (sorted for a deterministic order)
+    for artifact in sorted({a for _, _, needs in pending for a in needs}):
+        with TimingContext(f'artifact:{artifact}') as t:
+            _GATE_ARTIFACTS[artifact](workers=workers)
+        if verbose:
+            print(f"[ARTIFACT] {artifact} ready ({t.elapsed:.2f}s)")
+
+    n_workers = min(_resolve_workers(workers), len(pending))
+    state = {name: globals()[name] for name in _PRECOMPUTE_WORKER_STATE}
+    pool_context = (ProcessPoolExecutor(max_workers=n_workers,
+                                        initializer=_precompute_worker_init,
+                                        initargs=(state,))
+                    if n_workers > 1 else nullcontext())
+    with pool_context as pool:
+        futures = {}
+        if pool is not None:
+            futures = {name: pool.submit(_run_gate_timed, gate_func) for name, gate_func, _ in pending}
+
+        for name, gate_func, _ in gates:
+            if name in cached_results:
+                passed, message = cached_results[name]
+                yield name, passed, message, 0.0, True
+                continue
+            if pool is not None:
+                passed, message, wall = futures[name].result()
+            else:
+                passed, message, wall = _run_gate_timed(gate_func)
+            if use_result_cache:
+                save_cache('gate', gate_input_key(name),
+                           {'passed': np.bool_(passed), 'message': np.str_(message)})
+            yield name, passed, message, wall, False
+
+
 # =============================================================================
 # MASTER GATE RUNNER
 # =============================================================================
@@ -3155,10 +4673,17 @@ def run_all_gates(verbose: bool = True, include_5d_gates: bool = True,
                   include_phase2_gates: bool = True,
                   include_phase3_gates: bool = True,
                   include_bvp_gates: bool = False,
-                  include_full5d_gates: bool = False) -> Dict[str, Tuple[Union[bool, GateResult], str]]:
+                  include_full5d_gates: bool = False,
+                  workers: int = 1,
+                  use_result_cache: bool = False) -> Dict[str, Tuple[Union[bool, GateResult], str]]:
     """
     Run all verification gates and return results.
 
+    Gates are executed by run_gate_schedule: shared artifacts are built
+    once and gates run concurrently with workers > 1. With use_result_cache,
+    results cached for the same inputs are replayed instead of executed
+    (flagged in the summary). Per-gate wall times: get_gate_timings().
+
     Parameters:
         verbose: Print detailed output
         include_5d_gates: Include 5D-reduction-specific gates (default True)
@@ -3166,51 +4691,59 @@ def run_all_gates(verbose: bool = True, include_5d_gates: bool = True,
         include_phase3_gates: Include Phase-3 profile/KK gates (default True)
         include_bvp_gates: Include BVP solver gates (default False, requires BVP solver)
         include_full5d_gates: Include Full-5D gates 18-20 (default False, Phase-4)
+        workers: Worker processes for the Phase-1/2/3 gates (1 = serial, 0 = all cores)
+        use_result_cache: Replay gates whose cached result matches their inputs
+            (default False)
 
     Returns:
         Dictionary mapping gate names to (passed/GateResult, message) tuples
     """
     results = {}
 
+    # (name, gate, shared artifacts it reads; see _GATE_ARTIFACTS)
     # Core gates (always run)
     gates = [
-        ("Vq_positive_gate", Vq_positive_gate),
-        ("Mq_positive_gate", Mq_positive_gate),
-        ("grid_refinement_gate_VM", grid_refinement_gate_VM),
-        ("reparam_invariance_gate", reparam_invariance_gate),
+        ("Vq_positive_gate", Vq_positive_gate, ()),
+        ("Mq_positive_gate", Mq_positive_gate, ()),
+        ("grid_refinement_gate_VM", grid_refinement_gate_VM, ()),
+        ("reparam_invariance_gate", reparam_invariance_gate, ()),
     ]
 
     # 5D-reduction-specific gates (Phase-1)
     if include_5d_gates:
         gates.extend([
-            ("reduction_integral_nontrivial_gate", reduction_integral_nontrivial_gate),
-            ("historical_model_usage_gate", historical_model_usage_gate),
-            ("vm_shape_sanity_gate", vm_shape_sanity_gate),
+            ("reduction_integral_nontrivial_gate", reduction_integral_nontrivial_gate, ()),
+            ("reduction_engine_consistency_gate", reduction_engine_consistency_gate, ()),
+            ("historical_model_usage_gate", historical_model_usage_gate, ()),
+            ("vm_shape_sanity_gate", vm_shape_sanity_gate, ()),
         ])
 
     # Phase-2 gates: dimensional consistency and prefactor
     if include_phase2_gates:
         gates.extend([
-            ("dimensional_consistency_gate", dimensional_consistency_gate),
-            ("A0_5D_finiteness_gate", A0_5D_finiteness_gate),
-            ("p_stability_under_prefactor_gate", p_stability_under_prefactor_gate),
+            ("dimensional_consistency_gate", dimensional_consistency_gate, ('VM_normalization',)),
+            ("A0_5D_finiteness_gate", A0_5D_finiteness_gate, ('VM_grid', 'VM_grid_pm20')),
+            ("p_stability_under_prefactor_gate", p_stability_under_prefactor_gate, ('VM_grid', 'VM_grid_pm20')),
         ])
 
     # Phase-3 gates: computed profile and KK convergence
     if include_phase3_gates:
         gates.extend([
-            ("profile_stationarity_gate", profile_stationarity_gate),
-            ("bc_sanity_gate", bc_sanity_gate),
-            ("profile_robustness_gate", profile_robustness_gate),
-            ("KK_truncation_convergence_gate", KK_truncation_convergence_gate),
+            ("profile_stationarity_gate", profile_stationarity_gate, ()),
+            ("el_gradient_consistency_gate", el_gradient_consistency_gate, ()),
+            ("bc_sanity_gate", bc_sanity_gate, ('bc_profiles',)),
+            ("profile_robustness_gate", profile_robustness_gate, ()),
+            ("KK_truncation_convergence_gate", KK_truncation_convergence_gate, ('VM_grid',)),
         ])
 
     # BVP solver gates (Phase-3 BVP)
     if include_bvp_gates:
         gates.extend([
-            ("bvp_convergence_gate", bvp_convergence_gate),
-            ("bvp_vs_relaxation_consistency_gate", bvp_vs_relaxation_consistency_gate),
-            ("refinement_gate_bvp", refinement_gate_bvp),
+            ("bvp_convergence_gate", bvp_convergence_gate, ()),
+            ("bvp_vs_relaxation_consistency_gate", bvp_vs_relaxation_consistency_gate, ()),
+            ("refinement_gate_bvp", refinement_gate_bvp, ()),
+            ("bvp_sweep_consistency_gate", bvp_sweep_consistency_gate, ()),
+            ("precompute_workers_consistency_gate", precompute_workers_consistency_gate, ()),
         ])
 
     # Tri-state counters
@@ -3218,9 +4751,12 @@ def run_all_gates(verbose: bool = True, include_5d_gates: bool = True,
     n_fail = 0
     n_skip = 0
 
-    for name, gate_func in gates:
-        passed, message = gate_func()
+    _GATE_TIMINGS.clear()
+    schedule_start = time.perf_counter()
+    for name, passed, message, wall, cached in run_gate_schedule(
+            gates, workers=workers, use_result_cache=use_result_cache, verbose=verbose):
         results[name] = (passed, message)
+        _GATE_TIMINGS[name] = {'wall': wall, 'cached': cached}
 
         # Count results (Phase-1/2/3 gates return bool)
         if passed:
@@ -3230,9 +4766,11 @@ def run_all_gates(verbose: bool = True, include_5d_gates: bool = True,
 
         if verbose:
             status = "PASS" if passed else "FAIL"
-            print(f"[{status}] {name}")
+            timing = "cached, not executed" if cached else f"{wall:.2f}s"
+            print(f"[{status}] {name} ({timing})")
             print(f"        {message}")
             print()
+    schedule_wall = time.perf_counter() - schedule_start
 
     # Full-5D gates (Phase-4) — tri-state results
     if include_full5d_gates and FULL5D_AVAILABLE:
@@ -3263,10 +4801,17 @@ def run_all_gates(verbose: bool = True, include_5d_gates: bool = True,
             print(f"GATE SUMMARY: PASS={n_pass} FAIL={n_fail} SKIP[OPEN]={n_skip}")
         else:
             print(f"GATE SUMMARY: PASS={n_pass} FAIL={n_fail}")
+        n_cached = sum(1 for t in _GATE_TIMINGS.values() if t['cached'])
+        gate_cpu = sum(t['wall'] for t in _GATE_TIMINGS.values())
+        print(f"GATE TIME: {schedule_wall:.2f}s wall ({gate_cpu:.2f}s summed over gates, "
+              f"{n_cached} cached, workers={_resolve_workers(workers)})")
         if n_fail == 0:
             print("ALL EXECUTABLE GATES PASSED")
         else:
             print("SOME GATES FAILED")
+        if n_cached:
+            print(f"NOTE: {n_cached} gate result(s) replayed from the result cache, "
+                  f"not executed (omit --gate-cache to run every gate)")
         print("=" * 60)
 
     return results
@@ -3316,17 +4861,21 @@ def generate_comparison_table() -> str:
 
 def run_core_gates_fast(
     q_grid: np.ndarray = None,
-    verbose: bool = True
+    verbose: bool = True,
+    workers: int = 1
 ) -> Dict[str, Tuple[bool, str]]:
     """
     Run core Phase-1/2 gates with precomputed Vtilde/Mtilde.
 
     This is a fast version that precomputes all needed values once,
-    avoiding repeated expensive integral computations.
+    avoiding repeated expensive integral computations. The precomputed grid
+    is the only shared artifact; the gates below only read it, so only the
+    precomputation is parallelized. Per-gate wall times: get_gate_timings().
 
     Parameters:
         q_grid: q values to precompute. Default: 9 points for smoke test
         verbose: Print detailed output
+        workers: Worker processes for the grid precomputation (1 = serial, 0 = all cores)
 
     Returns:
         Dictionary mapping gate names to (passed, message) tuples
@@ -3337,7 +4886,7 @@ def run_core_gates_fast(
     # Precompute all Vtilde/Mtilde values
     if verbose:
         print("Precomputing Vtilde/Mtilde grid...")
-    precomputed = precompute_q_grid(q_grid, verbose=verbose)
+    precomputed = precompute_q_grid(q_grid, verbose=verbose, workers=workers)
 
     if verbose:
         print(f"Precomputation done in {precomputed['timing']:.2f}s")
@@ -3345,6 +4894,14 @@ def run_core_gates_fast(
 
     # Run core gates (they'll hit cache now)
     results = {}
+    _GATE_TIMINGS.clear()
+    gate_start = time.perf_counter()
+
+    def record(name):
+        nonlocal gate_start
+        now = time.perf_counter()
+        _GATE_TIMINGS[name] = {'wall': now - gate_start, 'cached': False}
+        gate_start = now
 
     # Gate 1: V(q) positivity
     if verbose:
@@ -3356,6 +4913,7 @@ def run_core_gates_fast(
         results['Vq_positive_gate'] = (True, f"PASS: V(q) > 0 for all {len(q_grid)} samples. Min V = {V_min:.6e}")
     else:
         results['Vq_positive_gate'] = (False, f"FAIL: V(q) <= 0 at {n_negative} points. Min V = {V_min:.6e}")
+    record('Vq_positive_gate')
 
     # Gate 2: M(q) positivity
     if verbose:
@@ -3367,6 +4925,7 @@ def run_core_gates_fast(
         results['Mq_positive_gate'] = (True, f"PASS: M(q) > 0 for all {len(q_grid)} samples. Min M = {M_min:.6e}")
     else:
         results['Mq_positive_gate'] = (False, f"FAIL: M(q) <= 0 at {n_negative_M} points. Min M = {M_min:.6e}")
+    record('Mq_positive_gate')
 
     # Gate 3: Shape sanity (using precomputed values)
     if verbose:
@@ -3386,11 +4945,13 @@ def run_core_gates_fast(
         results['vm_shape_sanity_gate'] = (True, f"PASS: Shape OK. V(0)/V_max={boundary_ratio_0:.2e}, M_min={M_min:.2e}")
     else:
         results['vm_shape_sanity_gate'] = (False, f"FAIL: Shape issues")
+    record('vm_shape_sanity_gate')
 
     # Gate 4: Historical model usage
     if verbose:
         print("Running historical_model_usage_gate...")
     results['historical_model_usage_gate'] = historical_model_usage_gate()
+    record('historical_model_usage_gate')
 
     # Print results
     if verbose:
@@ -3401,7 +4962,7 @@ def run_core_gates_fast(
         all_passed = True
         for name, (passed, message) in results.items():
             status = "PASS" if passed else "FAIL"
-            print(f"[{status}] {name}")
+            print(f"[{status}] {name} ({_GATE_TIMINGS[name]['wall'] * 1e3:.2f}ms)")
             print(f"        {message}")
             all_passed = all_passed and passed
         print("=" * 60)
@@ -3468,6 +5029,8 @@ def smoke_test():
     print("CACHE SUMMARY:")
     print("=" * 60)
     print(f"CACHE: hits={stats['hits']} misses={stats['misses']} hit_rate={stats['hit_rate']:.1%}")
+    print(_RAM_CACHE.report())
+    print(_PROFILE_CACHE.report())
     print()
 
     # Final summary
@@ -3489,7 +5052,8 @@ def run_benchmark(
     force_computed_profile: bool = False,
     force_phase2_prefactor: bool = False,
     print_cache_keys: bool = False,
-    run_gates: bool = True
+    run_gates: bool = True,
+    workers: int = 1
 ) -> Dict[str, Any]:
     """
     Run COLD/WARM benchmark to verify cache speedup.
@@ -3503,6 +5067,7 @@ def run_benchmark(
         force_phase2_prefactor: Use Phase-2 prefactor routing
         print_cache_keys: Print first few cache keys for debugging
         run_gates: Run gates after precomputation
+        workers: Worker processes for precompute_q_grid (1 = serial, 0 = all cores)
 
     Returns:
         Benchmark results dictionary
@@ -3539,6 +5104,8 @@ def run_benchmark(
     print(f"  USE_COMPUTED_PROFILE: {USE_COMPUTED_PROFILE}")
     print(f"  USE_PHASE2_PREFACTOR: {USE_PHASE2_PREFACTOR}")
     print(f"  PROFILE_SOLVER: {PROFILE_SOLVER}")
+    print(f"  REDUCTION_ENGINE: {REDUCTION_ENGINE}")
+    print(f"  workers: {_resolve_workers(workers)}")
     print(f"  Cache dir: {_CACHE_DIR}")
     print()
 
@@ -3551,6 +5118,8 @@ def run_benchmark(
             'USE_COMPUTED_PROFILE': USE_COMPUTED_PROFILE,
             'USE_PHASE2_PREFACTOR': USE_PHASE2_PREFACTOR,
             'PROFILE_SOLVER': PROFILE_SOLVER,
+            'REDUCTION_ENGINE': REDUCTION_ENGINE,
+            'workers': _resolve_workers(workers),
         },
         'cold': {},
         'warm': {},
@@ -3571,21 +5140,17 @@ def run_benchmark(
     # Print cache keys for debugging
     if print_cache_keys:
         print("\nCache key samples:")
+        key = _vm_family_key('Vtilde', params, n_radial)
+        print(f"  Vtilde grid family key: {key} -> {_grid_path('Vtilde', key)}")
         for i, q in enumerate(q_grid[:3]):
-            params_dict = {
-                'ell': params.ell, 'A0': params.A0, 'ell0': params.ell0,
-                'beta': params.beta, 'sigma': params.sigma,
-                'r_max': params.r_max, 'n_radial': n_radial,
-                'USE_COMPUTED_PROFILE': USE_COMPUTED_PROFILE
-            }
-            key = cache_key('Vtilde', params_dict, q=q)
-            print(f"  q={q:.3f} -> Vtilde key: {key}")
+            print(f"  q={q:.3f} -> q index key: {_grid_q_key(q)}")
         print()
 
     cold_start = time.perf_counter()
 
     # Precompute
-    precomputed = precompute_q_grid(q_grid, params, compute_A0=compute_a0, verbose=False)
+    precomputed = precompute_q_grid(q_grid, params, compute_A0=compute_a0, verbose=False,
+                                   workers=workers)
 
     cold_precompute_time = time.perf_counter() - cold_start
 
@@ -3594,7 +5159,7 @@ def run_benchmark(
     gate_results = {}
     if run_gates:
         gates_start = time.perf_counter()
-        gate_results = run_core_gates_fast(q_grid, verbose=False)
+        gate_results = run_core_gates_fast(q_grid, verbose=False, workers=workers)
         cold_gates_time = time.perf_counter() - gates_start
 
     cold_total = time.perf_counter() - cold_start
@@ -3639,7 +5204,8 @@ def run_benchmark(
     warm_start = time.perf_counter()
 
     # Precompute (should hit cache)
-    precomputed_warm = precompute_q_grid(q_grid, params, compute_A0=compute_a0, verbose=False)
+    precomputed_warm = precompute_q_grid(q_grid, params, compute_A0=compute_a0, verbose=False,
+                                        workers=workers)
 
     warm_precompute_time = time.perf_counter() - warm_start
 
@@ -3647,7 +5213,7 @@ def run_benchmark(
     warm_gates_time = 0.0
     if run_gates:
         gates_start = time.perf_counter()
-        gate_results_warm = run_core_gates_fast(q_grid, verbose=False)
+        gate_results_warm = run_core_gates_fast(q_grid, verbose=False, workers=workers)
         warm_gates_time = time.perf_counter() - gates_start
 
     warm_total = time.perf_counter() - warm_start
@@ -3766,12 +5332,22 @@ Examples:
   # BVP solver smoke test (<60s target)
   python neutron_wkb_sensitivity.py --smoke --solver bvp --force-computed-profile
 
+  # Newton (banded Hessian) profile solver smoke test
+  python neutron_wkb_sensitivity.py --smoke --solver newton --force-computed-profile
+
   # BVP benchmark
   python neutron_wkb_sensitivity.py --benchmark --solver bvp --force-computed-profile --n-radial 400 --q-points 5
 
+  # Cold precompute on 4 worker processes (0 = all cores)
+  python neutron_wkb_sensitivity.py --benchmark --force-computed-profile --q-points 41 --workers 4
+
   # Run BVP gates
   python neutron_wkb_sensitivity.py --bvp-gates --solver bvp
 
+  # All gates on 4 processes; --gate-cache replays gates whose inputs are unchanged
+  python neutron_wkb_sensitivity.py --bvp-gates --workers 4
+  python neutron_wkb_sensitivity.py --bvp-gates --workers 4 --gate-cache
+
   # Run Full-5D gates (Phase-4, [OPEN])
   python neutron_wkb_sensitivity.py --full5d-gates
 
@@ -3805,6 +5381,10 @@ Examples:
                         help='Maximum q value (default: 1.0)')
     parser.add_argument('--compute-a0', action='store_true',
                         help='Include A0_5D_transverse/GY computation')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for q-grid precomputation and gate runs (default: 1, 0 = all cores)')
+    parser.add_argument('--gate-cache', action='store_true',
+                        help='Replay gate results cached for unchanged inputs instead of re-running them')
 
     # Force expensive paths
     parser.add_argument('--force-computed-profile', action='store_true',
@@ -3818,13 +5398,19 @@ Examples:
     parser.add_argument('--no-gates', action='store_true',
                         help='Skip gate runs in benchmark (only measure precomputation)')
     parser.add_argument('--bvp-gates', action='store_true',
-                        help='Include BVP solver verification gates (Gates 15-17)')
+                        help='Include BVP solver verification gates (Gates 15-17c)')
     parser.add_argument('--full5d-gates', action='store_true',
                         help='Include Full-5D reduction gates 18-20 (Phase-4, [OPEN])')
 
     # Solver selection
-    parser.add_argument('--solver', type=str, choices=['bvp', 'relaxation'], default=None,
-                        help='Profile solver: bvp (fast) or relaxation (slow). Default: env PROFILE_SOLVER or bvp')
+    parser.add_argument('--solver', type=str, choices=['bvp', 'newton', 'relaxation'], default=None,
+                        help='Profile solver: bvp (fast), newton (banded Newton) or relaxation (slow). '
+                             'Default: env PROFILE_SOLVER or bvp')
+
+    # Reduction-integral engine
+    parser.add_argument('--reduction-engine', type=str, choices=['scalar', 'array'], default=None,
+                        help='V(q)/M(q) reduction integrals: scalar (reference loop) or array (vectorized). '
+                             'Default: env REDUCTION_ENGINE or scalar')
 
     args = parser.parse_args()
 
@@ -3833,6 +5419,11 @@ Examples:
         PROFILE_SOLVER = args.solver
         print(f"PROFILE_SOLVER set to: {PROFILE_SOLVER}")
 
+    # Handle --reduction-engine flag (set global)
+    if args.reduction_engine:
+        REDUCTION_ENGINE = args.reduction_engine
+        print(f"REDUCTION_ENGINE set to: {REDUCTION_ENGINE}")
+
     # Handle --profile flag
     if args.profile:
         PROFILE_TIMING = True
@@ -3856,6 +5447,7 @@ Examples:
             force_phase2_prefactor=args.force_phase2_prefactor,
             print_cache_keys=args.print_cache_keys,
             run_gates=not args.no_gates,
+            workers=args.workers,
         )
     elif args.smoke:
         smoke_test()
@@ -3877,7 +5469,9 @@ Examples:
         include_full5d = args.full5d_gates
         results = run_all_gates(verbose=True, include_phase3_gates=include_phase3,
                                include_bvp_gates=include_bvp,
-                               include_full5d_gates=include_full5d)
+                               include_full5d_gates=include_full5d,
+                               workers=args.workers,
+                               use_result_cache=args.gate_cache)
 
         # Print comparison table
         print()